@@ -0,0 +1,157 @@
+# !/usr/bin/env python3
+
+"""
+Created by: Mohamad Tanbari
+Created on: October 2026
+The clip and animator classes for the Tomogotchi game.
+"""
+
+
+class Clip:
+    """
+    An animation as a table of frames, each a duration and the tile for every sprite.
+    """
+
+    def __init__(self, frames: tuple, loop: bool = True):
+        """
+        The constructor for the clip class.
+
+        Args:
+            frames (tuple): (duration, tiles) pairs, the duration in steps and the
+                tiles in the same order as the sprites they go on.
+            loop (bool): Start again after the last frame instead of stopping on it.
+        """
+
+        self.durations = tuple(duration for duration, _ in frames)
+        self.tiles = tuple(tuple(tiles) for _, tiles in frames)
+        self.length = len(frames)
+        self.loop = loop
+
+        # The (sprite, tile) pairs that differ from the frame before, worked out once
+        # so moving to the next frame only touches the tiles that change
+        self.changes = tuple(
+            tuple(
+                (index, tile)
+                for index, tile in enumerate(self.tiles[frame])
+                if tile != self.tiles[frame - 1][index]
+            )
+            for frame in range(self.length)
+        )
+
+
+class Animator:
+    """
+    Play clips on a list of sprites, only setting the tiles that change.
+    """
+
+    def __init__(self, sprites: list, tiles: list):
+        """
+        The constructor for the animator class.
+
+        Args:
+            sprites (list): The stage sprites to animate.
+            tiles (list): The tile each sprite shows now.
+        """
+
+        self._sprites = sprites
+
+        # The tile each sprite shows
+        self.tiles = list(tiles)
+
+        self.clip = None
+        self.frame = 0
+
+        # Steps the current frame has been showing for
+        self.elapsed = 0
+
+    # Method to show tiles straight away
+    def set_tiles(self, tiles) -> bool:
+        """
+        Show tiles on the sprites, skipping any sprite that already shows its tile.
+
+        Args:
+            tiles: The tile for each sprite.
+
+        Returns:
+            bool: Whether any tile changed.
+        """
+
+        changed = False
+        current = self.tiles
+        sprites = self._sprites
+        for index in range(len(current)):
+            tile = tiles[index]
+            if current[index] != tile:
+                current[index] = tile
+                sprites[index].set_frame(tile)
+                changed = True
+        return changed
+
+    # Method to start a clip
+    def play(self, clip: Clip, frame: int = 0, elapsed: int = 0) -> bool:
+        """
+        Start a clip, or carry on one from a given point.
+
+        Args:
+            clip (Clip): The clip to play.
+            frame (int): The frame to start on.
+            elapsed (int): The steps that frame has already been showing for.
+
+        Returns:
+            bool: Whether any tile changed.
+        """
+
+        # An animator without sprites, such as one whose bank failed to load,
+        # never plays
+        if not self._sprites:
+            return False
+
+        self.clip = clip
+        self.frame = frame
+        self.elapsed = elapsed
+        return self.set_tiles(clip.tiles[frame])
+
+    # Method to stop the clip
+    def stop(self):
+        """
+        Stop the clip, leaving its current frame showing.
+        """
+        self.clip = None
+
+    # Method to move the clip on
+    def step(self) -> bool:
+        """
+        Move the clip on by one step. Call once per logic step while it should play.
+
+        Returns:
+            bool: Whether any tile changed.
+        """
+
+        clip = self.clip
+        if clip is None:
+            return False
+
+        self.elapsed += 1
+        if self.elapsed < clip.durations[self.frame]:
+            return False
+
+        frame = self.frame + 1
+        if frame == clip.length:
+            if not clip.loop:
+                self.clip = None
+                return False
+            frame = 0
+        self.frame = frame
+        self.elapsed = 0
+
+        changes = clip.changes[frame]
+        if not changes:
+            return False
+
+        # Whatever showed before was the previous frame, so only the changes are set
+        tiles = self.tiles
+        sprites = self._sprites
+        for index, tile in changes:
+            tiles[index] = tile
+            sprites[index].set_frame(tile)
+        return True
@@ -0,0 +1,144 @@
+# !/usr/bin/env python3
+
+"""
+Created by: Mohamad Tanbari
+Created on: October 2026
+The bank registry class for the Tomogotchi game.
+"""
+
+import stage
+
+try:
+    import mmap
+except ImportError:
+    mmap = None
+
+# Packed banks start with the magic and version, then the palette and the tiles
+PACKED_EXTENSION = ".tbk"
+PACKED_MAGIC = b"TBNK"
+PACKED_VERSION = 1
+PACKED_HEADER = PACKED_MAGIC + bytes((PACKED_VERSION, 0, 0, 0))
+PALETTE_SIZE = 32
+TILES_SIZE = 2048
+
+
+def packed_path(path: str) -> str:
+    """
+    Get the path of the packed bank compiled from a BMP.
+
+    Args:
+        path (str): The path to the BMP file.
+
+    Returns:
+        str: The path to the packed bank.
+    """
+    if path.endswith(".bmp"):
+        path = path[:-4]
+    return path + PACKED_EXTENSION
+
+
+def load_bank(path: str):
+    """
+    Load a bank, from its packed file when one was compiled, otherwise from the BMP.
+
+    Args:
+        path (str): The path to the BMP file.
+
+    Returns:
+        stage.Bank: The loaded bank.
+    """
+
+    try:
+        file = open(packed_path(path), "rb")
+    except OSError:
+        return stage.Bank.from_bmp16(path)
+
+    with file:
+        header = file.read(len(PACKED_HEADER))
+        if header != PACKED_HEADER:
+            raise ValueError("Not a packed bank: " + packed_path(path))
+
+        # On a computer the file is mapped instead of copied
+        if mmap is not None:
+            data = memoryview(mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ))
+            start = len(PACKED_HEADER)
+            palette = data[start : start + PALETTE_SIZE]
+            buffer = data[start + PALETTE_SIZE : start + PALETTE_SIZE + TILES_SIZE]
+            return stage.Bank(buffer, palette)
+
+        # The bytes are already in the layout stage uses, so read them straight in
+        palette = bytearray(PALETTE_SIZE)
+        buffer = bytearray(TILES_SIZE)
+        file.readinto(palette)
+        file.readinto(buffer)
+
+    return stage.Bank(buffer, palette)
+
+
+class Bank_Registry:
+    """
+    Share decoded image banks between everything that uses the same BMP.
+    """
+
+    def __init__(self):
+        """
+        The constructor for the bank registry class.
+        """
+
+        self._banks = {}
+        self._counts = {}
+
+    # Method to get a bank
+    def get(self, path: str):
+        """
+        Get the bank for a BMP, loading it only the first time it is asked for.
+
+        Args:
+            path (str): The path to the BMP file.
+
+        Returns:
+            stage.Bank: The decoded bank.
+        """
+
+        bank = self._banks.get(path)
+        if bank is None:
+            bank = load_bank(path)
+            self._banks[path] = bank
+            self._counts[path] = 0
+
+        self._counts[path] += 1
+        return bank
+
+    # Method to give a bank back
+    def release(self, path: str):
+        """
+        Give back a bank, it is dropped once nothing is using it.
+
+        Args:
+            path (str): The path to the BMP file.
+        """
+
+        count = self._counts.get(path, 0) - 1
+        if count > 0:
+            self._counts[path] = count
+        elif path in self._banks:
+            del self._banks[path]
+            del self._counts[path]
+
+    # Method to check how many users a bank has
+    def count(self, path: str) -> int:
+        """
+        Get how many users a bank has.
+
+        Args:
+            path (str): The path to the BMP file.
+
+        Returns:
+            int: The number of users, 0 if the bank is not loaded.
+        """
+
+        return self._counts.get(path, 0)
+
+
+# Registry shared by every scene
+banks = Bank_Registry()
@@ -6,13 +6,8 @@ Created on: December 2024
 The button class for the Tomogotchi game.
 """
 
-# import constants
-from .. import constants
-import stage
-import supervisor
-import ugame
-
 # import classes
+from Tomogotchi.classes.animation import Clip
 from Tomogotchi.classes.meta_sprite import Meta_Sprite
 
 
@@ -54,6 +49,10 @@ class Button(Meta_Sprite):
         self._tiles = [(self._style * 4), (self._style * 4 + 1)]
         self._disabled_tiles = [(self._tiles[0] + 2), (self._tiles[1] + 2)]
 
+        # The pressed and released looks, each a single frame
+        self._pressed_clip = Clip(((1, self._disabled_tiles),))
+        self._released_clip = Clip(((1, self._tiles),))
+
         # Create the button
         super().__init__(x, y, 2, 1, self._bmp_path, self._tiles)
 
@@ -68,8 +67,7 @@ class Button(Meta_Sprite):
             sprite.update()
 
         # update the sprite to the pressed button
-        self._tile_list[0].set_frame(self._disabled_tiles[0])
-        self._tile_list[1].set_frame(self._disabled_tiles[1])
+        self.play(self._pressed_clip)
 
     # Method to release the button
     def release(self):
@@ -82,5 +80,4 @@ class Button(Meta_Sprite):
             sprite.update()
 
         # update the sprite to the released button
-        self._tile_list[0].set_frame(self._tiles[0])
-        self._tile_list[1].set_frame(self._tiles[1])
+        self.play(self._released_clip)
@@ -9,15 +9,21 @@ The cat class for the Tomogotchi game.
 # import constants
 from .. import constants
 import stage
-import supervisor
-import ugame
 import random
-import json
 import time
-import math
 
 # import classes
+from Tomogotchi.classes.animation import Animator, Clip
+from Tomogotchi.classes.bank_registry import banks
 from Tomogotchi.classes.meta_sprite import Meta_Sprite
+from Tomogotchi.classes.render_list import Render_Item
+from Tomogotchi.classes.stat_store import Stat_Store
+from Tomogotchi.classes.time_lapse import (
+    WALK_ANIMATION_FRAMES,
+    Pet_State,
+    Time_Lapse,
+    decay_stats,
+)
 
 DEBUG_MODE = False
 
@@ -27,11 +33,8 @@ class Cat:
     The cat class.
     """
 
-    # Path to the left facing cat image
-    BMP_PATH_LEFT = "./Tomogotchi/assets/left_cat.bmp"
-
-    # Path to the right facing cat image
-    BMP_PATH_RIGHT = "./Tomogotchi/assets/right_cat.bmp"
+    # Path to the cat image, facing left. Facing right mirrors the same tiles
+    BMP_PATH = "./Tomogotchi/assets/left_cat.bmp"
 
     # List of tiles to use for frame 1 of the cat
     TILES = [0, 1, 2, 3, 4, 5]
@@ -45,6 +48,25 @@ class Cat:
     # List of tiles to use for frame 2 of the cat flipped
     TILES_ALT_FLIPPED = [8, 7, 6, 11, 10, 9]
 
+    # Walk cycles, frame 1 is the standing frame. The flipped cycle is shown with
+    # every tile mirrored, so the columns are swapped as well
+    WALK_CLIP = Clip(
+        ((WALK_ANIMATION_FRAMES, TILES_ALT), (WALK_ANIMATION_FRAMES, TILES))
+    )
+    WALK_CLIP_FLIPPED = Clip(
+        (
+            (WALK_ANIMATION_FRAMES, TILES_ALT_FLIPPED),
+            (WALK_ANIMATION_FRAMES, TILES_FLIPPED),
+        )
+    )
+
+    # Emotes, one tile each
+    EMOTE_CLIPS = tuple(Clip(((1, (12 + emote,)),)) for emote in range(4))
+
+    # The size of the cat in pixels
+    WIDTH = 48
+    HEIGHT = 32
+
     # The farthest the cat can go left
     LEFT_BOUNDARY = 16
 
@@ -71,70 +93,56 @@ class Cat:
         # Other properties
         self._facing = "left"
         self._walk_speed = 1
-        self._frame_counter = 0
-        self._tracked_frame = 0
         self._emote_duration = 1
         self._walk_distance = 0
         self._direction = 1  # 1 for right, -1 for left
         self._tile_list = []
 
+        # Load the stats into memory, reads never touch the save file again
+        self._stats = Stat_Store(read_only=DEBUG_MODE)
+
         # Calculate new stats
         # hunger decreases at a rate of 20 every 24 hours
         # Joy decreases at a rate of 20 every 4 hours
+        # (see the decay constants in constants.py)
 
         if not DEBUG_MODE:
-            # Load json file
-            with open("Tomogotchi/data.json", "r") as file:
-                data = json.load(file)
-
-                # Calculate the time since the last update
-                last_checked = data["last_checked"]
+            # Calculate the time since the last update
+            last_checked = self._stats.last_checked
 
-                if last_checked is None:
-                    last_checked = time.time()
+            if last_checked is None:
+                last_checked = time.time()
 
-                time_since_last_checked = time.time() - last_checked
+            # A fast forward may have decayed past now already
+            time_since_last_checked = max(0, time.time() - last_checked)
 
-                # Update the hunger
-                data["hunger"] -= math.floor(time_since_last_checked / 86400 * 20)
-                # Update the joy
-                data["joy"] -= math.floor(time_since_last_checked / 14400 * 20)
+            # Update the hunger and joy
+            hunger, joy = decay_stats(
+                self._stats.hunger, self._stats.joy, time_since_last_checked
+            )
 
-                if data["hunger"] < 0:
-                    data["hunger"] = 0
-                if data["joy"] < 0:
-                    data["joy"] = 0
+            self._stats.hunger = hunger
+            self._stats.joy = joy
 
-                # Save the new last checked time
-                data["last_checked"] = time.time()
+            # Save the new last checked time
+            self._stats.last_checked = time.time()
 
-            # Save json file
-            with open("Tomogotchi/data.json", "w") as file:
-                json.dump(data, file)
+            # Save the decayed stats right away
+            self._stats.flush()
 
-        # Create the cat
-        self.left_side_cat = Meta_Sprite(x, y, 3, 2, Cat.BMP_PATH_LEFT, Cat.TILES)
-        self.right_side_cat = Meta_Sprite(
-            x, y, 3, 2, Cat.BMP_PATH_RIGHT, Cat.TILES_FLIPPED
-        )
+        # Create the cat, facing right mirrors the same sprites
+        self.cat_sprite = Meta_Sprite(x, y, 3, 2, Cat.BMP_PATH, Cat.TILES)
 
-        self.right_side_cat.move_off_screen()
+        # Start on the standing frame of the walk cycle
+        self.cat_sprite.play(Cat.WALK_CLIP, 1)
 
         # Create the emote sprite
-        emote_bmp_left = stage.Bank.from_bmp16(Cat.BMP_PATH_LEFT)
-        emote_bmp_right = stage.Bank.from_bmp16(Cat.BMP_PATH_RIGHT)
-
-        self._emote_left = stage.Sprite(emote_bmp_left, 12, 255, 255)
-        self._emote_right = stage.Sprite(emote_bmp_right, 12, 255, 255)
+        emote_bmp = banks.get(Cat.BMP_PATH)
+        self._emote = stage.Sprite(emote_bmp, 12, 255, 255)
+        self._emote_item = Render_Item(self._emote)
+        self._emote_animator = Animator([self._emote], [12])
 
-        # Track the emote sprite
-        self._emote = self._emote_left
-
-        self._tile_list = (
-            [self._emote_left, self._emote_right]
-            + self.left_side_cat._tile_list
-            + self.right_side_cat._tile_list
-        )
+        self._tile_list = [self._emote] + self.cat_sprite._tile_list
 
     # Getter for x position
     @property
@@ -156,17 +164,7 @@ class Cat:
         Args:
             value (int): The new x position of the metasprite.
         """
-        self._x = value
-
-        # Update the x position of all follower sprites
-        if self._facing == "left":
-            self.left_side_cat.x = self._x
-            if self._emote_duration > 0:
-                self._emote.move(self._x - 16, self._emote.y)
-        elif self._facing == "right":
-            self.right_side_cat.x = self._x
-            if self._emote_duration > 0:
-                self._emote.move(self._x + 48, self._emote.y)
+        self.set_position(value, self._y)
 
     # Getter for y position
     @property
@@ -188,18 +186,37 @@ class Cat:
         Args:
             value (int): The new y position of the metasprite.
         """
-        self._y = value
+        self.set_position(self._x, value)
 
-        # Update the y position of all follower sprites
-        if self._facing == "left":
-            self.left_side_cat.y = self._y
-        elif self._facing == "right":
-            self.right_side_cat.y = self._y
+    # Method to move the cat
+    def set_position(self, x: int, y: int):
+        """
+        Move the cat and its emote in one pass.
 
+        Args:
+            x (int): The new x position of the cat.
+            y (int): The new y position of the cat.
+        """
+        self._x = x
+        self._y = y
+
+        # Update the position of all follower sprites
+        self.cat_sprite.set_position(x, y)
         if self._emote_duration > 0:
-            self._emote.move(self._emote.x, self._y - 16)
+            self._move_emote()
+
+    # Method to move the cat by an amount
+    def move_by(self, dx: int, dy: int):
+        """
+        Move the cat relative to where it is.
+
+        Args:
+            dx (int): The distance to move on the x axis.
+            dy (int): The distance to move on the y axis.
+        """
+        self.set_position(self._x + dx, self._y + dy)
 
-        # getter for the joy stat
+    # getter for the joy stat
 
     @property
     def joy(self) -> int:
@@ -210,11 +227,7 @@ class Cat:
             int: The joy level of the cat.
         """
 
-        # Load json file
-        with open("Tomogotchi/data.json", "r") as file:
-            data = json.load(file)
-
-        return data["joy"]
+        return self._stats.joy
 
     # Setter for the joy stat
     @joy.setter
@@ -228,18 +241,10 @@ class Cat:
 
         if not DEBUG_MODE:
             if value > 0 and value < 100:
-                # Load json file
-                with open("Tomogotchi/data.json", "r") as file:
-                    data = json.load(file)
-
-                data["joy"] = value
-
-                # Save json file
-                with open("Tomogotchi/data.json", "w") as file:
-                    json.dump(data, file)
+                self._stats.joy = value
 
     @property
-    # Setter for the hunger stat
+    # Getter for the hunger stat
     def hunger(self) -> int:
         """
         Get the hunger level of the cat.
@@ -248,11 +253,7 @@ class Cat:
             int: The hunger level of the cat.
         """
 
-        # Load json file
-        with open("Tomogotchi/data.json", "r") as file:
-            data = json.load(file)
-
-        return data["hunger"]
+        return self._stats.hunger
 
     @hunger.setter
     # Setter for the hunger stat
@@ -266,48 +267,111 @@ class Cat:
 
         if not DEBUG_MODE:
             if value > 0 and value < 100:
-                # Load json file
-                with open("Tomogotchi/data.json", "r") as file:
-                    data = json.load(file)
+                self._stats.hunger = value
+
+    # Getter for whether the cat is still
+    @property
+    def idle(self) -> bool:
+        """
+        Check if the cat is standing still with no emote showing.
+
+        Returns:
+            bool: Whether the cat is idle.
+        """
+
+        return self._walk_distance == 0 and self._emote_duration == 0
+
+    # Method to save the stats
+    def flush(self):
+        """
+        Write any unsaved stats to flash.
+        """
+
+        self._stats.flush()
+
+    # Method to record what changed the stats
+    def log_event(self, event: int):
+        """
+        Add the stats to the stat log along with what changed them.
+
+        Args:
+            event (int): One of the events in stat_log.
+        """
+
+        self._stats.log(event)
+
+    # Method to read the stat history
+    def history(self, hours: float) -> list:
+        """
+        Get how the stats changed over the last few hours.
+
+        Args:
+            hours (float): How many hours back to go.
+
+        Returns:
+            list: (time, event, hunger, joy) tuples, oldest first.
+        """
+
+        return self._stats.history(hours)
 
-                data["hunger"] = value
+    # Method to start a replay from recorded stats
+    def replay_stats(self, hunger: int, joy: int):
+        """
+        Use the stats a recording started with, without writing them to flash.
+
+        Args:
+            hunger (int): The recorded hunger level.
+            joy (int): The recorded joy level.
+        """
+
+        self._stats.read_only = True
+        self._stats.hunger = hunger
+        self._stats.joy = joy
+
+    # Method to give back the image banks
+    def release_banks(self):
+        """
+        Give the cat's image banks back to the bank registry.
+        """
+
+        self.cat_sprite.release_banks()
+        banks.release(Cat.BMP_PATH)
+
+    # Method to add the cat to a render list
+    def add_to(self, render_list):
+        """
+        Let a render list draw the cat and its emote.
+
+        Args:
+            render_list (Render_List): The render list of the scene.
+        """
 
-                # Save json file
-                with open("Tomogotchi/data.json", "w") as file:
-                    json.dump(data, file)
+        render_list.add(self._emote_item)
+        render_list.add(self.cat_sprite)
 
     def flip(self):
         """
         Flip the cat to face the opposite direction.
         """
 
-        # Flip the cat
+        # Mirror the tiles and carry on the walk cycle from the same point
+        animator = self.cat_sprite.animator
         if self._facing == "left":
             self._facing = "right"
-            self.right_side_cat.x = self.left_side_cat.x
-            self.right_side_cat.y = self.left_side_cat.y
-
-            # Flip the emote if it is showing
-            if self._emote_duration > 0:
-                # Change the sprite being used
-                self._emote.move(255, 255)
-                self._emote = self._emote_right
-                self._emote.move(self._x + 48, self._y - 16)
-
-            self.left_side_cat.move_off_screen()
+            rotation = constants.MIRROR_ROTATION
+            clip = Cat.WALK_CLIP_FLIPPED
         else:
             self._facing = "left"
-            self.left_side_cat.x = self.right_side_cat.x
-            self.left_side_cat.y = self.right_side_cat.y
+            rotation = 0
+            clip = Cat.WALK_CLIP
 
-            # Flip the emote if it is showing
-            if self._emote_duration > 0:
-                # Change the sprite being used
-                self._emote.move(255, 255)
-                self._emote = self._emote_left
-                self._emote.move(self._x - 16, self._y - 16)
+        self.cat_sprite.set_rotation(rotation)
+        self.cat_sprite.play(clip, animator.frame, animator.elapsed)
 
-            self.right_side_cat.move_off_screen()
+        # Flip the emote, and move it to the other side if it is showing
+        self._emote.set_frame(rotation=rotation)
+        if self._emote_duration > 0:
+            self._move_emote()
 
     def emote(self, emote: int, duration: int, prioritize: bool = False):
         """
@@ -319,29 +383,118 @@ class Cat:
         """
 
         if self._emote_duration == 0 or prioritize:
-            # Set the emote sprite
-            if self._facing == "left":
-                self._emote = self._emote_left
-                self._emote.move(self.x - 16, self._y - 16)
-            elif self._facing == "right":
-                self._emote = self._emote_right
-                self._emote.move(self.x + 48, self._y - 16)
-
-            # Change both sprite frames to the emote selected
-            self._emote_left.set_frame(12 + emote)
-            self._emote_right.set_frame(12 + emote)
+            # Show the emote selected
+            self._move_emote()
+            self._emote_animator.play(Cat.EMOTE_CLIPS[emote])
 
             self._emote_duration = duration
 
+    def _move_emote(self):
+        # The emote sits above the cat's head, on the side it faces
+        if self._facing == "left":
+            self._emote_item.move(self._x - 16, self._y - 16)
+        else:
+            self._emote_item.move(self._x + 48, self._y - 16)
+
     def react(self):
         # If hunger is low, then react with a hungry emote
         if self.hunger < 30:
-            self.emote(2, 100)
+            self.emote(2, constants.REACT_EMOTE_DURATION)
         # If joy is low, then react with an angry emote
         elif self.joy < 30:
-            self.emote(1, 100)
+            self.emote(1, constants.REACT_EMOTE_DURATION)
         elif self.joy > 70:
-            self.emote(0, 100)
+            self.emote(0, constants.REACT_EMOTE_DURATION)
+
+    # Method to get the state of the cat
+    def snapshot(self) -> Pet_State:
+        """
+        Copy everything about the cat that changes over time.
+
+        Returns:
+            Pet_State: The state of the cat.
+        """
+
+        state = Pet_State(
+            self._x,
+            self._y,
+            self._stats.hunger,
+            self._stats.joy,
+            Cat.LEFT_BOUNDARY,
+            Cat.RIGHT_BOUNDARY,
+            Cat.WIDTH,
+        )
+        state.facing = self._facing
+        state.direction = self._direction
+        state.walk_speed = self._walk_speed
+        state.walk_distance = self._walk_distance
+        animator = self.cat_sprite.animator
+        state.frame_counter = animator.elapsed
+        state.tracked_frame = animator.frame
+        state.emote_duration = self._emote_duration
+        if self._emote_duration > 0:
+            state.emote = self._emote.frame - 12
+
+        return state
+
+    # Method to set the state of the cat
+    def restore(self, state: Pet_State):
+        """
+        Move the cat, its walk, its emote and its stats to a saved state.
+
+        Args:
+            state (Pet_State): The state to use.
+        """
+
+        if state.facing != self._facing:
+            self.flip()
+
+        self._direction = state.direction
+        self._walk_distance = state.walk_distance
+
+        # Carry on the walk cycle from the saved frame
+        if self._facing == "left":
+            clip = Cat.WALK_CLIP
+        else:
+            clip = Cat.WALK_CLIP_FLIPPED
+        self.cat_sprite.play(clip, state.tracked_frame, state.frame_counter)
+
+        # Hide the old emote before showing the new one
+        if self._emote_duration > 0:
+            self._emote_item.move_off_screen()
+            self._emote_duration = 0
+
+        self.set_position(state.x, state.y)
+
+        if state.emote is not None and state.emote_duration > 0:
+            self.emote(state.emote, state.emote_duration, True)
+
+        # Decayed stats may reach 0, which the setters do not allow
+        if not DEBUG_MODE:
+            self._stats.hunger = state.hunger
+            self._stats.joy = state.joy
+
+    # Method to skip ahead in time
+    def fast_forward(self, seconds: float, decay: bool = True):
+        """
+        Skip the cat ahead in time without running every frame.
+
+        Args:
+            seconds (float): The seconds to skip.
+            decay (bool): Lower the stats over the time as well.
+        """
+
+        state = self.snapshot()
+        Time_Lapse().advance_seconds(state, seconds, decay)
+        self.restore(state)
+
+        # The skipped time is decayed now, so move last checked on with the stats
+        # and the next decay pass does not count it again
+        if decay and not DEBUG_MODE:
+            last_checked = self._stats.last_checked
+            if last_checked is None:
+                last_checked = time.time()
+            self._stats.last_checked = last_checked + seconds
 
     def walk(self, direction: int, distance: int):
         """
@@ -366,7 +519,9 @@ class Cat:
         if self._emote_duration > 0:
             self._emote_duration -= 1
             if self._emote_duration == 0:
-                self._emote.move(255, 255)
+                self._emote_item.move_off_screen()
+            elif self._emote_animator.step():
+                self._emote_item.changed()
 
         # Walking
         # Set the distance to walk
@@ -381,43 +536,33 @@ class Cat:
                     self.flip()
 
             # Move the cat
-            self.x += self._walk_speed * self._direction
+            self.move_by(self._walk_speed * self._direction, 0)
 
             # Check for wall collision
-            if self.x <= Cat.LEFT_BOUNDARY or self.x + 48 >= Cat.RIGHT_BOUNDARY:
+            if self.x <= Cat.LEFT_BOUNDARY or self.x + Cat.WIDTH >= Cat.RIGHT_BOUNDARY:
                 self._direction *= -1
                 self.flip()
-                self.x += self._walk_speed * self._direction
+                self.move_by(self._walk_speed * self._direction, 0)
 
-            if self._frame_counter == 5:
-                # Update the frame for the walk animation
-                if self._facing == "left":
-                    if self._tracked_frame == 0:
-                        self.left_side_cat.swap_tiles(Cat.TILES)
-                        self._tracked_frame = 1
-                    else:
-                        self.left_side_cat.swap_tiles(Cat.TILES_ALT)
-                        self._tracked_frame = 0
-                elif self._facing == "right":
-                    if self._tracked_frame == 0:
-                        self.right_side_cat.swap_tiles(Cat.TILES_FLIPPED)
-                        self._tracked_frame = 1
-                    else:
-                        self.right_side_cat.swap_tiles(Cat.TILES_ALT_FLIPPED)
-                        self._tracked_frame = 0
-
-                self._frame_counter = 0
-            else:
-                self._frame_counter += 1
+            # Update the frame for the walk animation
+            self.cat_sprite.animate()
 
             # Update the walk distance
             self._walk_distance -= self._walk_speed
 
         # Randomly make the cat walk around
         if self._walk_distance == 0:
-            if random.randint(1, 130) == 1:
-                self.walk(random.randint(0, 1), random.randint(30, 70))
+            if random.randint(1, constants.WALK_CHANCE) == 1:
+                self.walk(
+                    random.randint(0, 1),
+                    random.randint(
+                        constants.WALK_DISTANCE_MIN, constants.WALK_DISTANCE_MAX
+                    ),
+                )
 
         # Randomly make the cat react
-        if random.randint(1, 600) == 1:
+        if random.randint(1, constants.REACT_CHANCE) == 1:
             self.react()
+
+        # Write the stats to flash if they have been dirty for long enough
+        self._stats.update()
@@ -0,0 +1,321 @@
+# !/usr/bin/env python3
+
+"""
+Created by: Mohamad Tanbari
+Created on: October 2026
+Hitboxes and collision callbacks for the Tomogotchi game.
+"""
+
+# import constants
+from .. import constants
+
+# Collision layers, a collider only checks the layers in its mask
+LAYER_CAT = 0x01
+LAYER_ITEM = 0x02
+
+
+class Collider:
+    """
+    A hitbox that follows anything with an x and y position.
+    """
+
+    def __init__(
+        self,
+        owner,
+        width: int,
+        height: int,
+        layer: int,
+        mask: int,
+        on_enter=None,
+        on_stay=None,
+        on_exit=None,
+        sleeping: bool = False,
+        body=None,
+    ):
+        """
+        The constructor for the collider class.
+
+        Args:
+            owner: The sprite, meta sprite or cat the hitbox follows.
+            width (int): The width of the hitbox in pixels.
+            height (int): The height of the hitbox in pixels.
+            layer (int): The layer the collider is on.
+            mask (int): The layers the collider collides with.
+            on_enter: Called with (collider, other) when a contact starts.
+            on_stay: Called with (collider, other) every frame a contact lasts.
+            on_exit: Called with (collider, other) when a contact ends.
+            sleeping (bool): Start asleep, left out of the grid until it moves.
+            body (Physics_Body): A body the collider sleeps and wakes with.
+        """
+
+        self.owner = owner
+        self.width = width
+        self.height = height
+        self.layer = layer
+        self.mask = mask
+        self.on_enter = on_enter
+        self.on_stay = on_stay
+        self.on_exit = on_exit
+        self.x = 0
+        self.y = 0
+        self.moved = True
+        self._contacts = {}
+
+        # A sleeping collider that has not moved is only checked against awake ones
+        self.sleeping = sleeping
+        self.body = body
+
+    # Method to check a box against the hitbox
+    def overlaps(self, x: int, y: int, width: int, height: int) -> bool:
+        """
+        Check if a box overlaps the hitbox where the owner is now.
+
+        Args:
+            x (int): The x position of the box.
+            y (int): The y position of the box.
+            width (int): The width of the box.
+            height (int): The height of the box.
+
+        Returns:
+            bool: Whether the box overlaps the hitbox.
+        """
+        owner_x = self.owner.x
+        owner_y = self.owner.y
+        return (
+            owner_x < x + width
+            and owner_x + self.width > x
+            and owner_y < y + height
+            and owner_y + self.height > y
+        )
+
+    # Method to check if the collider is touching another
+    def touching(self, other) -> bool:
+        """
+        Check if the collider was touching another on the last step.
+
+        Args:
+            other (Collider): The other collider.
+
+        Returns:
+            bool: Whether they are touching.
+        """
+        return other in self._contacts
+
+
+class Collision_World:
+    """
+    Find touching colliders using a grid of screen tiles.
+
+    Only awake colliders go in the grid, a sleeping one that has not moved is
+    checked against the awake colliders in its cells, so resting items cost
+    nothing against each other.
+    """
+
+    def __init__(
+        self,
+        columns: int = constants.SCREEN_GRID_X,
+        rows: int = constants.SCREEN_GRID_Y,
+        cell_size: int = constants.SPRITE_SIZE,
+    ):
+        """
+        The constructor for the collision world class.
+
+        Args:
+            columns (int): The number of grid columns.
+            rows (int): The number of grid rows.
+            cell_size (int): The size of a grid cell in pixels.
+        """
+
+        self._columns = columns
+        self._rows = rows
+        self._cell_size = cell_size
+        self._width = columns * cell_size
+        self._height = rows * cell_size
+        self._cells = [[] for _ in range(columns * rows)]
+        self._used_cells = []
+        self._sleepers = []
+        self._colliders = []
+        self._frame = 0
+
+    # Method to add a collider
+    def add(self, collider: Collider):
+        """
+        Add a collider to the world.
+
+        Args:
+            collider (Collider): The collider to add.
+        """
+        self._colliders.append(collider)
+
+    # Method to remove a collider
+    def remove(self, collider: Collider):
+        """
+        Remove a collider, ending its contacts.
+
+        Args:
+            collider (Collider): The collider to remove.
+        """
+        self._colliders.remove(collider)
+        for other in list(collider._contacts):
+            self._exit(collider, other)
+
+    # Method to find collisions
+    def step(self):
+        """
+        Find the touching colliders and call their callbacks. Call once per frame.
+        """
+
+        self._frame += 1
+        frame = self._frame
+        cells = self._cells
+        columns = self._columns
+
+        # Find the colliders that moved since the last step
+        any_moved = False
+        for collider in self._colliders:
+            x = collider.owner.x
+            y = collider.owner.y
+            collider.moved = x != collider.x or y != collider.y
+            if collider.moved:
+                any_moved = True
+                collider.x = x
+                collider.y = y
+            if collider.body is not None:
+                collider.sleeping = collider.body.sleeping
+
+        # Nothing moved, so every contact simply stays
+        if not any_moved:
+            for collider in self._colliders:
+                for other, seen in collider._contacts.items():
+                    if seen != frame:
+                        self._stay(collider, other, frame)
+            return
+
+        # Empty the cells used on the last step
+        for cell in self._used_cells:
+            del cell[:]
+        del self._used_cells[:]
+        sleepers = self._sleepers
+        del sleepers[:]
+
+        # Put every awake collider that is on screen into the cells it covers
+        for collider in self._colliders:
+            bounds = self._bounds(collider)
+            if bounds is None:
+                continue
+            if collider.sleeping and not collider.moved:
+                sleepers.append(collider)
+                continue
+
+            column_start, column_end, row_start, row_end = bounds
+            for row in range(row_start, row_end + 1):
+                for column in range(column_start, column_end + 1):
+                    cell = cells[row * columns + column]
+                    if not cell:
+                        self._used_cells.append(cell)
+                    cell.append(collider)
+
+        # Check the pairs that share a cell
+        for cell in self._used_cells:
+            count = len(cell)
+            if count < 2:
+                continue
+            for first in range(count - 1):
+                a = cell[first]
+                for second in range(first + 1, count):
+                    b = cell[second]
+                    if not (a.mask & b.layer or b.mask & a.layer):
+                        continue
+                    self._check(a, b, cell, frame)
+
+        # Check the sleeping colliders against the awake ones in their cells only
+        for a in sleepers:
+            column_start, column_end, row_start, row_end = self._bounds(a)
+            for row in range(row_start, row_end + 1):
+                for column in range(column_start, column_end + 1):
+                    cell = cells[row * columns + column]
+                    for b in cell:
+                        if a.mask & b.layer or b.mask & a.layer:
+                            self._check(a, b, cell, frame)
+
+            # Two sleeping colliders keep touching
+            for other, seen in a._contacts.items():
+                if seen != frame and other.sleeping and not other.moved:
+                    self._stay(a, other, frame)
+
+        # End the contacts that were not seen this step
+        for collider in self._colliders:
+            if not collider._contacts:
+                continue
+            for other, seen in list(collider._contacts.items()):
+                if seen != frame:
+                    self._exit(collider, other)
+
+    def _bounds(self, collider: Collider):
+        # The first and last column and row a collider covers, None off screen
+        x = collider.x
+        y = collider.y
+        if (
+            x >= self._width
+            or y >= self._height
+            or x + collider.width <= 0
+            or y + collider.height <= 0
+        ):
+            return None
+
+        cell_size = self._cell_size
+        return (
+            max(0, int(x) // cell_size),
+            min(self._columns - 1, int(x + collider.width - 1) // cell_size),
+            max(0, int(y) // cell_size),
+            min(self._rows - 1, int(y + collider.height - 1) // cell_size),
+        )
+
+    def _check(self, a: Collider, b: Collider, cell: list, frame: int):
+        contacts = a._contacts
+
+        # Neither moved, so the contact is the same as last step
+        if not a.moved and not b.moved:
+            if b in contacts and contacts[b] != frame:
+                self._stay(a, b, frame)
+            return
+
+        if not (
+            a.x < b.x + b.width
+            and a.x + a.width > b.x
+            and a.y < b.y + b.height
+            and a.y + a.height > b.y
+        ):
+            return
+
+        # Only handle the pair in the cell holding the corner of the overlap
+        column = min(self._columns - 1, max(0, int(max(a.x, b.x)) // self._cell_size))
+        row = min(self._rows - 1, max(0, int(max(a.y, b.y)) // self._cell_size))
+        if self._cells[row * self._columns + column] is not cell:
+            return
+
+        if b in contacts:
+            self._stay(a, b, frame)
+        else:
+            contacts[b] = frame
+            b._contacts[a] = frame
+            if a.on_enter:
+                a.on_enter(a, b)
+            if b.on_enter:
+                b.on_enter(b, a)
+
+    def _stay(self, a: Collider, b: Collider, frame: int):
+        a._contacts[b] = frame
+        b._contacts[a] = frame
+        if a.on_stay:
+            a.on_stay(a, b)
+        if b.on_stay:
+            b.on_stay(b, a)
+
+    def _exit(self, a: Collider, b: Collider):
+        a._contacts.pop(b, None)
+        b._contacts.pop(a, None)
+        if a.on_exit:
+            a.on_exit(a, b)
+        if b.on_exit:
+            b.on_exit(b, a)
@@ -0,0 +1,177 @@
+# !/usr/bin/env python3
+
+"""
+Created by: Mohamad Tanbari
+Created on: October 2026
+The frame profiler class for the Tomogotchi game.
+"""
+
+import array
+import stage
+import time
+
+
+class Frame_Profiler:
+    """
+    Time each phase of a frame into a fixed size ring buffer.
+    """
+
+    # Number of frames between overlay updates
+    OVERLAY_INTERVAL = 30
+
+    def __init__(self, phases: list, samples: int = 128):
+        """
+        The constructor for the frame profiler class.
+
+        Args:
+            phases (list): The names of the phases, in the order they run.
+            samples (int): The number of frames kept in the ring buffer.
+        """
+
+        self._phases = phases
+        self._phase_count = len(phases)
+        self._samples = samples
+        self._times = array.array("L", [0]) * (samples * self._phase_count)
+        self._index = 0
+        self._filled = 0
+        self._last = 0
+        self._frames_since_draw = 0
+        self._showing = False
+
+        # Frame time readout
+        self.text = stage.Text(width=8, height=1)
+        self.text.move(255, 255)
+
+    # Method to start timing a frame
+    def start(self):
+        """
+        Start timing a frame.
+        """
+
+        # Clear the slot, marks add to it
+        start = self._index * self._phase_count
+        for phase in range(start, start + self._phase_count):
+            self._times[phase] = 0
+
+        self._last = time.monotonic_ns()
+
+    # Method to end a phase
+    def mark(self, phase: int):
+        """
+        Add the time since the last mark to the given phase. A phase marked more
+        than once in a frame, such as a logic step that caught up, adds up.
+
+        Args:
+            phase (int): The index of the phase that just finished.
+        """
+        now = time.monotonic_ns()
+        self._times[self._index * self._phase_count + phase] += now - self._last
+        self._last = now
+
+    # Method to finish a frame
+    def end_frame(self):
+        """
+        Move on to the next slot in the ring buffer.
+        """
+        self._index += 1
+        if self._index == self._samples:
+            self._index = 0
+        if self._filled < self._samples:
+            self._filled += 1
+
+    # Method to get the total time of the last frame
+    def frame_ns(self) -> int:
+        """
+        Get the total time of the last finished frame.
+
+        Returns:
+            int: The frame time in nanoseconds.
+        """
+        if self._filled == 0:
+            return 0
+        start = ((self._index - 1) % self._samples) * self._phase_count
+        return sum(self._times[start : start + self._phase_count])
+
+    # Method to summarise the samples
+    def report(self) -> dict:
+        """
+        Get the min, mean and 99th percentile of each phase in microseconds.
+
+        Returns:
+            dict: (min, mean, p99) for each phase name, plus "frame" for the total.
+        """
+
+        results = {}
+        if self._filled == 0:
+            return results
+
+        totals = [0] * self._filled
+        for phase, name in enumerate(self._phases):
+            samples = []
+            for frame in range(self._filled):
+                value = self._times[frame * self._phase_count + phase]
+                samples.append(value)
+                totals[frame] += value
+            results[name] = self._summarise(samples)
+        results["frame"] = self._summarise(totals)
+
+        return results
+
+    # Method to print the summary
+    def print_report(self):
+        """
+        Print the summary of each phase.
+        """
+
+        print("phase        min us   mean us    p99 us")
+        for name, (low, mean, high) in self.report().items():
+            print("{:<10} {:>8} {:>9} {:>9}".format(name, low, mean, high))
+
+    # Method to show or hide the frame time readout
+    def toggle_overlay(self, game):
+        """
+        Show or hide the frame time readout.
+
+        Args:
+            game (stage.Stage): The stage the readout is drawn on.
+        """
+
+        self._showing = not self._showing
+        if self._showing:
+            self.text.move(0, 0)
+            self._frames_since_draw = Frame_Profiler.OVERLAY_INTERVAL
+        else:
+            self.text.move(255, 255)
+            game.render_block(0, 0, 8 * 8, 8)
+
+    # Method to redraw the frame time readout
+    def draw_overlay(self, game):
+        """
+        Redraw the frame time readout every few frames while it is showing.
+
+        Args:
+            game (stage.Stage): The stage the readout is drawn on.
+        """
+
+        if not self._showing:
+            return
+
+        self._frames_since_draw += 1
+        if self._frames_since_draw < Frame_Profiler.OVERLAY_INTERVAL:
+            return
+        self._frames_since_draw = 0
+
+        frame_us = self.frame_ns() // 1000
+        self.text.clear()
+        self.text.cursor(0, 0)
+        self.text.text("{}.{}ms".format(frame_us // 1000, frame_us % 1000 // 100))
+        game.render_block(0, 0, 8 * 8, 8)
+
+    def _summarise(self, samples: list) -> tuple:
+        samples.sort()
+        count = len(samples)
+        return (
+            samples[0] // 1000,
+            sum(samples) // count // 1000,
+            samples[(count * 99 - 1) // 100] // 1000,
+        )
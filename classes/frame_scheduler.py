@@ -0,0 +1,83 @@
+# !/usr/bin/env python3
+
+"""
+Created by: Mohamad Tanbari
+Created on: October 2026
+The frame scheduler class for the Tomogotchi game.
+"""
+
+import supervisor
+
+# supervisor.ticks_ms() wraps around at 2**29
+TICKS_MASK = (1 << 29) - 1
+
+
+class Frame_Scheduler:
+    """
+    Run the game logic on a fixed timestep, separate from drawing.
+
+    Slow frames are caught up by running more logic steps before the next draw,
+    and when nothing is moving the steps are saved up so the screen is drawn less.
+    """
+
+    # Most logic steps run before a draw, time past this is dropped
+    MAX_STEPS = 5
+
+    # A step may run this many milliseconds early, so clock jitter never skips one
+    SNAP_MS = 1
+
+    def __init__(self, fps: int, idle_fps: int):
+        """
+        The constructor for the frame scheduler class.
+
+        Args:
+            fps (int): Logic steps per second.
+            idle_fps (int): Draws per second while nothing is moving.
+        """
+
+        self._fps = fps
+        self._idle_steps = min(max(1, fps // idle_fps), Frame_Scheduler.MAX_STEPS)
+        self._last = supervisor.ticks_ms()
+
+        # Time waiting to be stepped, in milliseconds times fps
+        self._owed = 0
+
+        # Whether nothing is moving, set by the scene after each draw
+        self.idle = False
+
+        # Logic steps dropped because the game fell too far behind
+        self.dropped = 0
+
+    # Method to get the logic steps that are due
+    def steps(self, wake: bool = False) -> int:
+        """
+        Get how many logic steps to run before the next draw.
+
+        Args:
+            wake (bool): Something happened, such as a button press, that should
+                be handled right away even when idle.
+
+        Returns:
+            int: The number of steps, 0 if there is nothing to run or draw yet.
+        """
+
+        now = supervisor.ticks_ms()
+        self._owed += ((now - self._last) & TICKS_MASK) * self._fps
+        self._last = now
+
+        due = (self._owed + Frame_Scheduler.SNAP_MS * self._fps) // 1000
+        if due <= 0:
+            return 0
+
+        # Save steps up while idle and draw them all at once
+        if self.idle and not wake and due < self._idle_steps:
+            return 0
+
+        # Never try to catch up on more than a few steps at a time
+        if due > Frame_Scheduler.MAX_STEPS:
+            self.dropped += due - Frame_Scheduler.MAX_STEPS
+            due = Frame_Scheduler.MAX_STEPS
+            self._owed = due * 1000
+
+        self._owed -= due * 1000
+        return due
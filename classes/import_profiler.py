@@ -0,0 +1,126 @@
+# !/usr/bin/env python3
+
+"""
+Created by: Mohamad Tanbari
+Created on: October 2026
+The import profiler class for the Tomogotchi game.
+"""
+
+import builtins
+import gc
+import sys
+import time
+
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
+
+
+def heap_used() -> int:
+    """
+    Get the bytes allocated on the heap.
+
+    Returns:
+        int: The bytes in use, from gc on the PyBadge or tracemalloc on a computer.
+    """
+    if hasattr(gc, "mem_alloc"):
+        return gc.mem_alloc()
+    if tracemalloc is not None and tracemalloc.is_tracing():
+        return tracemalloc.get_traced_memory()[0]
+    return 0
+
+
+class Import_Profiler:
+    """
+    Time and weigh every module the first time it is imported.
+    """
+
+    def __init__(self, start_ns: int = None):
+        """
+        The constructor for the import profiler class.
+
+        Args:
+            start_ns (int): When boot started, from time.monotonic_ns().
+        """
+
+        self._start_ns = time.monotonic_ns() if start_ns is None else start_ns
+        self._original_import = None
+        self._depth = 0
+
+        # (depth, module, microseconds, bytes) for every new module, in import order
+        self.imports = []
+
+        # (label, ms since boot) for milestones such as the first pixel
+        self.marks = []
+
+    # Method to start timing imports
+    def install(self):
+        """
+        Wrap the import function so every new module is timed.
+        """
+
+        if self._original_import is not None:
+            return
+        self._original_import = builtins.__import__
+        builtins.__import__ = self._import
+
+    # Method to stop timing imports
+    def uninstall(self):
+        """
+        Put the original import function back.
+        """
+
+        if self._original_import is None:
+            return
+        builtins.__import__ = self._original_import
+        self._original_import = None
+
+    # Method to record a milestone
+    def mark(self, label: str):
+        """
+        Record how long after boot something happened.
+
+        Args:
+            label (str): The name of the milestone.
+        """
+        self.marks.append((label, (time.monotonic_ns() - self._start_ns) // 1000000))
+
+    # Method to print the report
+    def print_report(self):
+        """
+        Print every import with its time and heap use, then the milestones.
+        Times and bytes include the modules a module imports itself.
+        """
+
+        print("{:<36} {:>7} {:>9}".format("import", "ms", "bytes"))
+        for depth, name, us, used in self.imports:
+            print("{:<36} {:>7.1f} {:>9}".format("  " * depth + name, us / 1000, used))
+        for label, ms in self.marks:
+            print("{:<36} {:>7} ms after boot".format(label, ms))
+
+    def _import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        # Modules that are already loaded cost nothing worth timing
+        if level == 0 and name in sys.modules:
+            return self._original_import(name, globals, locals, fromlist, level)
+
+        before = len(sys.modules)
+        index = len(self.imports)
+        self.imports.append(None)
+        self._depth += 1
+        heap_before = heap_used()
+        start = time.monotonic_ns()
+        try:
+            return self._original_import(name, globals, locals, fromlist, level)
+        finally:
+            elapsed = (time.monotonic_ns() - start) // 1000
+            used = heap_used() - heap_before
+            self._depth -= 1
+
+            # Only keep the imports that loaded something new
+            if len(sys.modules) > before:
+                if level:
+                    name = "." * level + (name or ", ".join(fromlist))
+                self.imports[index] = (self._depth, name, elapsed, used)
+            else:
+                del self.imports[index]
@@ -0,0 +1,192 @@
+# !/usr/bin/env python3
+
+"""
+Created by: Mohamad Tanbari
+Created on: October 2026
+The input manager class for the Tomogotchi game.
+"""
+
+
+class Input_Manager:
+    """
+    Turn the button mask into pressed, held and released masks once per frame.
+
+    Every press and release also goes in a small ring buffer of events, with how
+    long the key was held, for code that handles the keys one at a time.
+    """
+
+    # Number of keys on the PyBadge
+    KEY_COUNT = 8
+
+    # Most events kept when nothing reads them, the oldest are dropped first
+    MAX_EVENTS = 16
+
+    # Event types
+    PRESSED = 0
+    RELEASED = 1
+
+    def __init__(self):
+        """
+        The constructor for the input manager class.
+        """
+
+        self.held = 0
+        self.just_pressed = 0
+        self.released = 0
+        self._frame = 0
+        self._pressed_at = [0] * Input_Manager.KEY_COUNT
+
+        # The event ring buffer, allocated once, head is the oldest event
+        self._event_keys = [0] * Input_Manager.MAX_EVENTS
+        self._event_types = [0] * Input_Manager.MAX_EVENTS
+        self._event_frames = [0] * Input_Manager.MAX_EVENTS
+        self._head = 0
+        self._tail = 0
+        self._count = 0
+
+        # The event last taken by next_event
+        self.event_key = 0
+        self.event_type = Input_Manager.PRESSED
+        self.event_frames = 0
+
+    # Method to read a new frame of input
+    def update(self, keys: int):
+        """
+        Update the masks from this frame's button mask.
+
+        Args:
+            keys (int): The mask from ugame.buttons.get_pressed().
+        """
+
+        previous = self.held
+        self.just_pressed = keys & ~previous
+        self.released = previous & ~keys
+        self.held = keys
+        self._frame += 1
+
+        # Only look at single keys on the frames where something changed
+        changed = self.just_pressed | self.released
+        if changed:
+            self._record(changed)
+
+    # Method to check if a key was pressed this frame
+    def pressed(self, key: int) -> bool:
+        """
+        Check if a key went down this frame.
+
+        Args:
+            key (int): The key constant, for example ugame.K_LEFT.
+
+        Returns:
+            bool: Whether the key was just pressed.
+        """
+        return self.just_pressed & key != 0
+
+    # Method to check if a key is down
+    def is_held(self, key: int) -> bool:
+        """
+        Check if a key is down.
+
+        Args:
+            key (int): The key constant.
+
+        Returns:
+            bool: Whether the key is down.
+        """
+        return self.held & key != 0
+
+    # Method to check if a key was released this frame
+    def was_released(self, key: int) -> bool:
+        """
+        Check if a key went up this frame.
+
+        Args:
+            key (int): The key constant.
+
+        Returns:
+            bool: Whether the key was just released.
+        """
+        return self.released & key != 0
+
+    # Method to get how long a key has been held
+    def hold_frames(self, key: int) -> int:
+        """
+        Get how many frames a key has been held.
+
+        Args:
+            key (int): The key constant.
+
+        Returns:
+            int: The frames the key has been held, 0 if it is up.
+        """
+        if self.held & key == 0:
+            return 0
+        return self._frame - self._pressed_at[self._index(key)]
+
+    # Method to check for a long press
+    def long_pressed(self, key: int, frames: int) -> bool:
+        """
+        Check if a key has just been held for a number of frames.
+
+        Args:
+            key (int): The key constant.
+            frames (int): The frames needed for a long press.
+
+        Returns:
+            bool: True only on the frame the hold reaches the length.
+        """
+        return self.hold_frames(key) == frames
+
+    # Method to take the oldest event
+    def next_event(self) -> bool:
+        """
+        Take the oldest queued event into event_key, event_type and event_frames.
+
+        Returns:
+            bool: Whether there was an event, False once the queue is empty.
+        """
+
+        if self._count == 0:
+            return False
+
+        head = self._head
+        self.event_key = self._event_keys[head]
+        self.event_type = self._event_types[head]
+        self.event_frames = self._event_frames[head]
+        self._head = (head + 1) % Input_Manager.MAX_EVENTS
+        self._count -= 1
+        return True
+
+    def _record(self, changed: int):
+        for index in range(Input_Manager.KEY_COUNT):
+            key = 1 << index
+            if changed & key == 0:
+                continue
+
+            # A press remembers when the key went down, a release says how long
+            if self.just_pressed & key:
+                self._pressed_at[index] = self._frame
+                self._push(key, Input_Manager.PRESSED, 0)
+            else:
+                frames = self._frame - self._pressed_at[index]
+                self._push(key, Input_Manager.RELEASED, frames)
+
+    def _push(self, key: int, event: int, frames: int):
+        # Drop the oldest event when the queue is full
+        if self._count == Input_Manager.MAX_EVENTS:
+            self._head = (self._head + 1) % Input_Manager.MAX_EVENTS
+            self._count -= 1
+
+        tail = self._tail
+        self._event_keys[tail] = key
+        self._event_types[tail] = event
+        self._event_frames[tail] = frames
+        self._tail = (tail + 1) % Input_Manager.MAX_EVENTS
+        self._count += 1
+
+    def _index(self, key: int) -> int:
+        index = 0
+        while key > 1:
+            key >>= 1
+            index += 1
+        return index
@@ -0,0 +1,154 @@
+# !/usr/bin/env python3
+
+"""
+Created by: Mohamad Tanbari
+Created on: October 2026
+Record and replay the buttons of a game session.
+"""
+
+import struct
+
+# The file starts with the magic, version, random seed and starting hunger and joy
+HEADER_FORMAT = "<4sBIBB"
+HEADER_SIZE = struct.calcsize(HEADER_FORMAT)
+MAGIC = b"TGIR"
+VERSION = 1
+
+# Every run is a button mask and how many frames in a row it was held
+RUN_FORMAT = "<BH"
+RUN_SIZE = struct.calcsize(RUN_FORMAT)
+MAX_RUN = 0xFFFF
+
+
+class Input_Recorder:
+    """
+    Write the button mask of every frame to a file as runs of repeated masks.
+
+    The runs are appended to the file every few seconds, so a recording is kept
+    even when the game is never left and only the power is cut.
+    """
+
+    # Frames between writes to the file
+    FLUSH_FRAMES = 600
+
+    def __init__(self, path: str, seed: int, hunger: int, joy: int):
+        """
+        The constructor for the input recorder class.
+
+        Args:
+            path (str): The path of the recording.
+            seed (int): The seed the random module was given.
+            hunger (int): The hunger of the cat when the recording starts.
+            joy (int): The joy of the cat when the recording starts.
+        """
+
+        self._path = path
+        with open(path, "wb") as file:
+            file.write(struct.pack(HEADER_FORMAT, MAGIC, VERSION, seed, hunger, joy))
+
+        # Runs finished since the last write
+        self._data = bytearray()
+        self._mask = 0
+        self._count = 0
+        self._unwritten = 0
+        self.frames = 0
+
+    # Method to record a frame
+    def record(self, keys: int):
+        """
+        Record the button mask of one frame.
+
+        Args:
+            keys (int): The mask from ugame.buttons.get_pressed().
+        """
+
+        self.frames += 1
+        self._unwritten += 1
+        if keys == self._mask and self._count < MAX_RUN:
+            self._count += 1
+        else:
+            if self._count:
+                self._data += struct.pack(RUN_FORMAT, self._mask, self._count)
+            self._mask = keys
+            self._count = 1
+
+        if self._unwritten >= Input_Recorder.FLUSH_FRAMES:
+            self.flush()
+
+    # Method to write the runs so far
+    def flush(self):
+        """
+        Append the runs so far to the file, ending the current run early.
+        """
+
+        # A run cut in two plays back the same as one
+        if self._count:
+            self._data += struct.pack(RUN_FORMAT, self._mask, self._count)
+            self._count = 0
+        self._unwritten = 0
+
+        if self._data:
+            with open(self._path, "ab") as file:
+                file.write(self._data)
+            self._data = bytearray()
+
+    # Method to finish the recording
+    def close(self):
+        """
+        Write the last partial run to the file.
+        """
+        self.flush()
+
+
+class Input_Player:
+    """
+    Read a recording back one frame at a time.
+    """
+
+    def __init__(self, path: str):
+        """
+        The constructor for the input player class.
+
+        Args:
+            path (str): The path of the recording.
+        """
+
+        with open(path, "rb") as file:
+            self._data = file.read()
+
+        magic, version, self.seed, self.hunger, self.joy = struct.unpack_from(
+            HEADER_FORMAT, self._data
+        )
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("Not an input recording: " + path)
+
+        self._offset = HEADER_SIZE
+        self._mask = 0
+        self._count = 0
+        self.finished = False
+
+        # Total length, so a replay knows when to stop
+        self.frames = 0
+        for offset in range(HEADER_SIZE, len(self._data), RUN_SIZE):
+            self.frames += struct.unpack_from(RUN_FORMAT, self._data, offset)[1]
+
+    # Method to play back a frame
+    def next_keys(self) -> int:
+        """
+        Get the button mask of the next recorded frame.
+
+        Returns:
+            int: The key mask, 0 once the recording has finished.
+        """
+
+        if self._count == 0:
+            if self._offset >= len(self._data):
+                self.finished = True
+                return 0
+            self._mask, self._count = struct.unpack_from(
+                RUN_FORMAT, self._data, self._offset
+            )
+            self._offset += RUN_SIZE
+
+        self._count -= 1
+        return self._mask
@@ -9,8 +9,10 @@ The meta sprite class for the Tomogotchi game.
 # import constants
 from .. import constants
 import stage
-import supervisor
-import ugame
+
+# import classes
+from Tomogotchi.classes.animation import Animator, Clip
+from Tomogotchi.classes.bank_registry import banks
 
 
 class Meta_Sprite:
@@ -41,14 +43,29 @@ class Meta_Sprite:
         self._height = height
         self._width = width
         self._tile_list = []
+        self._offsets_x = []
+        self._offsets_y = []
         self._tiles = tiles
         self._sprite_sheet_position = sprite_sheet_position
 
-        # Load the image bank
+        # Whether the sprites moved or changed since they were last drawn
+        self.dirty = True
+
+        # The render list the tiles are drawn by, and whether they are in its
+        # visible list
+        self.sprites = self._tile_list
+        self.render_list = None
+        self.listed = False
+
+        # Load the image bank, shared with anything else using the same sheet
+        self.image_bank = None
         try:
-            self.image_bank = stage.Bank.from_bmp16(self._sprite_sheet_position)
+            self.image_bank = banks.get(self._sprite_sheet_position)
         except Exception as e:
             print(f"Error loading image sprite: {e}")
+
+            # No tiles to animate, so playing a clip does nothing
+            self.animator = Animator(self._tile_list, [])
             return
 
         # Loop to create sprites for each tile entered
@@ -63,6 +80,13 @@ class Meta_Sprite:
             # Add the sprite to the tile list
             self._tile_list.append(self.sprite)
 
+            # Keep the offset of the tile so moving never recalculates it
+            self._offsets_x.append(meta_sprite_x)
+            self._offsets_y.append(meta_sprite_y)
+
+        # Plays clips on the tiles
+        self.animator = Animator(self._tile_list, self._tiles)
+
     # Getter for x position
     @property
     def x(self) -> int:
@@ -83,13 +107,7 @@ class Meta_Sprite:
         Args:
             value (int): The new x position of the metasprite.
         """
-        self._x = value
-
-        # Update the x position of all follower sprites
-        for index, sprite in enumerate(self._tile_list):
-            # Calculate the x and y position of the tile
-            meta_sprite_x = (index % self._width) * constants.SPRITE_SIZE
-            sprite.move(self._x + meta_sprite_x, sprite.y)
+        self.set_position(value, self._y)
 
     # Getter for y position
     @property
@@ -111,13 +129,42 @@ class Meta_Sprite:
         Args:
             value (int): The new y position of the metasprite.
         """
-        self._y = value
+        self.set_position(self._x, value)
 
-        # Update the y position of all follower sprites
-        for index, sprite in enumerate(self._tile_list):
-            # Calculate the x and y position of the tile
-            meta_sprite_y = (index // self._width) * 16
-            sprite.move(sprite.x, self._y + meta_sprite_y)
+    # Method to move the metasprite
+    def set_position(self, x: int, y: int):
+        """
+        Move the metasprite and all of its tiles in one pass.
+
+        Args:
+            x (int): The new x position of the metasprite.
+            y (int): The new y position of the metasprite.
+        """
+        self._x = x
+        self._y = y
+        self.dirty = True
+
+        # Update the position of all follower sprites
+        tile_list = self._tile_list
+        offsets_x = self._offsets_x
+        offsets_y = self._offsets_y
+        for index in range(len(tile_list)):
+            tile_list[index].move(x + offsets_x[index], y + offsets_y[index])
+
+        # Coming on screen puts the tiles back in the render list
+        if not self.listed and self.render_list is not None and self.is_on_screen():
+            self.render_list.enter(self)
+
+    # Method to move the metasprite by an amount
+    def move_by(self, dx: int, dy: int):
+        """
+        Move the metasprite relative to where it is.
+
+        Args:
+            dx (int): The distance to move on the x axis.
+            dy (int): The distance to move on the y axis.
+        """
+        self.set_position(self._x + dx, self._y + dy)
 
     # Method to move the metasprite off screen
     def move_off_screen(self):
@@ -125,24 +172,54 @@ class Meta_Sprite:
         Move the metasprite off screen.
         """
 
-        self.x = constants.OFF_SCREEN_X
-        self.y = constants.OFF_SCREEN_Y
+        self.set_position(constants.OFF_SCREEN_X, constants.OFF_SCREEN_Y)
 
-    # Method to change the tiles of the metasprite
-    def swap_tiles(self, tiles: list):
+    # Method to rotate or mirror the tiles
+    def set_rotation(self, rotation: int):
         """
-        Swap the tiles of the metasprite.
+        Rotate or mirror every tile of the metasprite in place.
 
         Args:
-            tiles (list): The new tiles for the metasprite.
+            rotation (int): The stage rotation, 0 - 3 rotate by 90 degrees, add 4 to
+                mirror.
         """
 
-        # Update the tiles
-        self._tiles = tiles
+        for sprite in self._tile_list:
+            sprite.set_frame(rotation=rotation)
+        self.dirty = True
 
-        # Loop to update the tiles
-        for index, tile in enumerate(self._tiles):
-            self._tile_list[index].set_frame(tile)
+    # Method to start an animation
+    def play(self, clip: Clip, frame: int = 0, elapsed: int = 0):
+        """
+        Start a clip on the tiles of the metasprite.
+
+        Args:
+            clip (Clip): The clip to play.
+            frame (int): The frame to start on.
+            elapsed (int): The steps that frame has already been showing for.
+        """
+
+        if self.animator.play(clip, frame, elapsed):
+            self.dirty = True
+
+    # Method to move the animation on
+    def animate(self):
+        """
+        Move the clip on by one step, marking the metasprite dirty if a tile changed.
+        """
+
+        if self.animator.step():
+            self.dirty = True
+
+    # Method to give back the image bank
+    def release_banks(self):
+        """
+        Give the image bank back to the bank registry.
+        """
+
+        if self.image_bank is not None:
+            banks.release(self._sprite_sheet_position)
+            self.image_bank = None
 
     # Method to check if the sprite is on screen
     def is_on_screen(self) -> bool:
@@ -0,0 +1,234 @@
+# !/usr/bin/env python3
+
+"""
+Created by: Mohamad Tanbari
+Created on: October 2026
+Fixed point physics for thrown items in the Tomogotchi game.
+"""
+
+# import constants
+from .. import constants
+
+# Positions and velocities keep 8 bits after the point
+FIXED_SHIFT = 8
+FIXED_ONE = 1 << FIXED_SHIFT
+
+# The float constants converted to fixed point
+GRAVITY = int(constants.GRAVITY * FIXED_ONE)
+FRICTION = int(constants.FRICTION * FIXED_ONE)
+
+# Bodies slower than this on both axes stop, and go to sleep on the floor
+REST_SPEED = FIXED_ONE // 10
+
+
+class Physics_Body:
+    """
+    A sprite that falls, bounces and slides.
+    """
+
+    def __init__(self, sprite, size: int = constants.SPRITE_SIZE):
+        """
+        The constructor for the physics body class.
+
+        Args:
+            sprite (stage.Sprite): The sprite moved by the body.
+            size (int): The width and height of the body in pixels.
+        """
+
+        self.sprite = sprite
+        self.size = size
+        self.x = int(sprite.x) << FIXED_SHIFT
+        self.y = int(sprite.y) << FIXED_SHIFT
+        self.vx = 0
+        self.vy = 0
+        self.sleeping = True
+        self._world = None
+        self._max_x = 0
+        self._max_y = 0
+
+    # Method to move the body
+    def set_position(self, x: int, y: int):
+        """
+        Move the body and its sprite, keeping its velocity.
+
+        Args:
+            x (int): The new x position in pixels.
+            y (int): The new y position in pixels.
+        """
+        self.x = x << FIXED_SHIFT
+        self.y = y << FIXED_SHIFT
+        self.sprite.move(x, y)
+
+    # Method to throw the body
+    def set_velocity(self, vx: int, vy: int):
+        """
+        Set the velocity of the body and wake it up.
+
+        Args:
+            vx (int): The x velocity in fixed point pixels per frame.
+            vy (int): The y velocity in fixed point pixels per frame.
+        """
+        self.vx = vx
+        self.vy = vy
+        self.wake()
+
+    # Method to wake the body
+    def wake(self):
+        """
+        Start simulating the body again.
+        """
+        if self.sleeping:
+            self.sleeping = False
+            if self._world is not None:
+                self._world._awake.append(self)
+
+    # Method to stop the body
+    def sleep(self):
+        """
+        Stop the body and stop simulating it until it is woken.
+        """
+        self.vx = 0
+        self.vy = 0
+        if not self.sleeping:
+            self.sleeping = True
+            if self._world is not None:
+                self._world._awake.remove(self)
+
+
+class Physics_World:
+    """
+    Step every awake body and keep them inside the room.
+    """
+
+    def __init__(self, left: int, right: int, ceiling: int, floor: int):
+        """
+        The constructor for the physics world class.
+
+        Args:
+            left (int): The left wall in pixels.
+            right (int): The right wall in pixels.
+            ceiling (int): The ceiling in pixels.
+            floor (int): The floor in pixels.
+        """
+
+        self._left = left << FIXED_SHIFT
+        self._right = right << FIXED_SHIFT
+        self._ceiling = ceiling << FIXED_SHIFT
+        self._floor = floor << FIXED_SHIFT
+        self._bodies = []
+        self._awake = []
+
+        # Bodies whose sprite moved on the last step
+        self.moved = []
+
+    # Getter for whether anything is moving
+    @property
+    def asleep(self) -> bool:
+        """
+        Check if every body is asleep.
+
+        Returns:
+            bool: Whether nothing in the world is moving.
+        """
+        return not self._awake
+
+    # Method to add a body
+    def add(self, body: Physics_Body):
+        """
+        Add a body to the world.
+
+        Args:
+            body (Physics_Body): The body to add.
+        """
+        body._world = self
+        body._max_x = self._right - (body.size << FIXED_SHIFT)
+        body._max_y = self._floor - (body.size << FIXED_SHIFT)
+        self._bodies.append(body)
+        if not body.sleeping:
+            self._awake.append(body)
+
+    # Method to remove a body
+    def remove(self, body: Physics_Body):
+        """
+        Remove a body from the world.
+
+        Args:
+            body (Physics_Body): The body to remove.
+        """
+        if not body.sleeping:
+            self._awake.remove(body)
+        self._bodies.remove(body)
+        body._world = None
+
+    # Method to step the world
+    def step(self):
+        """
+        Move every awake body by one frame. Sleeping bodies cost nothing.
+        """
+
+        moved = self.moved
+        del moved[:]
+
+        awake = self._awake
+        left = self._left
+        ceiling = self._ceiling
+        index = 0
+        while index < len(awake):
+            body = awake[index]
+            right = body._max_x
+            floor = body._max_y
+
+            # Apply gravity
+            vx = body.vx
+            vy = body.vy + GRAVITY
+
+            # Move the body
+            x = body.x + vx
+            y = body.y + vy
+
+            # Check for boundaries and bounce
+            if y < ceiling:
+                y = ceiling
+                vy = abs(vy) * FRICTION >> FIXED_SHIFT
+            elif y > floor:
+                y = floor
+                vy = -(abs(vy) * FRICTION >> FIXED_SHIFT)
+
+            if x < left:
+                x = left
+                vx = abs(vx) * FRICTION >> FIXED_SHIFT
+            elif x > right:
+                x = right
+                vx = -(abs(vx) * FRICTION >> FIXED_SHIFT)
+
+            # Apply friction to gradually stop the body
+            vx = vx * FRICTION >> FIXED_SHIFT
+            vy = vy * FRICTION >> FIXED_SHIFT
+
+            # Only move the sprite when it lands on a new pixel
+            pixel_x = x >> FIXED_SHIFT
+            pixel_y = y >> FIXED_SHIFT
+            if pixel_x != body.x >> FIXED_SHIFT or pixel_y != body.y >> FIXED_SHIFT:
+                body.sprite.move(pixel_x, pixel_y)
+                moved.append(body)
+
+            body.x = x
+            body.y = y
+
+            # Stop bouncing after velocity is very low
+            if -REST_SPEED < vx < REST_SPEED and -REST_SPEED < vy < REST_SPEED:
+                vx = 0
+                vy = 0
+
+                # Resting on the floor, so stop simulating it
+                if y == floor:
+                    body.vx = 0
+                    body.vy = 0
+                    body.sleeping = True
+                    awake[index] = awake[-1]
+                    awake.pop()
+                    continue
+
+            body.vx = vx
+            body.vy = vy
+            index += 1
@@ -0,0 +1,140 @@
+# !/usr/bin/env python3
+
+"""
+Created by: Mohamad Tanbari
+Created on: October 2026
+The render list and render item classes for the Tomogotchi game.
+"""
+
+# import constants
+from .. import constants
+
+
+class Render_List:
+    """
+    The sprite groups that are on screen, kept in one list that only changes when
+    a group moves on or off screen.
+
+    A group is a metasprite or a render item: it has a list of sprites, a dirty
+    flag, is_on_screen() and a render_list it tells when it comes on screen.
+    """
+
+    def __init__(self):
+        """
+        The constructor for the render list class.
+        """
+
+        # Groups on screen, and groups that just left and still need clearing
+        self.visible = []
+
+    # Method to add a group
+    def add(self, group):
+        """
+        Add a group that the list keeps track of from now on.
+
+        Args:
+            group: The metasprite or render item.
+        """
+
+        group.render_list = self
+        if group.is_on_screen():
+            self.enter(group)
+
+    # Method to add a group that came on screen
+    def enter(self, group):
+        """
+        Put a group that came on screen in the visible list.
+
+        Args:
+            group: The metasprite or render item.
+        """
+
+        if not group.listed:
+            group.listed = True
+            self.visible.append(group)
+
+    # Method to draw the groups that changed
+    def render(self, game):
+        """
+        Draw the visible groups that changed, dropping the ones that left the screen
+        once the area they left is cleared.
+
+        Args:
+            game (stage.Stage): The stage to draw on.
+        """
+
+        visible = self.visible
+        index = len(visible) - 1
+        while index >= 0:
+            group = visible[index]
+            if group.dirty:
+                game.render_sprites(group.sprites)
+                group.dirty = False
+                if not group.is_on_screen():
+                    group.listed = False
+                    visible.pop(index)
+            index -= 1
+
+
+class Render_Item:
+    """
+    A single sprite, such as the food or the toy, kept in a render list.
+    """
+
+    def __init__(self, sprite):
+        """
+        The constructor for the render item class.
+
+        Args:
+            sprite (stage.Sprite): The sprite.
+        """
+
+        self.sprite = sprite
+
+        # Handed straight to render_sprites, never replaced
+        self.sprites = [sprite]
+
+        self.dirty = True
+        self.listed = False
+        self.render_list = None
+
+    # Method to move the sprite
+    def move(self, x: int, y: int):
+        """
+        Move the sprite and mark it to be drawn.
+
+        Args:
+            x (int): The new x position.
+            y (int): The new y position.
+        """
+        self.sprite.move(x, y)
+        self.changed()
+
+    # Method to move the sprite off screen
+    def move_off_screen(self):
+        """
+        Move the sprite off screen.
+        """
+        self.move(constants.OFF_SCREEN_X, constants.OFF_SCREEN_Y)
+
+    # Method to mark the sprite changed
+    def changed(self):
+        """
+        Mark the sprite to be drawn after it moved or changed by itself.
+        """
+
+        self.dirty = True
+        if not self.listed and self.render_list is not None and self.is_on_screen():
+            self.render_list.enter(self)
+
+    # Method to check if the sprite is on screen
+    def is_on_screen(self) -> bool:
+        """
+        Check if the sprite is on screen.
+
+        Returns:
+            bool: Whether the sprite is on screen or not.
+        """
+
+        sprite = self.sprite
+        return sprite.x != constants.OFF_SCREEN_X and sprite.y != constants.OFF_SCREEN_Y
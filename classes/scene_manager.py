@@ -0,0 +1,203 @@
+# !/usr/bin/env python3
+
+"""
+Created by: Mohamad Tanbari
+Created on: October 2026
+The scene and scene manager classes for the Tomogotchi game.
+"""
+
+# import constants
+from .. import constants
+import gc
+
+# import classes
+from Tomogotchi.classes.bank_registry import banks
+from Tomogotchi.classes.import_profiler import heap_used
+
+
+class Scene:
+    """
+    A screen of the game, with the banks and layers it owns.
+    """
+
+    def __init__(self):
+        """
+        The constructor for the scene class.
+        """
+
+        self.layers = []
+        self.loaded = False
+        self.failed = False
+        self._bank_paths = []
+        self._loader = None
+
+    # Method to load a bank owned by the scene
+    def use_bank(self, path: str):
+        """
+        Get a bank that is given back when the scene is released.
+
+        Args:
+            path (str): The path to the BMP file.
+
+        Returns:
+            stage.Bank: The bank.
+        """
+        bank = banks.get(path)
+        self._bank_paths.append(path)
+        return bank
+
+    # Method to load the next slice
+    def load_step(self) -> bool:
+        """
+        Load the next slice of the scene.
+
+        Returns:
+            bool: Whether the scene has finished loading.
+        """
+
+        if self.loaded:
+            return True
+
+        if self._loader is None:
+            self._loader = self.load()
+
+        try:
+            next(self._loader)
+        except StopIteration:
+            self.loaded = True
+            self._loader = None
+        except Exception as e:
+            print(f"Error loading {type(self).__name__}: {e}")
+            self.failed = True
+            self.loaded = True
+            self._loader = None
+
+        return self.loaded
+
+    # Method to give back everything the scene owns
+    def release(self):
+        """
+        Give back the scene's banks and drop its layers.
+        """
+
+        for path in self._bank_paths:
+            banks.release(path)
+        self._bank_paths = []
+        self.layers = []
+
+    def load(self):
+        """
+        Load the scene. Scenes yield between slices so loading can be spread out.
+        """
+        return
+        yield
+
+    def enter(self, manager):
+        """
+        Called once the scene is loaded and becomes the current scene.
+
+        Args:
+            manager (Scene_Manager): The scene manager.
+        """
+
+    def update(self, manager):
+        """
+        Called over and over while the scene is the current scene.
+
+        Args:
+            manager (Scene_Manager): The scene manager.
+        """
+
+    def exit(self, manager):
+        """
+        Called when the scene stops being the current scene.
+
+        Args:
+            manager (Scene_Manager): The scene manager.
+        """
+
+
+class Scene_Manager:
+    """
+    Run one scene at a time and clean up after each one.
+    """
+
+    def __init__(self):
+        """
+        The constructor for the scene manager class.
+        """
+
+        self.scene = None
+        self._next_scene = None
+
+        # (from, to, heap before, heap after release, heap after enter) in bytes
+        self.transitions = []
+
+    # Method to ask for another scene
+    def change(self, scene: Scene):
+        """
+        Switch to a scene once the current update finishes.
+
+        Args:
+            scene (Scene): The scene to switch to.
+        """
+        self._next_scene = scene
+
+    # Method to run the scenes
+    def run(self, scene: Scene):
+        """
+        Run a scene, and whichever scenes it changes to.
+
+        Args:
+            scene (Scene): The first scene.
+        """
+
+        # Only the manager may keep the scene alive, so it can be freed later
+        self._next_scene = scene
+        del scene
+
+        try:
+            while True:
+                if self._next_scene is not None:
+                    self._switch()
+                self.scene.update(self)
+        finally:
+            if self.scene is not None:
+                self.scene.exit(self)
+                self.scene.release()
+                self.scene = None
+
+    def _switch(self):
+        scene = self._next_scene
+        self._next_scene = None
+        heap_before = heap_used()
+
+        # Finish and let go of the old scene before anything new is made
+        old_name = None
+        if self.scene is not None:
+            old_name = type(self.scene).__name__
+            self.scene.exit(self)
+            self.scene.release()
+            self.scene = None
+        gc.collect()
+        heap_released = heap_used()
+
+        # Anything the new scene did not load in the background loads now
+        while not scene.load_step():
+            pass
+        if scene.failed:
+            raise RuntimeError(type(scene).__name__ + " failed to load")
+
+        self.scene = scene
+        scene.enter(self)
+        heap_entered = heap_used()
+
+        self.transitions.append(
+            (old_name, type(scene).__name__, heap_before, heap_released, heap_entered)
+        )
+        if constants.PROFILE_HEAP:
+            print(
+                "{} -> {}: heap {} before, {} after release, {} after enter".format(
+                    *self.transitions[-1]
+                )
+            )
@@ -0,0 +1,268 @@
+# !/usr/bin/env python3
+
+"""
+Created by: Mohamad Tanbari
+Created on: October 2026
+The stat log class for the Tomogotchi game.
+"""
+
+import os
+import struct
+
+# A segment starts with the magic, version and the sequence number of the save
+# slot written just before it
+HEADER_FORMAT = "<4sB3xI"
+HEADER_SIZE = struct.calcsize(HEADER_FORMAT)
+MAGIC = b"TLOG"
+VERSION = 1
+
+# A record is the time, event, hunger, joy and a check byte for torn writes
+RECORD_FORMAT = "<IBBBB"
+RECORD_SIZE = struct.calcsize(RECORD_FORMAT)
+
+# What changed the stats
+EVENT_CHANGE = 0
+EVENT_FEED = 1
+EVENT_PLAY = 2
+EVENT_TOY = 3
+EVENT_DECAY = 4
+
+
+def _check(record, offset: int = 0) -> int:
+    # Never 0x00 or 0xFF for blank flash, so unwritten records fail the check
+    total = 0
+    for index in range(offset, offset + RECORD_SIZE - 1):
+        total += record[index]
+    return (total & 0xFF) ^ 0xA5
+
+
+class Stat_Log:
+    """
+    Stat changes appended to two log segments that take turns, next to the save slots.
+
+    When the current segment grows past its size a new save slot is written and the
+    other segment starts over, so the previous segment is kept for history.
+    """
+
+    # Records kept in RAM between writes
+    PENDING_RECORDS = 16
+
+    def __init__(self, paths: tuple, compact_size: int):
+        """
+        The constructor for the stat log class.
+
+        Args:
+            paths (tuple): The paths to the two log segments.
+            compact_size (int): Bytes of records in a segment before it is compacted.
+        """
+
+        self._paths = paths
+        self._compact_size = compact_size
+        self._pending = bytearray(RECORD_SIZE * Stat_Log.PENDING_RECORDS)
+        self._pending_count = 0
+
+        # The segment that follows the newest save slot, None until one is found
+        self._segment = None
+        self._size = 0
+        self._torn = False
+
+    # Getter for whether a new save slot is needed
+    @property
+    def needs_snapshot(self) -> bool:
+        """
+        Check if the stats must be saved to a slot before more records are written.
+
+        Returns:
+            bool: True with no current segment, a torn record or a full segment.
+        """
+        return self._segment is None or self._torn or self._size >= self._compact_size
+
+    # Method to find the segment that follows a save slot
+    def open(self, sequence: int):
+        """
+        Find the segment written after a save slot and read its records.
+
+        Args:
+            sequence (int): The sequence number of the save slot that was loaded.
+
+        Returns:
+            tuple: The (hunger, joy, last decay time) of the newest record, where the
+                decay time is None if there was no decay, or None if there are no
+                records.
+        """
+
+        latest = None
+        for segment, path in enumerate(self._paths):
+            if self._read_header(path) != sequence:
+                continue
+
+            self._segment = segment
+            self._size = 0
+            self._torn = False
+            decayed = None
+            buffer = bytearray(RECORD_SIZE * Stat_Log.PENDING_RECORDS)
+            with open(path, "rb") as file:
+                file.seek(HEADER_SIZE)
+                while True:
+                    count = file.readinto(buffer) // RECORD_SIZE
+                    for offset in range(0, count * RECORD_SIZE, RECORD_SIZE):
+                        if buffer[offset + RECORD_SIZE - 1] != _check(buffer, offset):
+                            # Everything after a torn record is left behind
+                            self._torn = True
+                            break
+                        when, event, hunger, joy, _ = struct.unpack_from(
+                            RECORD_FORMAT, buffer, offset
+                        )
+                        if event == EVENT_DECAY:
+                            decayed = when
+                        latest = (hunger, joy, decayed)
+                        self._size += RECORD_SIZE
+                    if self._torn or count < Stat_Log.PENDING_RECORDS:
+                        break
+
+            # Part of a record at the end counts as torn too
+            if os.stat(path)[6] != HEADER_SIZE + self._size:
+                self._torn = True
+            break
+
+        return latest
+
+    # Method to add a record
+    def append(self, when: int, event: int, hunger: int, joy: int) -> bool:
+        """
+        Keep a record in RAM until the next write.
+
+        Args:
+            when (int): The time of the change in seconds.
+            event (int): What changed the stats.
+            hunger (int): The hunger after the change.
+            joy (int): The joy after the change.
+
+        Returns:
+            bool: Whether the pending records are full and should be written.
+        """
+
+        offset = self._pending_count * RECORD_SIZE
+        struct.pack_into(
+            RECORD_FORMAT, self._pending, offset, when, event, hunger, joy, 0
+        )
+        self._pending[offset + RECORD_SIZE - 1] = _check(self._pending, offset)
+        self._pending_count += 1
+        return self._pending_count == Stat_Log.PENDING_RECORDS
+
+    # Method to start the other segment
+    def start_segment(self, sequence: int):
+        """
+        Empty the older segment and make it follow a new save slot.
+
+        Args:
+            sequence (int): The sequence number of the save slot just written.
+        """
+
+        segment = self._older_segment() if self._segment is None else self._segment ^ 1
+        with open(self._paths[segment], "wb") as file:
+            file.write(struct.pack(HEADER_FORMAT, MAGIC, VERSION, sequence))
+        self._segment = segment
+        self._size = 0
+        self._torn = False
+
+    # Method to write the pending records
+    def write(self):
+        """
+        Append the pending records to the current segment in one write.
+        """
+
+        if self._pending_count == 0 or self._segment is None:
+            return
+
+        size = self._pending_count * RECORD_SIZE
+        with open(self._paths[self._segment], "ab") as file:
+            file.write(memoryview(self._pending)[:size])
+        self._size += size
+        self._pending_count = 0
+
+    # Method to read the records since a time
+    def history(self, since: int) -> list:
+        """
+        Get the records written since a time, oldest first.
+
+        Only the records in the time range are read, the start is found with a
+        binary search, so the cost does not grow with the size of the log.
+
+        Args:
+            since (int): The earliest time in seconds.
+
+        Returns:
+            list: (time, event, hunger, joy) tuples.
+        """
+
+        records = []
+        if self._segment is not None:
+            for segment in (self._segment ^ 1, self._segment):
+                self._read_since(self._paths[segment], since, records)
+
+        for offset in range(0, self._pending_count * RECORD_SIZE, RECORD_SIZE):
+            record = struct.unpack_from(RECORD_FORMAT, self._pending, offset)
+            if record[0] >= since:
+                records.append(record[:4])
+
+        return records
+
+    def _read_header(self, path: str):
+        # The save slot sequence number a segment follows, or None
+        try:
+            with open(path, "rb") as file:
+                header = file.read(HEADER_SIZE)
+        except OSError:
+            return None
+
+        if len(header) != HEADER_SIZE:
+            return None
+        magic, version, sequence = struct.unpack(HEADER_FORMAT, header)
+        if magic != MAGIC or version != VERSION:
+            return None
+        return sequence
+
+    def _older_segment(self) -> int:
+        # The segment without a good header, or the one following the older slot
+        first = self._read_header(self._paths[0])
+        second = self._read_header(self._paths[1])
+        if first is None:
+            return 0
+        if second is None:
+            return 1
+
+        # Older by serial number arithmetic, the same as the save slots
+        if 0 < (second - first) & 0xFFFFFFFF < 0x80000000:
+            return 0
+        return 1
+
+    def _read_since(self, path: str, since: int, records: list):
+        if self._read_header(path) is None:
+            return
+
+        count = (os.stat(path)[6] - HEADER_SIZE) // RECORD_SIZE
+        record = bytearray(RECORD_SIZE)
+        with open(path, "rb") as file:
+            # Find the first record at or after the time, torn records sort last
+            low = 0
+            high = count
+            while low < high:
+                middle = (low + high) // 2
+                file.seek(HEADER_SIZE + middle * RECORD_SIZE)
+                file.readinto(record)
+                if (
+                    record[RECORD_SIZE - 1] == _check(record)
+                    and struct.unpack_from("<I", record)[0] < since
+                ):
+                    low = middle + 1
+                else:
+                    high = middle
+
+            file.seek(HEADER_SIZE + low * RECORD_SIZE)
+            data = file.read((count - low) * RECORD_SIZE)
+
+        for offset in range(0, len(data), RECORD_SIZE):
+            if data[offset + RECORD_SIZE - 1] != _check(data, offset):
+                break
+            records.append(struct.unpack_from(RECORD_FORMAT, data, offset)[:4])
@@ -0,0 +1,363 @@
+# !/usr/bin/env python3
+
+"""
+Created by: Mohamad Tanbari
+Created on: October 2026
+The stat store class for the Tomogotchi game.
+"""
+
+import binascii
+import struct
+import time
+
+# import classes
+from Tomogotchi.classes.stat_log import EVENT_CHANGE, EVENT_DECAY, Stat_Log
+
+# A save record is the magic, version, hunger, joy, flags, sequence number and
+# last checked time, followed by a CRC32 of everything before it
+RECORD_FORMAT = "<4sBBBBIq"
+RECORD_BODY_SIZE = struct.calcsize(RECORD_FORMAT)
+RECORD_SIZE = RECORD_BODY_SIZE + 4
+RECORD_MAGIC = b"TSAV"
+RECORD_VERSION = 1
+
+# Set in the flags when last checked holds a time
+FLAG_LAST_CHECKED = 0x01
+
+
+class Stat_Store:
+    """
+    Keep the cat's stats in RAM and write them back to flash lazily.
+
+    Every change is appended to a stat log, and the stats are only saved to a slot
+    when the log is compacted. Saves alternate between two slot files, so a write
+    cut short by a power loss only ever damages the older save. The newest slot with
+    a good CRC wins, and the log written after it brings it up to date.
+    """
+
+    # Default paths to the two save slots
+    SLOT_PATHS = ("Tomogotchi/save_a.bin", "Tomogotchi/save_b.bin")
+
+    # Default paths to the two stat log segments
+    LOG_PATHS = ("Tomogotchi/log_a.bin", "Tomogotchi/log_b.bin")
+
+    # Bytes of records in a log segment before a new slot is saved
+    COMPACT_SIZE = 2048
+
+    # Old JSON save, only read once to move the stats into the slots
+    DATA_PATH = "Tomogotchi/data.json"
+
+    # Stats used when there is no save at all
+    DEFAULT_HUNGER = 50
+    DEFAULT_JOY = 80
+
+    # Default number of seconds between automatic flushes
+    FLUSH_INTERVAL = 30.0
+
+    def __init__(
+        self,
+        slot_paths: tuple = SLOT_PATHS,
+        log_paths: tuple = LOG_PATHS,
+        legacy_path: str = DATA_PATH,
+        compact_size: int = COMPACT_SIZE,
+        flush_interval: float = FLUSH_INTERVAL,
+        read_only: bool = False,
+    ):
+        """
+        The constructor for the stat store class.
+
+        Args:
+            slot_paths (tuple): The paths to the two save slots.
+            log_paths (tuple): The paths to the two stat log segments.
+            legacy_path (str): The path to the old JSON save file.
+            compact_size (int): Bytes of records in a log segment before compacting.
+            flush_interval (float): Seconds between automatic flushes of dirty stats.
+            read_only (bool): Never write to the save file (used for debugging).
+        """
+
+        self._slot_paths = slot_paths
+        self._flush_interval = flush_interval
+        self._read_only = read_only
+        self._dirty = False
+        self._record = bytearray(RECORD_SIZE)
+        self._log = Stat_Log(log_paths, compact_size)
+
+        self._hunger = Stat_Store.DEFAULT_HUNGER
+        self._joy = Stat_Store.DEFAULT_JOY
+        self._last_checked = None
+        self._sequence = 0
+        self._slot = 1
+
+        # Load the newest good slot and the log after it once, every other read
+        # comes from RAM
+        if self._load_slots():
+            latest = self._log.open(self._sequence)
+            if latest is not None:
+                self._hunger, self._joy, decayed = latest
+                if decayed is not None:
+                    self._last_checked = decayed
+        else:
+            self._migrate(legacy_path)
+
+        # The stats the last log record holds
+        self._logged = (self._hunger, self._joy, self._last_checked)
+
+        self._last_flush = time.monotonic()
+
+    # Getter for the joy stat
+    @property
+    def joy(self) -> int:
+        """
+        Get the joy stat.
+
+        Returns:
+            int: The joy stat.
+        """
+        return self._joy
+
+    # Setter for the joy stat
+    @joy.setter
+    def joy(self, value: int):
+        """
+        Set the joy stat.
+
+        Args:
+            value (int): The new joy stat.
+        """
+        if self._joy != value:
+            self._joy = value
+            self._dirty = True
+
+    # Getter for the hunger stat
+    @property
+    def hunger(self) -> int:
+        """
+        Get the hunger stat.
+
+        Returns:
+            int: The hunger stat.
+        """
+        return self._hunger
+
+    # Setter for the hunger stat
+    @hunger.setter
+    def hunger(self, value: int):
+        """
+        Set the hunger stat.
+
+        Args:
+            value (int): The new hunger stat.
+        """
+        if self._hunger != value:
+            self._hunger = value
+            self._dirty = True
+
+    # Getter for the last checked time
+    @property
+    def last_checked(self):
+        """
+        Get the last time the stats were checked.
+
+        Returns:
+            int: The last checked time in whole seconds, or None if it was never saved.
+        """
+        return self._last_checked
+
+    # Setter for the last checked time
+    @last_checked.setter
+    def last_checked(self, value):
+        """
+        Set the last time the stats were checked.
+
+        Args:
+            value: The new last checked time, stored in whole seconds.
+        """
+        self._last_checked = None if value is None else int(value)
+        self._dirty = True
+
+    # Getter for the dirty flag
+    @property
+    def dirty(self) -> bool:
+        """
+        Check if there are changes that have not been written yet.
+
+        Returns:
+            bool: Whether the store has unsaved changes.
+        """
+        return self._dirty
+
+    # Getter for the read only flag
+    @property
+    def read_only(self) -> bool:
+        """
+        Check if the store never writes to the save file.
+
+        Returns:
+            bool: Whether the store is read only.
+        """
+        return self._read_only
+
+    # Setter for the read only flag
+    @read_only.setter
+    def read_only(self, value: bool):
+        """
+        Stop or allow writing to the save file.
+
+        Args:
+            value (bool): Whether the store is read only.
+        """
+        self._read_only = value
+
+    # Method to write the stats to flash
+    def flush(self):
+        """
+        Append any changes to the stat log, saving a slot first when it is full.
+        """
+
+        self._last_flush = time.monotonic()
+
+        if not self._dirty or self._read_only:
+            return
+
+        # Changes made without an event still go in the log
+        self.log(EVENT_CHANGE)
+
+        log = self._log
+        if log.needs_snapshot:
+            self._write_slot()
+            log.start_segment(self._sequence)
+        log.write()
+
+        self._dirty = False
+
+    # Method to record what changed the stats
+    def log(self, event: int):
+        """
+        Add the current stats to the stat log, if they changed since the last record.
+
+        Args:
+            event (int): What changed the stats, one of the stat log events.
+        """
+
+        if self._read_only:
+            return
+
+        logged = (self._hunger, self._joy, self._last_checked)
+        if logged == self._logged:
+            return
+
+        # A decay record carries the new last checked time
+        if logged[2] != self._logged[2]:
+            event = EVENT_DECAY
+        if event == EVENT_DECAY and self._last_checked is not None:
+            when = self._last_checked
+        else:
+            when = int(time.time())
+
+        self._logged = logged
+        self._dirty = True
+        if self._log.append(when, event, self._hunger, self._joy):
+            self.flush()
+
+    # Method to read the stat history
+    def history(self, hours: float) -> list:
+        """
+        Get the stat changes of the last few hours, oldest first.
+
+        Args:
+            hours (float): How many hours back to go.
+
+        Returns:
+            list: (time, event, hunger, joy) tuples.
+        """
+        return self._log.history(int(time.time() - hours * 3600))
+
+    # Method to flush on an interval
+    def update(self):
+        """
+        Flush the stats if the flush interval has passed. Call once per frame.
+        """
+
+        if self._dirty and time.monotonic() - self._last_flush >= self._flush_interval:
+            self.flush()
+
+    def _write_slot(self):
+        # Never overwrite the newest good save
+        self._sequence = (self._sequence + 1) & 0xFFFFFFFF
+        self._slot ^= 1
+
+        flags = 0
+        last_checked = 0
+        if self._last_checked is not None:
+            flags |= FLAG_LAST_CHECKED
+            last_checked = self._last_checked
+
+        record = self._record
+        struct.pack_into(
+            RECORD_FORMAT,
+            record,
+            0,
+            RECORD_MAGIC,
+            RECORD_VERSION,
+            self._hunger,
+            self._joy,
+            flags,
+            self._sequence,
+            last_checked,
+        )
+        struct.pack_into(
+            "<L", record, RECORD_BODY_SIZE, binascii.crc32(record[:RECORD_BODY_SIZE])
+        )
+
+        with open(self._slot_paths[self._slot], "wb") as file:
+            file.write(record)
+
+    def _load_slots(self) -> bool:
+        # Use the good slot with the newest sequence number
+        best = None
+        for slot, path in enumerate(self._slot_paths):
+            try:
+                with open(path, "rb") as file:
+                    record = file.read(RECORD_SIZE)
+            except OSError:
+                continue
+
+            if len(record) != RECORD_SIZE:
+                continue
+            (crc,) = struct.unpack_from("<L", record, RECORD_BODY_SIZE)
+            if crc != binascii.crc32(record[:RECORD_BODY_SIZE]):
+                continue
+            fields = struct.unpack_from(RECORD_FORMAT, record)
+            if fields[0] != RECORD_MAGIC or fields[1] != RECORD_VERSION:
+                continue
+
+            # Newer by serial number arithmetic, so wrapping around still works
+            if best is None or 0 < (fields[5] - best[1][5]) & 0xFFFFFFFF < 0x80000000:
+                best = (slot, fields)
+
+        if best is None:
+            return False
+
+        slot, (_, _, hunger, joy, flags, sequence, last_checked) = best
+        self._slot = slot
+        self._sequence = sequence
+        self._hunger = hunger
+        self._joy = joy
+        self._last_checked = last_checked if flags & FLAG_LAST_CHECKED else None
+        return True
+
+    def _migrate(self, legacy_path: str):
+        # Bring the stats over from the old JSON save, the next flush writes a slot
+        try:
+            import json
+
+            with open(legacy_path, "r") as file:
+                data = json.load(file)
+        except (OSError, ValueError):
+            return
+
+        self._hunger = int(data.get("hunger", self._hunger))
+        self._joy = int(data.get("joy", self._joy))
+        last_checked = data.get("last_checked")
+        self._last_checked = None if last_checked is None else int(last_checked)
+        self._dirty = True
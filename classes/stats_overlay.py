@@ -0,0 +1,132 @@
+# !/usr/bin/env python3
+
+"""
+Created by: Mohamad Tanbari
+Created on: October 2026
+The stats overlay class for the Tomogotchi game.
+"""
+
+import stage
+
+
+class Stats_Overlay:
+    """
+    The hunger and joy readout, only redrawing the characters that change.
+    """
+
+    # Characters in the longest line, "Hunger: 100/100"
+    WIDTH = 15
+
+    # Pixels between the tops of the two lines
+    LINE_HEIGHT = 12
+
+    def __init__(self, x: int, y: int):
+        """
+        The constructor for the stats overlay class.
+
+        Args:
+            x (int): The x position of the readout.
+            y (int): The y position of the hunger line.
+        """
+
+        self._x = x
+        self._y = y
+        self._lines = []
+        self._written = []
+        for _ in range(2):
+            line = stage.Text(width=Stats_Overlay.WIDTH, height=1)
+            line.move(255, 255)
+            self._lines.append(line)
+            self._written.append("")
+
+        self.showing = False
+
+        # Layers to add to the stage
+        self.layers = list(self._lines)
+
+    # Method to show the readout
+    def show(self, game, hunger: int, joy: int):
+        """
+        Show the readout and draw only the area it covers.
+
+        Args:
+            game (stage.Stage): The stage the readout is drawn on.
+            hunger (int): The hunger to show.
+            joy (int): The joy to show.
+        """
+
+        self._write(0, "Hunger: " + str(hunger) + "/100")
+        self._write(1, "Joy: " + str(joy) + "/100")
+        for index, line in enumerate(self._lines):
+            line.move(self._x, self._y + index * Stats_Overlay.LINE_HEIGHT)
+        self.showing = True
+        self._render(game)
+
+    # Method to hide the readout
+    def hide(self, game):
+        """
+        Hide the readout and draw only the area it covered.
+
+        Args:
+            game (stage.Stage): The stage the readout is drawn on.
+        """
+
+        for line in self._lines:
+            line.move(255, 255)
+        self.showing = False
+        self._render(game)
+
+    # Method to keep the readout up to date
+    def update(self, game, hunger: int, joy: int):
+        """
+        Redraw the characters of the values that changed while showing.
+
+        Args:
+            game (stage.Stage): The stage the readout is drawn on.
+            hunger (int): The hunger to show.
+            joy (int): The joy to show.
+        """
+
+        if not self.showing:
+            return
+
+        for index, text in enumerate(
+            ("Hunger: " + str(hunger) + "/100", "Joy: " + str(joy) + "/100")
+        ):
+            changed = self._write(index, text)
+            if changed is None:
+                continue
+            first, last = changed
+            y = self._y + index * Stats_Overlay.LINE_HEIGHT
+            game.render_block(self._x + first * 8, y, self._x + (last + 1) * 8, y + 8)
+
+    def _write(self, index: int, text: str):
+        # Compare with what the line already shows and only write the difference
+        written = self._written[index]
+        if text == written:
+            return None
+
+        line = self._lines[index]
+        first = None
+        last = 0
+        for column in range(max(len(text), len(written))):
+            new = text[column] if column < len(text) else " "
+            old = written[column] if column < len(written) else " "
+            if new != old:
+                line.char(column, 0, new)
+                if first is None:
+                    first = column
+                last = column
+
+        self._written[index] = text
+        if first is None:
+            return None
+        return first, last
+
+    def _render(self, game):
+        game.render_block(
+            self._x,
+            self._y,
+            self._x + Stats_Overlay.WIDTH * 8,
+            self._y + Stats_Overlay.LINE_HEIGHT + 8,
+        )
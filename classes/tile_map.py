@@ -0,0 +1,153 @@
+# !/usr/bin/env python3
+
+"""
+Created by: Mohamad Tanbari
+Created on: October 2026
+Tile maps stored as packed bytes, the same layout stage.Grid keeps in memory.
+"""
+
+import struct
+
+# The file starts with the magic, version, size in tiles and flags
+HEADER_FORMAT = "<4sBBBB"
+HEADER_SIZE = struct.calcsize(HEADER_FORMAT)
+MAGIC = b"TMAP"
+VERSION = 1
+
+# The tiles are run length encoded as (count, byte) pairs
+FLAG_RLE = 0x01
+
+
+def buffer_size(width: int, height: int) -> int:
+    """
+    Get the bytes a Grid of this size uses, two tiles per byte.
+
+    Args:
+        width (int): The width in tiles.
+        height (int): The height in tiles.
+
+    Returns:
+        int: The size of the buffer.
+    """
+    return (((width + 1) & 0xFE) * height) >> 1
+
+
+def pack_tiles(rows: list) -> bytearray:
+    """
+    Pack rows of tile numbers into a Grid buffer.
+
+    Args:
+        rows (list): A list of rows, each a list of tile numbers from 0 to 15.
+
+    Returns:
+        bytearray: The packed tiles.
+    """
+
+    height = len(rows)
+    width = len(rows[0])
+    stride = (width + 1) & 0xFE
+    buffer = bytearray(buffer_size(width, height))
+    for y, row in enumerate(rows):
+        for x, tile in enumerate(row):
+            index = (y * stride + x) >> 1
+            if x & 0x01:
+                buffer[index] |= tile
+            else:
+                buffer[index] |= tile << 4
+    return buffer
+
+
+def rle_encode(data) -> bytearray:
+    """
+    Run length encode bytes as (count, byte) pairs.
+
+    Args:
+        data: The bytes to encode.
+
+    Returns:
+        bytearray: The encoded bytes.
+    """
+
+    encoded = bytearray()
+    index = 0
+    while index < len(data):
+        value = data[index]
+        count = 1
+        while (
+            index + count < len(data) and data[index + count] == value and count < 255
+        ):
+            count += 1
+        encoded.append(count)
+        encoded.append(value)
+        index += count
+    return encoded
+
+
+def rle_decode(data, buffer, start: int = 0):
+    """
+    Decode (count, byte) pairs into a buffer that is already the right size.
+
+    Args:
+        data: The encoded bytes.
+        buffer (bytearray): The buffer to fill.
+        start (int): Where the pairs start in data.
+    """
+
+    index = 0
+    for offset in range(start, len(data) - 1, 2):
+        count = data[offset]
+        buffer[index : index + count] = bytes((data[offset + 1],)) * count
+        index += count
+
+
+def encode_tile_map(rows: list, rle: bool = True) -> bytes:
+    """
+    Make the contents of a tile map file.
+
+    Args:
+        rows (list): A list of rows, each a list of tile numbers from 0 to 15.
+        rle (bool): Run length encode the tiles.
+
+    Returns:
+        bytes: The file contents.
+    """
+
+    tiles = pack_tiles(rows)
+    flags = 0
+    if rle:
+        encoded = rle_encode(tiles)
+        # Only keep the encoding when it is smaller
+        if len(encoded) < len(tiles):
+            tiles = encoded
+            flags |= FLAG_RLE
+
+    header = struct.pack(HEADER_FORMAT, MAGIC, VERSION, len(rows[0]), len(rows), flags)
+    return header + bytes(tiles)
+
+
+def load_tile_map(path: str) -> tuple:
+    """
+    Load a tile map file into a buffer that can be given straight to stage.Grid.
+
+    Args:
+        path (str): The path to the tile map file.
+
+    Returns:
+        tuple: (width, height, buffer).
+    """
+
+    with open(path, "rb") as file:
+        data = file.read()
+
+    magic, version, width, height, flags = struct.unpack_from(HEADER_FORMAT, data)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError("Not a tile map: " + path)
+
+    buffer = bytearray(buffer_size(width, height))
+    if flags & FLAG_RLE:
+        rle_decode(data, buffer, HEADER_SIZE)
+    else:
+        buffer[:] = data[HEADER_SIZE : HEADER_SIZE + len(buffer)]
+
+    return width, height, buffer
+
@@ -0,0 +1,270 @@
+# !/usr/bin/env python3
+
+"""
+Created by: Mohamad Tanbari
+Created on: October 2026
+Fast forward the cat without stepping every frame.
+"""
+
+# import constants
+from .. import constants
+import math
+import random
+
+# Cat.update swaps the walk frame once every this many walking frames
+WALK_ANIMATION_FRAMES = 6
+
+
+def decay_stats(hunger: int, joy: int, seconds: float) -> tuple:
+    """
+    Lower the stats by the time that has passed.
+
+    Args:
+        hunger (int): The hunger before the time passed.
+        joy (int): The joy before the time passed.
+        seconds (float): The seconds that passed.
+
+    Returns:
+        tuple: The new (hunger, joy), never below 0.
+    """
+
+    hunger -= math.floor(
+        seconds / constants.HUNGER_DECAY_SECONDS * constants.HUNGER_DECAY
+    )
+    joy -= math.floor(seconds / constants.JOY_DECAY_SECONDS * constants.JOY_DECAY)
+
+    if hunger < 0:
+        hunger = 0
+    if joy < 0:
+        joy = 0
+
+    return hunger, joy
+
+
+class Pet_State:
+    """
+    Everything about the cat that changes over time, without any sprites.
+    """
+
+    def __init__(
+        self,
+        x: int,
+        y: int,
+        hunger: int,
+        joy: int,
+        left: int,
+        right: int,
+        width: int,
+    ):
+        """
+        The constructor for the pet state class.
+
+        Args:
+            x (int): The x position of the cat.
+            y (int): The y position of the cat.
+            hunger (int): The hunger level of the cat.
+            joy (int): The joy level of the cat.
+            left (int): The farthest the cat can go left.
+            right (int): The farthest the cat can go right.
+            width (int): The width of the cat in pixels.
+        """
+
+        self.x = x
+        self.y = y
+        self.hunger = hunger
+        self.joy = joy
+        self.left = left
+        self.right = right
+        self.width = width
+        self.facing = "left"
+        self.direction = 1
+        self.walk_speed = 1
+        self.walk_distance = 0
+        self.frame_counter = 0
+        self.tracked_frame = 0
+        self.emote = None
+        self.emote_duration = 0
+
+
+class Time_Lapse:
+    """
+    Advance a pet state with closed form maths and sampled random events.
+    """
+
+    # Lapses longer than this many frames only simulate the end of the lapse,
+    # the walk and emotes forget where they started long before then
+    HORIZON = 18000
+
+    def __init__(self, fps: int = constants.FPS, rng=random):
+        """
+        The constructor for the time lapse class.
+
+        Args:
+            fps (int): The frames per second of the game.
+            rng: The random number generator, the random module by default.
+        """
+
+        self._fps = fps
+        self._rng = rng
+
+    # Method to fast forward by seconds
+    def advance_seconds(self, state: Pet_State, seconds: float, decay: bool = True):
+        """
+        Advance the state by a number of seconds.
+
+        Args:
+            state (Pet_State): The state to change.
+            seconds (float): The seconds to advance.
+            decay (bool): Lower the stats over the time as well.
+        """
+
+        self.advance_frames(state, int(seconds * self._fps), decay)
+
+    # Method to fast forward by frames
+    def advance_frames(self, state: Pet_State, frames: int, decay: bool = True):
+        """
+        Advance the state by a number of frames.
+
+        Args:
+            state (Pet_State): The state to change.
+            frames (int): The frames to advance.
+            decay (bool): Lower the stats over the time as well.
+        """
+
+        if frames <= 0:
+            return
+
+        hunger = state.hunger
+        joy = state.joy
+        skipped = 0
+
+        # Only the end of a long lapse matters, finish the current walk and skip ahead
+        if frames > Time_Lapse.HORIZON:
+            if state.walk_distance > 0:
+                self._walk(state, state.walk_distance)
+                state.walk_distance = 0
+            state.emote = None
+            state.emote_duration = 0
+            skipped = frames - Time_Lapse.HORIZON
+            frames = Time_Lapse.HORIZON
+
+        self._advance_walks(state, frames)
+        self._advance_emotes(state, frames, skipped, hunger, joy, decay)
+
+        if decay:
+            state.hunger, state.joy = decay_stats(
+                hunger, joy, (skipped + frames) / self._fps
+            )
+
+    def _advance_walks(self, state: Pet_State, frames: int):
+        rng = self._rng
+        chance = 1 / constants.WALK_CHANCE
+        log_miss = math.log(1 - chance)
+        done = 0
+
+        while done < frames:
+            # Finish the current walk, the next walk is checked on its last frame
+            if state.walk_distance > 0:
+                steps = min(state.walk_distance, frames - done)
+                self._walk(state, steps)
+                state.walk_distance -= steps
+                done += steps
+                if state.walk_distance > 0:
+                    return
+                check_frame = done - 1
+            else:
+                check_frame = done
+
+            # Frames until the 1 in WALK_CHANCE roll succeeds
+            tries = int(math.log(1 - rng.random()) / log_miss) + 1
+            start_frame = check_frame + tries - 1
+            if start_frame >= frames:
+                return
+
+            state.direction = -1 if rng.randint(0, 1) == 0 else 1
+            state.walk_distance = rng.randint(
+                constants.WALK_DISTANCE_MIN, constants.WALK_DISTANCE_MAX
+            )
+            done = start_frame + 1
+
+    def _walk(self, state: Pet_State, steps: int):
+        low = state.left + 1
+        high = state.right - state.width - 1
+        span = high - low + 1
+
+        if state.walk_speed == 1 and low <= state.x <= high:
+            # Walking back and forth is a loop of 2 * span positions
+            if state.direction == 1:
+                phase = state.x - low
+            else:
+                phase = span + high - state.x
+            phase = (phase + steps) % (2 * span)
+
+            if phase < span:
+                state.x = low + phase
+                state.direction = 1
+            else:
+                state.x = high - (phase - span)
+                state.direction = -1
+        else:
+            # Outside the loop, step the same way Cat.update does
+            for _ in range(steps):
+                state.x += state.walk_speed * state.direction
+                if state.x <= state.left or state.x + state.width >= state.right:
+                    state.direction *= -1
+                    state.x += state.walk_speed * state.direction
+
+        state.facing = "right" if state.direction == 1 else "left"
+
+        # Walk animation
+        total = state.frame_counter + steps
+        if (total // WALK_ANIMATION_FRAMES) & 1:
+            state.tracked_frame ^= 1
+        state.frame_counter = total % WALK_ANIMATION_FRAMES
+
+    def _advance_emotes(
+        self,
+        state: Pet_State,
+        frames: int,
+        skipped: int,
+        hunger: int,
+        joy: int,
+        decay: bool,
+    ):
+        rng = self._rng
+        chance = 1 / constants.REACT_CHANCE
+        log_miss = math.log(1 - chance)
+
+        # The frame the current emote runs out on
+        emote = state.emote
+        emote_end = state.emote_duration - 1
+        frame = -1
+
+        while True:
+            frame += int(math.log(1 - rng.random()) / log_miss) + 1
+            if frame >= frames:
+                break
+
+            # A reaction only shows when no emote is showing
+            if frame < emote_end:
+                continue
+
+            if decay:
+                hunger_now, joy_now = decay_stats(
+                    hunger, joy, (skipped + frame + 1) / self._fps
+                )
+            else:
+                hunger_now, joy_now = hunger, joy
+
+            if hunger_now < 30:
+                emote = 2
+            elif joy_now < 30:
+                emote = 1
+            elif joy_now > 70:
+                emote = 0
+            else:
+                continue
+            emote_end = frame + constants.REACT_EMOTE_DURATION
+
+        state.emote_duration = max(0, emote_end - (frames - 1))
+        state.emote = emote if state.emote_duration > 0 else None
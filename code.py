@@ -7,11 +7,21 @@ Tomogotchi :)
 """
 
 import time
-import stage
-import supervisor
-import ugame
 
-# Scenes
+# Boot starts here, time to first pixel is measured from this point
+boot_ns = time.monotonic_ns()
+
+from Tomogotchi import constants
+
+# Time every import from here on when profiling
+import_profiler = None
+if constants.PROFILE_IMPORTS:
+    from Tomogotchi.classes.import_profiler import Import_Profiler
+
+    import_profiler = Import_Profiler(boot_ns)
+    import_profiler.install()
+
+# Scenes, the game scene is only loaded once the splash screen is showing
 from Tomogotchi.scenes.splash import splash_scene
 
-splash_scene()
+splash_scene(import_profiler)
@@ -17,16 +17,49 @@ OFF_SCREEN_Y = 255
 FRICTION = 0.98
 GRAVITY = 0.1
 
+# Sprite rotation that mirrors a tile left to right
+MIRROR_ROTATION = 4
+
+# Top and bottom of the room items bounce in
+CEILING_Y = 16
+FLOOR_Y = 80
+
 # Other stuff
 FPS = 60
 
-# Using for button state
-button_state = {
-    "button_up": "up",
-    "button_just_pressed": "just pressed",
-    "button_still_pressed": "still pressed",
-    "button_released": "released",
-}
+# Draws per second while the cat, the toy and the buttons are all still
+IDLE_FPS = 15
+
+# Stats drop by this much for every period (in seconds) that passes
+HUNGER_DECAY = 20
+HUNGER_DECAY_SECONDS = 86400
+JOY_DECAY = 20
+JOY_DECAY_SECONDS = 14400
+
+# The cat starts a walk on one in this many idle frames
+WALK_CHANCE = 130
+WALK_DISTANCE_MIN = 30
+WALK_DISTANCE_MAX = 70
+
+# Holding STAT this many frames keeps the stats showing until it is pressed again
+STAT_PIN_FRAMES = 60
+
+# The cat reacts to its stats on one in this many frames
+REACT_CHANCE = 600
+REACT_EMOTE_DURATION = 100
+
+# Time each phase of the game loop (START shows the frame time)
+PROFILE_FRAMES = False
+
+# Time and weigh every import during boot and print a report
+PROFILE_IMPORTS = False
+
+# Print the heap in use at every scene change
+PROFILE_HEAP = False
+
+# Record the buttons to this file, or replay them from it (None turns it off)
+RECORD_INPUT_PATH = None
+REPLAY_INPUT_PATH = None
 
 # pallets for filled text
 WHITE_BLACK_PALETTE = (
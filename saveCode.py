@@ -3,52 +3,141 @@
 # This script moves everything inside of there into the Tomogotchi folder inside of the PyBadge
 # Done to conserve space on the PyBadge and to speed up github actions
 
-# Copy everything in this directory aside from restricted files to the PyBadge
+# Only files whose contents changed since the last deploy are copied, a manifest of
+# hashes on the PyBadge remembers what was copied last time
 
+import hashlib
+import json
 import os
-import shutil
+import subprocess
+import sys
+import time
+
+# Name of the manifest kept in the Tomogotchi folder on the PyBadge
+MANIFEST_NAME = ".deploy_manifest.json"
+
+# Top level items that never go to the PyBadge
+SKIPPED_PREFIXES = (".git", ".vscode", "saveCode", "design", "sim")
+
+
+def hash_file(path):
+    # Hash the contents of a file
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        for chunk in iter(lambda: file.read(65536), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def list_source_files(src):
+    # Map the relative path of every file to deploy to its hash
+    files = {}
+    for item in os.listdir(src):
+        if item.startswith(SKIPPED_PREFIXES) or item == "__pycache__":
+            continue
+        src_path = os.path.join(src, item)
+        if os.path.isdir(src_path):
+            for root, dirs, names in os.walk(src_path):
+                dirs[:] = [name for name in dirs if name != "__pycache__"]
+                for name in names:
+                    path = os.path.join(root, name)
+                    relative_path = os.path.relpath(path, src).replace(os.sep, "/")
+                    files[relative_path] = hash_file(path)
+        else:
+            files[item] = hash_file(src_path)
+    return files
+
+
+def load_manifest(dst):
+    # Read the hashes copied on the last deploy, empty if there was none
+    try:
+        with open(os.path.join(dst, MANIFEST_NAME), "r") as file:
+            return json.load(file)
+    except (OSError, ValueError):
+        return {}
+
+
+def write_atomic(path, data):
+    # Write a file next to its destination and rename it, so it is never half written
+    temp_path = path + ".tmp"
+    with open(temp_path, "wb") as file:
+        file.write(data)
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(temp_path, path)
 
 
 def copy_to_circuitpy(src, dst):
+    start = time.perf_counter()
+
     # Ensure the destination directory exists
     if not os.path.exists(dst):
         os.makedirs(dst)
 
-    # Get the list of files and directories in the source directory
-    src_items = set(os.listdir(src))
+    source = list_source_files(src)
+    manifest = load_manifest(dst)
 
-    # Get the list of files and directories in the destination directory
-    dst_items = set(os.listdir(dst))
+    copied = 0
+    copied_bytes = 0
+    unchanged = 0
+    deleted = 0
 
-    # Copy new and updated files from src to dst
-    for item in src_items:
-        if (
-            item.startswith(".git")
-            or item.startswith(".vscode")
-            or item.startswith("saveCode")
-            or item.startswith("design")
-        ):
+    # Copy the files that are new or changed, or missing from the PyBadge
+    for relative_path, digest in sorted(source.items()):
+        dst_path = os.path.join(dst, *relative_path.split("/"))
+        if manifest.get(relative_path) == digest and os.path.exists(dst_path):
+            unchanged += 1
             continue
-        src_path = os.path.join(src, item)
-        dst_path = os.path.join(dst, item)
-        if os.path.isdir(src_path):
-            shutil.copytree(src_path, dst_path, dirs_exist_ok=True)
-        else:
-            shutil.copy2(src_path, dst_path)
 
-    # Remove files and directories in dst that are not in src
-    for item in dst_items - src_items:
-        dst_path = os.path.join(dst, item)
-        if os.path.isdir(dst_path):
-            shutil.rmtree(dst_path)
-        else:
+        with open(os.path.join(src, *relative_path.split("/")), "rb") as file:
+            data = file.read()
+        os.makedirs(os.path.dirname(dst_path), exist_ok=True)
+        write_atomic(dst_path, data)
+        copied += 1
+        copied_bytes += len(data)
+
+    # Remove only the files the last deploy copied that no longer exist here
+    for relative_path in sorted(set(manifest) - set(source)):
+        dst_path = os.path.join(dst, *relative_path.split("/"))
+        if os.path.exists(dst_path):
             os.remove(dst_path)
+            deleted += 1
+
+        # Remove folders left empty
+        folder = os.path.dirname(dst_path)
+        while folder != dst and os.path.isdir(folder) and not os.listdir(folder):
+            os.rmdir(folder)
+            folder = os.path.dirname(folder)
+
+    # Save the manifest last, an interrupted deploy copies again next time
+    write_atomic(
+        os.path.join(dst, MANIFEST_NAME),
+        json.dumps(source, indent=0, sort_keys=True).encode(),
+    )
+
+    elapsed = (time.perf_counter() - start) * 1000
+    print(
+        "Copied {} files ({} bytes), {} unchanged, {} deleted in {:.0f} ms".format(
+            copied, copied_bytes, unchanged, deleted, elapsed
+        )
+    )
 
 
 if __name__ == "__main__":
     src_directory = os.getcwd()
     dst_directory = "/Volumes/CIRCUITPY/Tomogotchi"
+
+    # Pack the BMPs so the PyBadge does not have to decode them, and copy nothing
+    # if that fails so the PyBadge and its manifest stay as they were
+    try:
+        subprocess.run(
+            [sys.executable, os.path.join("sim", "compile_assets.py")], check=True
+        )
+    except (OSError, subprocess.CalledProcessError) as error:
+        print("Compiling the assets failed, nothing was copied: {}".format(error))
+        sys.exit(1)
+
     try:
         copy_to_circuitpy(src_directory, dst_directory)
-    except error:
+    except OSError as error:
         print(error)
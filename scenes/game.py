@@ -9,18 +9,31 @@ Splash game/menu scene for the Tomogotchi game
 # Import constants
 from .. import constants
 import stage
-import supervisor
 import ugame
-import time
 import random
 
 # Import classes
-from ..classes.meta_sprite import Meta_Sprite
 from ..classes.button import Button
 from ..classes.cat import Cat
+from ..classes.collision import LAYER_CAT, LAYER_ITEM, Collider, Collision_World
+from ..classes.frame_scheduler import Frame_Scheduler
+from ..classes.input_manager import Input_Manager
+from ..classes.physics import FIXED_ONE, Physics_Body, Physics_World
+from ..classes.render_list import Render_Item, Render_List
+from ..classes.scene_manager import Scene, Scene_Manager
+from ..classes.stat_log import EVENT_FEED, EVENT_PLAY, EVENT_TOY
+from ..classes.stats_overlay import Stats_Overlay
+from ..classes.tile_map import load_tile_map
 
-# Import utils
-from ..utils.update_button_state import update_button_state
+# Image banks owned by the scene
+BACKGROUND_BMP_PATH = "./Tomogotchi/assets/game_scene_background.bmp"
+EXTRAS_BMP_PATH = "./Tomogotchi/assets/extras.bmp"
+
+# Tile map of the room, compiled from design/game_scene_background.csv
+BACKGROUND_MAP_PATH = "./Tomogotchi/assets/game_scene_background.tmap"
+
+# Phases of the game loop timed by the frame profiler
+FRAME_PHASES = ["input", "buttons", "collide", "toy", "cat", "render", "tick"]
 
 
 def game_scene():
@@ -28,229 +41,437 @@ def game_scene():
     The game scene of the game.
     """
 
-    try:
+    Scene_Manager().run(Game_Scene())
+
+
+class Game_Scene(Scene):
+    """
+    The room where the cat lives.
+    """
+
+    def __init__(self):
+        """
+        The constructor for the game scene class.
+        """
+
+        super().__init__()
+
+        # The buttons and the cat take their own banks, set once they are loaded
+        self.feed_button = None
+        self.play_button = None
+        self.stat_button = None
+        self.cat = None
+
+    # Method to load the scene
+    def load(self):
+        """
+        Load the scene, yielding between slices.
+        """
+
         # load image banks
-        background_bank = stage.Bank.from_bmp16(
-            "./Tomogotchi/assets/game_scene_background.bmp"
+        background_bank = self.use_bank(BACKGROUND_BMP_PATH)
+
+        yield
+
+        # The tile map is already packed the way the Grid stores it
+        width, height, tiles = load_tile_map(BACKGROUND_MAP_PATH)
+        self.background = stage.Grid(background_bank, width, height, buffer=tiles)
+
+        yield
+
+        # Seed the random numbers from the recording so a replay makes the same choices
+        self.player = None
+        recording_seed = None
+        if constants.REPLAY_INPUT_PATH:
+            from ..classes.input_recorder import Input_Player
+
+            self.player = Input_Player(constants.REPLAY_INPUT_PATH)
+            random.seed(self.player.seed)
+        elif constants.RECORD_INPUT_PATH:
+            recording_seed = random.getrandbits(32)
+            random.seed(recording_seed)
+
+        # Initialize buttons
+        self.buttons = Input_Manager()
+
+        self.feed_button = Button(16, (6 * 16), 0)
+        self.play_button = Button((16 * 4), (6 * 16), 1)
+        self.stat_button = Button((16 * 7), (6 * 16), 2)
+
+        yield
+
+        # Initialize the cat
+        self.cat = Cat(56, 16 * 3, 0)
+
+        # A replay starts from the recorded stats, a recording saves the current ones
+        self.recorder = None
+        if self.player:
+            self.cat.replay_stats(self.player.hunger, self.player.joy)
+        elif recording_seed is not None:
+            from ..classes.input_recorder import Input_Recorder
+
+            self.recorder = Input_Recorder(
+                constants.RECORD_INPUT_PATH,
+                recording_seed,
+                self.cat.hunger,
+                self.cat.joy,
+            )
+
+        yield
+
+        # Initialize the text
+        self.stats = Stats_Overlay(16, 16)
+        self.stats_pinned = False
+        self.text = list(self.stats.layers)
+
+        # Create food and toy
+        extras_bank = self.use_bank(EXTRAS_BMP_PATH)
+        self.food = stage.Sprite(extras_bank, 0, 255, 255)
+        self.toy = stage.Sprite(extras_bank, 1, 255, 255)
+
+        yield
+
+        # Variables to track the toy
+        self.toy_counter = 0
+
+        # The toy bounces around the room the cat walks in
+        self.world = Physics_World(
+            Cat.LEFT_BOUNDARY,
+            Cat.RIGHT_BOUNDARY,
+            constants.CEILING_Y,
+            constants.FLOOR_Y,
         )
-        test_bank = stage.Bank.from_bmp16("./Tomogotchi/assets/buttons.bmp")
-    except Exception as e:
-        print(f"Error loading image banks: {e}")
-        return
-
-    tile_map = [
-        [0, 1, 1, 1, 1, 1, 1, 1, 1, 2],
-        [3, 4, 4, 4, 4, 4, 4, 4, 4, 5],
-        [3, 4, 4, 4, 4, 4, 4, 4, 4, 5],
-        [3, 4, 4, 4, 4, 4, 4, 4, 4, 5],
-        [3, 7, 7, 7, 7, 7, 7, 7, 7, 5],
-        [3, 6, 6, 6, 6, 6, 6, 6, 6, 5],
-        [3, 4, 4, 6, 4, 4, 6, 4, 4, 5],
-        [8, 9, 9, 9, 9, 9, 9, 9, 9, 10],
-    ]
-
-    background = stage.Grid(
-        background_bank, constants.SCREEN_GRID_X, constants.SCREEN_GRID_Y
-    )
-
-    # Fill background using tile map
-    for row in range(0, 8):
-        for col in range(0, 10):
-            background.tile(col, row, tile_map[row][col])
-
-    # Initialize buttons
-    down = constants.button_state["button_up"]
-    up = constants.button_state["button_up"]
-    left = constants.button_state["button_up"]
-    right = constants.button_state["button_up"]
-
-    feed_button = Button(16, (6 * 16), 0)
-    play_button = Button((16 * 4), (6 * 16), 1)
-    stat_button = Button((16 * 7), (6 * 16), 2)
-
-    button_sprites = (
-        stat_button._tile_list + play_button._tile_list + feed_button._tile_list
-    )
-
-    # Initialize the cat
-    cat = Cat(56, 16 * 3, 0)
-
-    # Initialize the text
-    text = []
-    hunger = stage.Text(
-        width=29,
-        height=14,
-    )
-    hunger.move(255, 255)
-    hunger.text("Hunger: " + str(cat.hunger) + "/100")
-    text.append(hunger)
-
-    joy = stage.Text(
-        width=29,
-        height=14,
-    )
-    joy.move(255, 255)
-    joy.text("Joy: " + str(cat.joy) + "/100")
-    text.append(joy)
-
-    # Create food and toy
-    extras_bank = stage.Bank.from_bmp16("./Tomogotchi/assets/extras.bmp")
-    food = stage.Sprite(extras_bank, 0, 255, 255)
-    toy = stage.Sprite(extras_bank, 1, 255, 255)
-
-    # Variables to track the toy
-    toy_counter = 0
-    toy_velocity_x = 0
-    toy_velocity_y = 0
-
-    game = stage.Stage(ugame.display, constants.FPS)
-    game.layers = text + cat._tile_list + [food, toy] + button_sprites + [background]
-    game.render_block()
-
-    # Game loop
-    while True:
-        # get user input
-        keys = ugame.buttons.get_pressed()
+        self.toy_body = Physics_Body(self.toy)
+        self.world.add(self.toy_body)
 
-        # Track button data
-        right = update_button_state(keys, right, ugame.K_RIGHT)
-        left = update_button_state(keys, left, ugame.K_LEFT)
-        down = update_button_state(keys, down, ugame.K_DOWN)
+        # Hitboxes, only the cat and the items collide
+        self.collisions = Collision_World()
+        self.cat_collider = Collider(
+            self.cat, Cat.WIDTH, Cat.HEIGHT, LAYER_CAT, LAYER_ITEM
+        )
+        self.collisions.add(self.cat_collider)
+
+        # The food never moves by itself and the toy sleeps with its body, so
+        # only the cat walking into them is checked while they rest
+        self.collisions.add(
+            Collider(
+                self.food,
+                16,
+                16,
+                LAYER_ITEM,
+                LAYER_CAT,
+                on_enter=self._eat_food,
+                sleeping=True,
+            )
+        )
+        self.collisions.add(
+            Collider(
+                self.toy,
+                16,
+                16,
+                LAYER_ITEM,
+                LAYER_CAT,
+                on_enter=self._kick_toy,
+                on_stay=self._kick_toy,
+                body=self.toy_body,
+            )
+        )
 
-        # Testing
-        up = update_button_state(keys, up, ugame.K_UP)
+        # The sprite groups on screen, only changed when one moves on or off it
+        self.render_list = Render_List()
+        self.food_item = Render_Item(self.food)
+        self.toy_item = Render_Item(self.toy)
+        self.render_list.add(self.stat_button)
+        self.render_list.add(self.play_button)
+        self.render_list.add(self.feed_button)
+        self.cat.add_to(self.render_list)
+        self.render_list.add(self.food_item)
+        self.render_list.add(self.toy_item)
+
+        # Frame profiler, only loaded when profiling is turned on
+        self.profiler = None
+        if constants.PROFILE_FRAMES:
+            from ..classes.frame_profiler import Frame_Profiler
+
+            self.profiler = Frame_Profiler(FRAME_PHASES)
+            self.text.append(self.profiler.text)
+
+            # Only the profiled loop checks the profiler
+            self.update = self._update_profiled
+
+        self.layers = (
+            self.text
+            + self.cat._tile_list
+            + [self.food, self.toy]
+            + self.stat_button._tile_list
+            + self.play_button._tile_list
+            + self.feed_button._tile_list
+            + [self.background]
+        )
 
-        # Button functionality
-        if left == constants.button_state["button_just_pressed"]:
-            feed_button.press()
+    # Method to show the scene
+    def enter(self, manager):
+        """
+        Draw the scene.
 
-            random_x = random.randint(cat.LEFT_BOUNDARY, cat.RIGHT_BOUNDARY - 16)
+        Args:
+            manager (Scene_Manager): The scene manager.
+        """
 
-            # Ensure food doesn't appear inside the cat
-            while (
-                cat.x < random_x + 16
-                and cat.x + 48 > random_x
-                and cat.y < 16 * 4 + 16
-                and cat.y + 32 > 16 * 4
-            ):
-                random_x = random.randint(cat.LEFT_BOUNDARY, cat.RIGHT_BOUNDARY - 16)
+        self.game = stage.Stage(ugame.display, constants.FPS)
+        self.game.layers = self.layers
+        self.game.render_block()
 
-            # move the food sprite away from the cat but still on screen
-            food.move(random_x, 16 * 4)
-        elif left == constants.button_state["button_released"]:
-            feed_button.release()
+        # The logic runs at FPS, drawing slows to IDLE_FPS when nothing moves
+        self.scheduler = Frame_Scheduler(constants.FPS, constants.IDLE_FPS)
+        self.keys = 0
 
-        if down == constants.button_state["button_just_pressed"]:
-            play_button.press()
+    # Method to run one frame
+    def update(self, manager):
+        """
+        Run the logic steps that are due, then draw what changed.
 
-            random_x = random.randint(cat.LEFT_BOUNDARY, cat.RIGHT_BOUNDARY - 16)
+        Args:
+            manager (Scene_Manager): The scene manager.
+        """
 
-            # Ensure food doesn't appear inside the cat
-            while (
-                cat.x < random_x + 16
-                and cat.x + 48 > random_x
-                and cat.y < 16 * 4 + 16
-                and cat.y + 32 > 16 * 4
-            ):
-                random_x = random.randint(cat.LEFT_BOUNDARY, cat.RIGHT_BOUNDARY - 16)
-
-            # move the food sprite away from the cat but still on screen
-            toy.move(random_x, 16 * 4)
-
-            if toy_counter < 0:
-                toy_counter = 0
-                cat.joy += 30
-        elif down == constants.button_state["button_released"]:
-            play_button.release()
-
-        if right == constants.button_state["button_just_pressed"]:
-            stat_button.press()
-
-            # Update the text
-            hunger.clear()
-            joy.clear()
-            hunger.cursor(0, 0)
-            joy.cursor(0, 0)
-            hunger.text("Hunger: " + str(cat.hunger) + "/100")
-            joy.text("Joy: " + str(cat.joy) + "/100")
-
-            joy.move(16, 28)
-            hunger.move(16, 16)
-            game.render_block(1, 1)
-        elif right == constants.button_state["button_released"]:
-            stat_button.release()
-
-            joy.move(255, 255)
-            hunger.move(255, 255)
-            game.render_block()
-
-        # Check collision between cat and food
-        if (
-            cat.x < food.x + 16
-            and cat.x + 48 > food.x
-            and cat.y < food.y + 16
-            and cat.y + 32 > food.y
-        ):
-            cat.hunger += 10
-            food.move(255, 255)
-            cat.emote(3, 150, True)
-
-        # Check collision between cat and toy
-        if (
-            cat.x < toy.x + 16
-            and cat.x + 48 > toy.x
-            and cat.y < toy.y
-            and cat.y + 32 > toy.y
-        ):
-            cat.joy += 10
-
-            if cat._facing == "left":
-                toy_velocity_x = -1
-                toy_velocity_y = -1
-            elif cat._facing == "right":
-                toy_velocity_x = 1
-                toy_velocity_y = -1
-
-        # Toy bouncing
-        # Only if it is on screen
-        if toy.x != 255:
-            # Apply gravity
-            toy_velocity_y += constants.GRAVITY
-
-            # Move the toy
-            toy.move(toy.x + toy_velocity_x, toy.y + toy_velocity_y)
-
-            # Check for boundaries and bounce
-            if toy.y < 16:
-                toy_velocity_y = abs(toy_velocity_y) * constants.FRICTION
-            elif toy.y > 64:
-                toy.y = 64  # Reset position to floor level
-                toy_velocity_y = -abs(toy_velocity_y) * constants.FRICTION
-
-            if toy.x < 16:
-                toy.x = 16
-                toy_velocity_x = abs(toy_velocity_x) * constants.FRICTION
-            elif toy.x > 130:
-                toy.x = 130
-                toy_velocity_x = -abs(toy_velocity_x) * constants.FRICTION
-
-            # Apply friction to gradually stop the toy
-            toy_velocity_x *= constants.FRICTION
-            toy_velocity_y *= constants.FRICTION
-
-            # Stop bouncing after velocity is very low
-            if abs(toy_velocity_x) < 0.1 and abs(toy_velocity_y) < 0.1:
-                toy_velocity_x = 0
-                toy_velocity_y = 0
-
-        if toy_counter == 1500:
-            toy.move(255, 255)
-            toy_counter = 0
-
-        toy_counter += 1
+        steps = self._poll()
+        if steps:
+            # Game time moves on in fixed steps, however long the last frame took
+            keys = self.keys
+            for _ in range(steps):
+                self._step(keys)
+            self._draw()
 
-        # specific updates
-        cat.update()
+        self.game.tick()
+
+    # Method to run one frame with every phase timed
+    def _update_profiled(self, manager):
+        # Used instead of update when profiling, so update itself never checks
+        profiler = self.profiler
+        game = self.game
+
+        profiler.start()
+        steps = self._poll()
+        if steps == 0:
+            game.tick()
+            return
+
+        keys = self.keys
+        for _ in range(steps):
+            self._read_input(keys)
+
+            # START shows and hides the frame time readout
+            if self.buttons.just_pressed & ugame.K_START:
+                profiler.toggle_overlay(game)
+            profiler.mark(0)
+
+            self._press_buttons()
+            profiler.mark(1)
+
+            self.collisions.step()
+            profiler.mark(2)
+
+            self._move_toy()
+            profiler.mark(3)
+
+            self.cat.update()
+            profiler.mark(4)
+
+        self._draw()
+        profiler.draw_overlay(game)
+        profiler.mark(5)
 
-        game.render_sprites(button_sprites + cat._tile_list + [food, toy])
         game.tick()
+        profiler.mark(6)
+        profiler.end_frame()
+
+    # Method to run one fixed logic step
+    def _step(self, keys: int):
+        self._read_input(keys)
+        self._press_buttons()
+
+        # Check collisions, the callbacks handle eating and playing
+        self.collisions.step()
+
+        self._move_toy()
+
+        # specific updates
+        self.cat.update()
+
+    # Method to get the logic steps that are due
+    def _poll(self) -> int:
+        # Poll the buttons every loop, so a press wakes the scene up right away
+        keys = ugame.buttons.get_pressed()
+        wake = keys != self.keys
+        self.keys = keys
+
+        # Recordings and replays step once per frame, so they line up exactly
+        if self.recorder or (self.player and not self.player.finished):
+            wake = True
+
+        return self.scheduler.steps(wake)
+
+    # Method to read one step of input
+    def _read_input(self, keys: int):
+        # Track button data, replays and recordings go step by step
+        if self.player and not self.player.finished:
+            keys = self.player.next_keys()
+        elif self.recorder:
+            self.recorder.record(keys)
+        self.buttons.update(keys)
+
+    # Method to handle the on screen buttons
+    def _press_buttons(self):
+        game = self.game
+        cat = self.cat
+        buttons = self.buttons
+
+        # Button functionality, one press or release at a time
+        while buttons.next_event():
+            key = buttons.event_key
+            if buttons.event_type == Input_Manager.PRESSED:
+                if key == ugame.K_LEFT:
+                    self.feed_button.press()
+                    self._place_food()
+                elif key == ugame.K_DOWN:
+                    self.play_button.press()
+                    self._throw_toy()
+                elif key == ugame.K_RIGHT:
+                    self.stat_button.press()
+
+                    # Show the stats, only the area they cover is drawn, a press
+                    # while they are pinned lets them hide again on release
+                    if self.stats.showing:
+                        self.stats_pinned = False
+                    else:
+                        self.stats.show(game, cat.hunger, cat.joy)
+            elif key == ugame.K_LEFT:
+                self.feed_button.release()
+            elif key == ugame.K_DOWN:
+                self.play_button.release()
+            elif key == ugame.K_RIGHT:
+                self.stat_button.release()
+
+                # Holding STAT long enough keeps the stats showing after it is let go
+                if buttons.event_frames >= constants.STAT_PIN_FRAMES:
+                    self.stats_pinned = True
+                elif not self.stats_pinned:
+                    self.stats.hide(game)
+
+        # Keep the stats up to date while they are showing
+        if self.stats.showing:
+            self.stats.update(game, cat.hunger, cat.joy)
+
+    # Method to put the food somewhere in the room
+    def _place_food(self):
+        cat = self.cat
+        random_x = random.randint(cat.LEFT_BOUNDARY, cat.RIGHT_BOUNDARY - 16)
+
+        # Ensure food doesn't appear inside the cat
+        while self.cat_collider.overlaps(random_x, 16 * 4, 16, 16):
+            random_x = random.randint(cat.LEFT_BOUNDARY, cat.RIGHT_BOUNDARY - 16)
+
+        # move the food sprite away from the cat but still on screen
+        self.food_item.move(random_x, 16 * 4)
+
+    # Method to put the toy somewhere in the room
+    def _throw_toy(self):
+        cat = self.cat
+        random_x = random.randint(cat.LEFT_BOUNDARY, cat.RIGHT_BOUNDARY - 16)
+
+        # Ensure the toy doesn't appear inside the cat
+        while self.cat_collider.overlaps(random_x, 16 * 4, 16, 16):
+            random_x = random.randint(cat.LEFT_BOUNDARY, cat.RIGHT_BOUNDARY - 16)
+
+        # move the toy sprite away from the cat but still on screen
+        self.toy_body.set_position(random_x, 16 * 4)
+        self.toy_item.changed()
+
+        if self.toy_counter < 0:
+            self.toy_counter = 0
+            cat.joy += 30
+            cat.log_event(EVENT_PLAY)
+
+    # Method to bounce the toy
+    def _move_toy(self):
+        # Toy bouncing, only awake bodies are stepped
+        self.world.step()
+        if self.world.moved:
+            self.toy_item.changed()
+
+        if self.toy_counter == 1500:
+            self.toy_body.sleep()
+            self.toy_body.set_position(255, 255)
+            self.toy_item.changed()
+            self.toy_counter = 0
+
+        self.toy_counter += 1
+
+    # Method to draw what changed
+    def _draw(self):
+        # Only draw the sprites that moved or changed, and are or were on screen
+        self.render_list.render(self.game)
+
+        # Draw less often while nothing is moving
+        self.scheduler.idle = (
+            self.keys == 0
+            and self.cat.idle
+            and self.world.asleep
+            and not self.stats.showing
+        )
+
+    # Method to leave the scene
+    def exit(self, manager):
+        """
+        Save the stats.
+
+        Args:
+            manager (Scene_Manager): The scene manager.
+        """
+
+        # Save any stats that have not been written yet when the scene exits
+        self.cat.flush()
+
+        if self.recorder:
+            self.recorder.close()
+
+        self.game = None
+
+        if self.profiler:
+            self.profiler.print_report()
+
+    # Method to give back everything the scene owns
+    def release(self):
+        """
+        Give back the banks the buttons and cat use, then the scene's own banks.
+
+        A scene that failed part way through loading only gives back what it got.
+        """
+
+        for owner in (self.feed_button, self.play_button, self.stat_button, self.cat):
+            if owner is not None:
+                owner.release_banks()
+        self.feed_button = None
+        self.play_button = None
+        self.stat_button = None
+        self.cat = None
+
+        super().release()
+
+    # The cat eats the food when it touches it
+    def _eat_food(self, collider, other):
+        self.cat.hunger += 10
+        self.cat.log_event(EVENT_FEED)
+        self.food_item.move_off_screen()
+        self.cat.emote(3, 150, True)
+
+    # The cat kicks the toy for as long as it touches it
+    def _kick_toy(self, collider, other):
+        self.cat.joy += 10
+        self.cat.log_event(EVENT_TOY)
+
+        if self.cat._facing == "left":
+            self.toy_body.set_velocity(-FIXED_ONE, -FIXED_ONE)
+        elif self.cat._facing == "right":
+            self.toy_body.set_velocity(FIXED_ONE, -FIXED_ONE)
@@ -9,50 +9,146 @@ Splash scene for the Tomogotchi game
 # import constants
 from .. import constants
 import stage
-import supervisor
 import ugame
 import time
 
-# Scene imports
-from Tomogotchi.scenes.game import game_scene
+# import classes
+from Tomogotchi.classes.scene_manager import Scene, Scene_Manager
+from Tomogotchi.classes.tile_map import load_tile_map
 
+# Image banks owned by the scene
+SPLASH_BMP_PATH = "./Tomogotchi/assets/moj_corp.bmp"
+SPLASH_BMP_PATH_2 = "./Tomogotchi/assets/moj_corp2.bmp"
 
-def splash_scene():
+# Tile map of the logo, compiled from design/moj_corp.csv
+SPLASH_MAP_PATH = "./Tomogotchi/assets/moj_corp.tmap"
+
+# The splash screen shows for at least this long
+SPLASH_SECONDS = 2.0
+
+# Pause between the slices of the game scene loaded behind the splash screen
+PREFETCH_PAUSE = 0.02
+
+
+def splash_scene(import_profiler=None):
     """
     The splash scene of the game.
+
+    Args:
+        import_profiler (Import_Profiler): Reports the boot imports when given.
     """
 
-    try:
-        # Load the image bank
-        moj_corp_splash = stage.Bank.from_bmp16("./Tomogotchi/assets/moj_corp.bmp")
+    Scene_Manager().run(Splash_Scene(import_profiler))
+
+
+class Splash_Scene(Scene):
+    """
+    The logo shown while the game scene loads behind it.
+    """
+
+    def __init__(self, import_profiler=None):
+        """
+        The constructor for the splash scene class.
+
+        Args:
+            import_profiler (Import_Profiler): Reports the boot imports when given.
+        """
+
+        super().__init__()
+        self._import_profiler = import_profiler
+        self._next_scene = None
+        self._shown = 0
+
+    # Method to load the scene
+    def load(self):
+        """
+        Load the logo.
+        """
 
-        # Load second image bank
-        moj_corp_splash2 = stage.Bank.from_bmp16("./Tomogotchi/assets/moj_corp2.bmp")
-    except Exception as e:
-        print(f"Error loading image splash scene backgrounds: {e}")
+        # Load the image banks
+        moj_corp_splash = self.use_bank(SPLASH_BMP_PATH)
+        moj_corp_splash2 = self.use_bank(SPLASH_BMP_PATH_2)
+
+        # The tile map is already packed the way the Grid stores it
+        width, height, tiles = load_tile_map(SPLASH_MAP_PATH)
+        background = stage.Grid(moj_corp_splash, width, height, buffer=tiles)
+
+        sprite = []
+        sprite_positions = [
+            (3, 5),
+            (4, 5),
+            (5, 5),
+            (6, 5),
+            (3, 6),
+            (4, 6),
+            (5, 6),
+            (6, 6),
+        ]
+        sprite_indices = [1, 2, 3, 4, 6, 7, 8, 9]
+
+        for index, (x, y) in zip(sprite_indices, sprite_positions):
+            bkgSprite = stage.Sprite(moj_corp_splash2, index, x * 16, y * 16)
+            sprite.append(bkgSprite)
+
+        self.layers = sprite + [background]
+
+        # Nothing to spread out, the logo is needed straight away
         return
+        yield
+
+    # Method to show the scene
+    def enter(self, manager):
+        """
+        Draw the logo, then load the game scene module.
+
+        Args:
+            manager (Scene_Manager): The scene manager.
+        """
+
+        game = stage.Stage(ugame.display, constants.FPS)
+        game.layers = self.layers
+        game.render_block()
+        self._shown = time.monotonic()
+
+        if self._import_profiler:
+            self._import_profiler.mark("first pixel")
+
+        # Load the game scene only after the splash screen is showing
+        from Tomogotchi.scenes.game import Game_Scene
+
+        if self._import_profiler:
+            self._import_profiler.mark("game scene loaded")
+            self._import_profiler.uninstall()
+            self._import_profiler.print_report()
+            self._import_profiler = None
+
+        self._next_scene = Game_Scene()
 
-    background = stage.Grid(
-        moj_corp_splash, constants.SCREEN_GRID_X, constants.SCREEN_GRID_Y
-    )
+    # Method to wait on the splash screen
+    def update(self, manager):
+        """
+        Build the game scene a slice at a time, then change to it once the
+        splash has been up for long enough.
 
-    # Compacting the background tiles
-    for row in range(1, 5):
-        for col in range(3, 7):
-            background.tile(col, row, (row - 1) * 4 + (col - 3))
+        Args:
+            manager (Scene_Manager): The scene manager.
+        """
 
-    sprite = []
-    sprite_positions = [(3, 5), (4, 5), (5, 5), (6, 5), (3, 6), (4, 6), (5, 6), (6, 6)]
-    sprite_indices = [1, 2, 3, 4, 6, 7, 8, 9]
+        if not self._next_scene.load_step():
+            time.sleep(PREFETCH_PAUSE)
+            return
 
-    for index, (x, y) in zip(sprite_indices, sprite_positions):
-        bkgSprite = stage.Sprite(moj_corp_splash2, index, x * 16, y * 16)
-        sprite.append(bkgSprite)
+        # The game scene could not load, wait and try again
+        if self._next_scene.failed:
+            self._next_scene.release()
+            time.sleep(SPLASH_SECONDS)
+            self._next_scene = type(self._next_scene)()
+            return
 
-    game = stage.Stage(ugame.display, constants.FPS)
-    game.layers = sprite + [background]
-    game.render_block()
+        # Keep the splash up for the rest of its time
+        remaining = SPLASH_SECONDS - (time.monotonic() - self._shown)
+        if remaining > 0:
+            time.sleep(remaining)
 
-    while True:
-        time.sleep(2.0)
-        game_scene()
+        manager.change(self._next_scene)
+        self._next_scene = None
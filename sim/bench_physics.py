@@ -0,0 +1,138 @@
+# !/usr/bin/env python3
+
+"""
+Created by: Mohamad Tanbari
+Created on: October 2026
+Time the fixed point physics against the old float toy bounce.
+
+Each run starts from the same bodies. The first runs warm up and are thrown away,
+then the minimum and median of the rest are reported.
+
+Example:
+    python3 sim/bench_physics.py --bodies 32 --frames 600 --repeat 15
+"""
+
+import argparse
+import random
+import statistics
+import time
+
+import harness
+
+
+def bench_float(sprites: list, frames: int) -> float:
+    """
+    Run the old float toy bounce on every sprite.
+
+    Returns:
+        float: The seconds taken.
+    """
+    from Tomogotchi import constants
+
+    velocities = [[random.uniform(-2, 2), random.uniform(-3, 0)] for _ in sprites]
+
+    start = time.perf_counter()
+    for _ in range(frames):
+        for toy, velocity in zip(sprites, velocities):
+            velocity[1] += constants.GRAVITY
+            toy.move(toy.x + velocity[0], toy.y + velocity[1])
+            if toy.y < 16:
+                velocity[1] = abs(velocity[1]) * constants.FRICTION
+            elif toy.y > 64:
+                toy.y = 64
+                velocity[1] = -abs(velocity[1]) * constants.FRICTION
+            if toy.x < 16:
+                toy.x = 16
+                velocity[0] = abs(velocity[0]) * constants.FRICTION
+            elif toy.x > 130:
+                toy.x = 130
+                velocity[0] = -abs(velocity[0]) * constants.FRICTION
+            velocity[0] *= constants.FRICTION
+            velocity[1] *= constants.FRICTION
+            if abs(velocity[0]) < 0.1 and abs(velocity[1]) < 0.1:
+                velocity[0] = 0
+                velocity[1] = 0
+    return time.perf_counter() - start
+
+
+def bench_fixed(sprites: list, frames: int) -> float:
+    """
+    Run the fixed point world on every sprite.
+
+    Returns:
+        float: The seconds taken.
+    """
+    from Tomogotchi import constants
+    from Tomogotchi.classes.cat import Cat
+    from Tomogotchi.classes.physics import FIXED_ONE, Physics_Body, Physics_World
+
+    world = Physics_World(
+        Cat.LEFT_BOUNDARY, Cat.RIGHT_BOUNDARY, constants.CEILING_Y, constants.FLOOR_Y
+    )
+    for sprite in sprites:
+        body = Physics_Body(sprite)
+        world.add(body)
+        body.set_velocity(
+            random.randint(-2 * FIXED_ONE, 2 * FIXED_ONE),
+            random.randint(-3 * FIXED_ONE, 0),
+        )
+
+    start = time.perf_counter()
+    for _ in range(frames):
+        world.step()
+    return time.perf_counter() - start
+
+
+def measure(bench, bodies: int, frames: int, seed: int, warmup: int, repeat: int):
+    """
+    Run a benchmark several times from the same start.
+
+    Returns:
+        list: The seconds taken by each run after the warmup runs.
+    """
+    import stage
+
+    bank = stage.Bank()
+    times = []
+    for run in range(warmup + repeat):
+        random.seed(seed)
+        sprites = [
+            stage.Sprite(bank, 1, random.randint(16, 130), random.randint(16, 64))
+            for _ in range(bodies)
+        ]
+        seconds = bench(sprites, frames)
+        if run >= warmup:
+            times.append(seconds)
+    return times
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the toy physics.")
+    parser.add_argument("--bodies", type=int, default=32)
+    parser.add_argument("--frames", type=int, default=600)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--warmup", type=int, default=3)
+    parser.add_argument("--repeat", type=int, default=15)
+    args = parser.parse_args()
+
+    harness.install()
+
+    results = {}
+    for name, bench in (("float", bench_float), ("fixed", bench_fixed)):
+        times = measure(
+            bench, args.bodies, args.frames, args.seed, args.warmup, args.repeat
+        )
+        low = min(times) / args.frames * 1e6
+        median = statistics.median(times) / args.frames * 1e6
+        results[name] = median
+        print(
+            "{}: {} bodies, {:.1f} us per frame min, {:.1f} us median".format(
+                name, args.bodies, low, median
+            )
+        )
+
+    print("fixed / float (median): {:.2f}".format(results["fixed"] / results["float"]))
+
+
+if __name__ == "__main__":
+    main()
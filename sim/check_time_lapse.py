@@ -0,0 +1,80 @@
+# !/usr/bin/env python3
+
+"""
+Created by: Mohamad Tanbari
+Created on: October 2026
+Check that the time lapse agrees with stepping Cat.update frame by frame.
+
+Example:
+    python3 sim/check_time_lapse.py --frames 3000 --trials 400
+"""
+
+import argparse
+import copy
+import random
+
+import harness
+
+
+def summarise(states: list) -> dict:
+    """
+    Summarise a list of pet states.
+
+    Returns:
+        dict: The averages that should match between both methods.
+    """
+    count = len(states)
+    mean_x = sum(state.x for state in states) / count
+    return {
+        "mean x": mean_x,
+        "sd x": (sum((state.x - mean_x) ** 2 for state in states) / count) ** 0.5,
+        "facing right": sum(state.facing == "right" for state in states) / count,
+        "walking": sum(state.walk_distance > 0 for state in states) / count,
+        "emote showing": sum(state.emote_duration > 0 for state in states) / count,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compare the time lapse to Cat.update."
+    )
+    parser.add_argument("--frames", type=int, default=3000)
+    parser.add_argument("--trials", type=int, default=400)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    harness.install()
+    from Tomogotchi.classes.cat import Cat
+    from Tomogotchi.classes.time_lapse import Time_Lapse
+
+    random.seed(args.seed)
+    cat = Cat(56, 16 * 3, 0)
+    start = cat.snapshot()
+
+    stepped = []
+    for _ in range(args.trials):
+        cat.restore(copy.copy(start))
+        for _ in range(args.frames):
+            cat.update()
+        stepped.append(cat.snapshot())
+
+    lapsed = []
+    time_lapse = Time_Lapse()
+    for _ in range(args.trials):
+        state = copy.copy(start)
+        time_lapse.advance_frames(state, args.frames, decay=False)
+        lapsed.append(state)
+
+    print("{:<14} {:>9} {:>9}".format("", "stepped", "lapsed"))
+    stepped_summary = summarise(stepped)
+    lapsed_summary = summarise(lapsed)
+    for name in stepped_summary:
+        print(
+            "{:<14} {:>9.3f} {:>9.3f}".format(
+                name, stepped_summary[name], lapsed_summary[name]
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
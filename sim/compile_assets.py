@@ -0,0 +1,160 @@
+# !/usr/bin/env python3
+
+"""
+Created by: Mohamad Tanbari
+Created on: October 2026
+Compile the BMPs in assets into packed banks that load without decoding.
+
+Each packed bank is a short header, the 16 colour palette and the 4bpp tiles,
+already in the layout stage keeps in memory. The tile maps drawn in design/*.csv
+are compiled into assets/*.tmap files. saveCode.py runs this before copying.
+
+Example:
+    python3 sim/compile_assets.py
+"""
+
+import argparse
+import os
+import time
+
+import harness
+
+
+def compile_assets(assets_dir: str) -> list:
+    """
+    Compile every BMP in a folder that is newer than its packed bank.
+
+    Args:
+        assets_dir (str): The folder holding the BMPs.
+
+    Returns:
+        list: The packed banks that were written.
+    """
+
+    import stage
+    from Tomogotchi.classes.bank_registry import PACKED_HEADER, packed_path
+
+    written = []
+    for item in sorted(os.listdir(assets_dir)):
+        if not item.endswith(".bmp"):
+            continue
+
+        bmp_path = os.path.join(assets_dir, item)
+        bank_path = packed_path(bmp_path)
+        if (
+            os.path.exists(bank_path)
+            and os.path.getmtime(bank_path) >= os.path.getmtime(bmp_path)
+        ):
+            continue
+
+        # Decode with the same code stage uses so the layout matches
+        bank = stage.Bank.from_bmp16(bmp_path)
+
+        # Write to a temporary file first so a half written bank is never loaded
+        temp_path = bank_path + ".tmp"
+        with open(temp_path, "wb") as file:
+            file.write(PACKED_HEADER)
+            file.write(bytes(bank.palette))
+            file.write(bytes(bank.buffer))
+        os.replace(temp_path, bank_path)
+        written.append(bank_path)
+
+    return written
+
+
+def compile_tile_maps(design_dir: str, assets_dir: str) -> list:
+    """
+    Compile every CSV tile map in a folder into a tile map file.
+
+    Args:
+        design_dir (str): The folder holding the CSV files, one row of tiles per line.
+        assets_dir (str): The folder the tile map files go in.
+
+    Returns:
+        list: The tile map files that changed.
+    """
+
+    from Tomogotchi.classes.tile_map import encode_tile_map
+
+    written = []
+    for item in sorted(os.listdir(design_dir)):
+        if not item.endswith(".csv"):
+            continue
+
+        with open(os.path.join(design_dir, item), "r") as file:
+            rows = [
+                [int(tile) for tile in line.split(",")]
+                for line in file.read().split()
+                if line
+            ]
+        data = encode_tile_map(rows)
+
+        # The files are kept in git, so only write them when they change
+        map_path = os.path.join(assets_dir, item[:-4] + ".tmap")
+        if os.path.exists(map_path):
+            with open(map_path, "rb") as file:
+                if file.read() == data:
+                    continue
+
+        with open(map_path, "wb") as file:
+            file.write(data)
+        written.append(map_path)
+
+    return written
+
+
+def compare_load_times(assets_dir: str, rounds: int = 200):
+    """
+    Print how long the BMPs and the packed banks take to load.
+
+    Args:
+        assets_dir (str): The folder holding the BMPs.
+        rounds (int): How many times to load every bank.
+    """
+
+    import stage
+    from Tomogotchi.classes.bank_registry import load_bank
+
+    paths = [
+        os.path.join(assets_dir, item)
+        for item in sorted(os.listdir(assets_dir))
+        if item.endswith(".bmp")
+    ]
+
+    for name, load in (("bmp", stage.Bank.from_bmp16), ("packed", load_bank)):
+        start = time.perf_counter()
+        for _ in range(rounds):
+            for path in paths:
+                load(path)
+        elapsed = time.perf_counter() - start
+        print(
+            "{:<7} {:.1f} us per bank".format(
+                name, elapsed / (rounds * len(paths)) * 1000000
+            )
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compile the BMPs into packed banks.")
+    parser.add_argument("--assets", default=os.path.join(harness.REPO_ROOT, "assets"))
+    parser.add_argument("--design", default=os.path.join(harness.REPO_ROOT, "design"))
+    parser.add_argument(
+        "--time", action="store_true", help="compare the load times afterwards"
+    )
+    args = parser.parse_args()
+
+    assets_dir = os.path.abspath(args.assets)
+    design_dir = os.path.abspath(args.design)
+    harness.install()
+
+    written = compile_assets(assets_dir)
+    print("{} packed banks written".format(len(written)))
+    written = compile_tile_maps(design_dir, assets_dir)
+    print("{} tile maps written".format(len(written)))
+
+    if args.time:
+        compare_load_times(assets_dir)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,361 @@
+# !/usr/bin/env python3
+
+"""
+Created by: Mohamad Tanbari
+Created on: October 2026
+Simulate a fleet of cats with NumPy to balance the decay and behaviour constants.
+
+The model is the same as Cat.update, Cat.react and the stat decay, with every
+cat stored as one slot in a set of arrays. NumPy is only needed on the computer.
+
+Example:
+    python3 sim/fleet.py --cats 100000 --hours 1
+    python3 sim/fleet.py --check
+"""
+
+import argparse
+import copy
+import random
+import time
+
+import harness
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class Fleet:
+    """
+    Many cats stepped together, one array per property.
+    """
+
+    def __init__(
+        self,
+        cats: int,
+        hunger,
+        joy,
+        x: int = 56,
+        decay: bool = True,
+        feed_rate: float = 0.0,
+        play_rate: float = 0.0,
+        seed: int = None,
+    ):
+        """
+        The constructor for the fleet class.
+
+        Args:
+            cats (int): The number of cats.
+            hunger: The starting hunger, a number or an array.
+            joy: The starting joy, a number or an array.
+            x (int): The starting x position.
+            decay (bool): Lower the stats as frames pass.
+            feed_rate (float): Times per hour the player feeds each cat.
+            play_rate (float): Times per hour the player plays with each cat.
+            seed (int): The seed for the random numbers.
+        """
+        from Tomogotchi import constants
+        from Tomogotchi.classes.cat import Cat
+        from Tomogotchi.classes.time_lapse import WALK_ANIMATION_FRAMES
+
+        self.constants = constants
+        self.walk_animation_frames = WALK_ANIMATION_FRAMES
+        self.cats = cats
+        self.decay = decay
+        self.rng = np.random.default_rng(seed)
+        self.frame = 0
+
+        self.left = Cat.LEFT_BOUNDARY
+        self.right = Cat.RIGHT_BOUNDARY
+        self.width = Cat.WIDTH
+        self.span = (self.right - self.width - 1) - (self.left + 1) + 1
+
+        frames_per_hour = 3600 * constants.FPS
+        self.feed_chance = feed_rate / frames_per_hour
+        self.play_chance = play_rate / frames_per_hour
+
+        # Movement
+        self.x = np.full(cats, x, dtype=np.int32)
+        self.direction = np.ones(cats, dtype=np.int32)
+        self.walk_distance = np.zeros(cats, dtype=np.int32)
+        self.frame_counter = np.zeros(cats, dtype=np.int32)
+        self.tracked_frame = np.zeros(cats, dtype=np.int32)
+        self.min_x = self.x.copy()
+        self.max_x = self.x.copy()
+        self.walking_frames = np.zeros(cats, dtype=np.int64)
+
+        # Emotes
+        self.emote = np.full(cats, -1, dtype=np.int32)
+        self.emote_duration = np.zeros(cats, dtype=np.int32)
+        self.emote_counts = np.zeros((cats, 3), dtype=np.int32)
+
+        # Stats, the decay is always worked out from the starting value
+        self.start_hunger = np.broadcast_to(np.asarray(hunger), cats).astype(np.int32)
+        self.start_joy = np.broadcast_to(np.asarray(joy), cats).astype(np.int32)
+        self.hunger_bonus = np.zeros(cats, dtype=np.int32)
+        self.joy_bonus = np.zeros(cats, dtype=np.int32)
+        self.hunger = self.start_hunger.copy()
+        self.joy = self.start_joy.copy()
+        self.zero_hunger_frame = np.full(cats, -1, dtype=np.int64)
+
+    # Method to step every cat by one frame
+    def step(self):
+        """
+        Step every cat by one frame, the same way Cat.update does.
+        """
+        constants = self.constants
+        rng = self.rng
+        cats = self.cats
+
+        # Emote countdown
+        np.maximum(self.emote_duration - 1, 0, out=self.emote_duration)
+
+        # Walking
+        walking = self.walk_distance > 0
+        self.walking_frames += walking
+        self.x += np.where(walking, self.direction, 0)
+        hit = walking & ((self.x <= self.left) | (self.x + self.width >= self.right))
+        self.direction[hit] *= -1
+        self.x[hit] += self.direction[hit]
+        np.minimum(self.min_x, self.x, out=self.min_x)
+        np.maximum(self.max_x, self.x, out=self.max_x)
+
+        # Walk animation
+        swap = walking & (self.frame_counter == self.walk_animation_frames - 1)
+        self.tracked_frame[swap] ^= 1
+        self.frame_counter[swap] = 0
+        self.frame_counter[walking & ~swap] += 1
+        self.walk_distance[walking] -= 1
+
+        # Randomly start walking
+        start = (self.walk_distance == 0) & (
+            rng.random(cats) < 1 / constants.WALK_CHANCE
+        )
+        count = int(start.sum())
+        if count:
+            self.direction[start] = np.where(rng.integers(0, 2, count) == 0, -1, 1)
+            self.walk_distance[start] = rng.integers(
+                constants.WALK_DISTANCE_MIN, constants.WALK_DISTANCE_MAX + 1, count
+            )
+
+        # Randomly react to the stats
+        react = (rng.random(cats) < 1 / constants.REACT_CHANCE) & (
+            self.emote_duration == 0
+        )
+        kind = np.select(
+            [self.hunger < 30, self.joy < 30, self.joy > 70], [2, 1, 0], default=-1
+        )
+        show = react & (kind >= 0)
+        self.emote[show] = kind[show]
+        self.emote_duration[show] = constants.REACT_EMOTE_DURATION
+        self.emote_counts[show, kind[show]] += 1
+
+        # The player feeding and playing, the stat setters ignore 0 and 100 or more
+        if self.feed_chance:
+            fed = rng.random(cats) < self.feed_chance
+            self._bump(self.hunger, self.hunger_bonus, fed)
+        if self.play_chance:
+            played = rng.random(cats) < self.play_chance
+            self._bump(self.joy, self.joy_bonus, played)
+
+        self.frame += 1
+
+        # Stat decay
+        if self.decay:
+            seconds = self.frame / constants.FPS
+            hunger_loss = np.floor(
+                seconds / constants.HUNGER_DECAY_SECONDS * constants.HUNGER_DECAY
+            )
+            joy_loss = np.floor(
+                seconds / constants.JOY_DECAY_SECONDS * constants.JOY_DECAY
+            )
+            np.maximum(
+                self.start_hunger + self.hunger_bonus - int(hunger_loss),
+                0,
+                out=self.hunger,
+            )
+            np.maximum(self.start_joy + self.joy_bonus - int(joy_loss), 0, out=self.joy)
+
+            starving = (self.hunger == 0) & (self.zero_hunger_frame < 0)
+            self.zero_hunger_frame[starving] = self.frame
+
+    def _bump(self, stat, bonus, chosen):
+        new = stat + 10
+        allowed = chosen & (new > 0) & (new < 100)
+        bonus[allowed] += 10
+        stat[allowed] = new[allowed]
+
+    # Method to summarise the fleet
+    def report(self) -> dict:
+        """
+        Summarise the fleet.
+
+        Returns:
+            dict: Arrays and numbers describing the fleet.
+        """
+        hours = self.frame / self.constants.FPS / 3600
+        return {
+            "hours": hours,
+            "zero hunger hours": self.zero_hunger_frame / self.constants.FPS / 3600,
+            "emotes per hour": self.emote_counts.sum(axis=1) / hours if hours else None,
+            "emote counts": self.emote_counts.sum(axis=0),
+            "walk coverage": (self.max_x - self.min_x + 1) / self.span,
+            "walking": self.walking_frames / max(1, self.frame),
+            "x": self.x,
+            "facing right": self.direction == 1,
+            "emote showing": self.emote_duration > 0,
+        }
+
+
+def percentiles(values) -> str:
+    """
+    Format the 5th, 50th and 95th percentiles of an array.
+
+    Returns:
+        str: The percentiles.
+    """
+    low, middle, high = np.percentile(values, [5, 50, 95])
+    return "p5 {:.3f}  p50 {:.3f}  p95 {:.3f}".format(low, middle, high)
+
+
+def run(args):
+    """
+    Run the fleet and print the distributions.
+    """
+    rng = np.random.default_rng(args.seed)
+    if args.random_stats:
+        hunger = rng.integers(1, 100, args.cats)
+        joy = rng.integers(1, 100, args.cats)
+    else:
+        hunger = args.hunger
+        joy = args.joy
+
+    fleet = Fleet(
+        args.cats,
+        hunger,
+        joy,
+        decay=not args.no_decay,
+        feed_rate=args.feed_rate,
+        play_rate=args.play_rate,
+        seed=args.seed,
+    )
+
+    frames = int(args.hours * 3600 * fleet.constants.FPS)
+    start = time.perf_counter()
+    for _ in range(frames):
+        fleet.step()
+    elapsed = time.perf_counter() - start
+
+    report = fleet.report()
+    print(
+        "{} cats, {} frames in {:.1f} s ({:.2f} ms per frame)".format(
+            args.cats, frames, elapsed, elapsed / max(1, frames) * 1000
+        )
+    )
+
+    starved = report["zero hunger hours"][report["zero hunger hours"] >= 0]
+    print("reached zero hunger: {:.1%}".format(len(starved) / args.cats))
+    if len(starved):
+        print("  hours to zero hunger: " + percentiles(starved))
+    if report["emotes per hour"] is not None:
+        print("emotes per hour: " + percentiles(report["emotes per hour"]))
+    happy, angry, hungry = report["emote counts"]
+    print("emote mix: happy {} angry {} hungry {}".format(happy, angry, hungry))
+    print("walk coverage: " + percentiles(report["walk coverage"]))
+    print("time walking: " + percentiles(report["walking"]))
+
+
+def check(args):
+    """
+    Run the scalar Cat class next to the fleet with the same settings and compare.
+    """
+    from Tomogotchi import constants
+    from Tomogotchi.classes.cat import Cat
+
+    frames = args.check_frames
+    random.seed(args.seed)
+    cat = Cat(56, 16 * 3, 0)
+    start = cat.snapshot()
+    hunger, joy = start.hunger, start.joy
+
+    x = []
+    facing_right = []
+    walking = []
+    emotes = []
+    coverage = []
+    span = (Cat.RIGHT_BOUNDARY - Cat.WIDTH - 1) - (Cat.LEFT_BOUNDARY + 1) + 1
+    for _ in range(args.check_cats):
+        cat.restore(copy.copy(start))
+        low = high = cat.x
+        count = 0
+        for _ in range(frames):
+            cat.update()
+            # A reaction sets the full duration on the frame it starts
+            if cat._emote_duration == constants.REACT_EMOTE_DURATION:
+                count += 1
+            low = min(low, cat.x)
+            high = max(high, cat.x)
+        state = cat.snapshot()
+        x.append(state.x)
+        facing_right.append(state.facing == "right")
+        walking.append(state.walk_distance > 0)
+        emotes.append(count)
+        coverage.append((high - low + 1) / span)
+
+    fleet = Fleet(args.cats, hunger, joy, decay=False, seed=args.seed)
+    for _ in range(frames):
+        fleet.step()
+    report = fleet.report()
+
+    rows = [
+        ("mean x", np.mean(x), report["x"].mean()),
+        ("sd x", np.std(x), report["x"].std()),
+        ("facing right", np.mean(facing_right), report["facing right"].mean()),
+        ("walking", np.mean(walking), (fleet.walk_distance > 0).mean()),
+        ("emotes per cat", np.mean(emotes), report["emote counts"].sum() / args.cats),
+        ("walk coverage", np.mean(coverage), report["walk coverage"].mean()),
+    ]
+    print(
+        "{} frames, {} scalar cats, {} fleet cats".format(
+            frames, args.check_cats, args.cats
+        )
+    )
+    print("{:<15} {:>9} {:>9}".format("", "Cat", "fleet"))
+    for name, scalar, vector in rows:
+        print("{:<15} {:>9.3f} {:>9.3f}".format(name, scalar, vector))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulate a fleet of cats.")
+    parser.add_argument("--cats", type=int, default=100000)
+    parser.add_argument("--hours", type=float, default=0.1)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--hunger", type=int, default=50)
+    parser.add_argument("--joy", type=int, default=80)
+    parser.add_argument(
+        "--random-stats", action="store_true", help="start each cat at random stats"
+    )
+    parser.add_argument("--no-decay", action="store_true", help="keep the stats fixed")
+    parser.add_argument("--feed-rate", type=float, default=0.0, help="feeds per hour")
+    parser.add_argument("--play-rate", type=float, default=0.0, help="plays per hour")
+    parser.add_argument(
+        "--check", action="store_true", help="compare with the scalar Cat class"
+    )
+    parser.add_argument("--check-cats", type=int, default=300)
+    parser.add_argument("--check-frames", type=int, default=3000)
+    args = parser.parse_args()
+
+    if np is None:
+        raise SystemExit("fleet.py needs NumPy, install it with: pip install numpy")
+
+    harness.install()
+
+    if args.check:
+        check(args)
+    else:
+        run(args)
+
+
+if __name__ == "__main__":
+    main()
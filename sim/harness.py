@@ -0,0 +1,285 @@
+# !/usr/bin/env python3
+
+"""
+Created by: Mohamad Tanbari
+Created on: October 2026
+Run the Tomogotchi scenes on Linux with the headless stage and ugame stand-ins.
+
+Example:
+    python3 sim/harness.py --frames 100000 --seed 1 --press 120:LEFT:10
+"""
+
+import argparse
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+# The temporary work folder, removed when the simulator exits
+_temporary = None
+
+SIM_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.dirname(SIM_DIR)
+
+# Files copied instead of linked so a run never changes the real save
+COPIED_FILES = (
+    "data.json",
+    "save_a.bin",
+    "save_b.bin",
+    "log_a.bin",
+    "log_b.bin",
+)
+
+
+def install(workdir: str = None) -> str:
+    """
+    Make stage, ugame, supervisor and the Tomogotchi package importable.
+
+    The game opens its files relative to the folder above Tomogotchi, so a
+    work folder is made with a Tomogotchi folder linking back to this repository.
+
+    Args:
+        workdir (str): The folder to run in, a temporary folder removed at exit if
+            not given.
+
+    Returns:
+        str: The work folder.
+    """
+
+    global _temporary
+
+    if SIM_DIR not in sys.path:
+        sys.path.insert(0, SIM_DIR)
+
+    if workdir is None:
+        _temporary = tempfile.TemporaryDirectory(prefix="tomogotchi-sim-")
+        workdir = _temporary.name
+
+    package = os.path.join(workdir, "Tomogotchi")
+    if not os.path.exists(package):
+        os.makedirs(package)
+        for item in os.listdir(REPO_ROOT):
+            if item.startswith(".git"):
+                continue
+            if item in COPIED_FILES:
+                shutil.copy2(os.path.join(REPO_ROOT, item), package)
+            else:
+                os.symlink(os.path.join(REPO_ROOT, item), os.path.join(package, item))
+
+    os.chdir(workdir)
+    if workdir not in sys.path:
+        sys.path.insert(0, workdir)
+
+    return workdir
+
+
+def run_game_scene(
+    frames: int,
+    script: list = None,
+    seed: int = None,
+    draw: bool = False,
+    uncapped: bool = True,
+    profile_frames: bool = False,
+    record: str = None,
+    replay: str = None,
+) -> dict:
+    """
+    Run the game scene for a number of frames.
+
+    Args:
+        frames (int): The number of frames to run.
+        script (list): (frame, mask) pairs for the buttons.
+        seed (int): The seed for the random module.
+        draw (bool): Draw real pixels instead of only counting them.
+        uncapped (bool): Run as fast as possible instead of at the game's FPS.
+        profile_frames (bool): Time each phase of the game loop and print a report.
+        record (str): Record the buttons to this file.
+        replay (str): Replay the buttons from this file instead of the script.
+
+    Returns:
+        dict: The frames run, the time taken and the display transfer counters.
+    """
+
+    import stage
+    import ugame
+    from Tomogotchi import constants
+    from Tomogotchi.scenes.game import game_scene
+
+    constants.PROFILE_FRAMES = profile_frames
+    constants.RECORD_INPUT_PATH = record
+    constants.REPLAY_INPUT_PATH = replay
+
+    if seed is not None:
+        random.seed(seed)
+
+    ugame.display.reset()
+    ugame.buttons.script(script or [])
+    stage.configure(uncapped=uncapped, frame_limit=frames, draw=draw)
+
+    start = time.perf_counter()
+    try:
+        game_scene()
+    except stage.FrameLimitReached:
+        pass
+    finally:
+        stage.configure(frame_limit=None)
+    elapsed = time.perf_counter() - start
+
+    return {
+        "frames": ugame.display.frame,
+        "seconds": elapsed,
+        "fps": ugame.display.frame / elapsed if elapsed else 0.0,
+        "blocks": ugame.display.blocks,
+        "pixels_pushed": ugame.display.pixels_pushed,
+        "checksum": ugame.display.checksum(),
+    }
+
+
+def run_boot(frames: int, seed: int = None) -> dict:
+    """
+    Boot the game from code.py with the import profiler on, through the splash
+    scene and into the game scene for a number of frames.
+
+    Args:
+        frames (int): The number of game scene frames to run.
+        seed (int): The seed for the random module.
+
+    Returns:
+        dict: The frames run and the time taken.
+    """
+
+    import importlib
+    import tracemalloc
+
+    import stage
+    import ugame
+    from Tomogotchi import constants
+
+    constants.PROFILE_IMPORTS = True
+    constants.PROFILE_HEAP = True
+
+    if seed is not None:
+        random.seed(seed)
+
+    ugame.display.reset()
+    stage.configure(uncapped=True, frame_limit=frames)
+
+    # tracemalloc stands in for gc.mem_alloc() when counting heap bytes
+    tracemalloc.start()
+    start = time.perf_counter()
+    try:
+        importlib.import_module("Tomogotchi.code")
+    except stage.FrameLimitReached:
+        pass
+    finally:
+        stage.configure(frame_limit=None)
+        tracemalloc.stop()
+    elapsed = time.perf_counter() - start
+
+    return {"frames": ugame.display.frame, "seconds": elapsed}
+
+
+def parse_press(text: str) -> list:
+    """
+    Turn FRAME:KEY[+KEY]:DURATION into (frame, mask) pairs.
+
+    Returns:
+        list: The press and release pairs.
+    """
+    import ugame
+
+    frame, keys, duration = text.split(":")
+    mask = 0
+    for key in keys.split("+"):
+        mask |= ugame.KEYS[key.upper()]
+    return [(int(frame), mask), (int(frame) + int(duration), 0)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the game scene headless.")
+    parser.add_argument("--frames", type=int, default=600)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument(
+        "--press",
+        action="append",
+        default=[],
+        help="FRAME:KEY[+KEY]:DURATION, for example 120:LEFT:10",
+    )
+    parser.add_argument("--draw", action="store_true", help="draw real pixels")
+    parser.add_argument("--realtime", action="store_true", help="keep the game FPS")
+    parser.add_argument("--profile", action="store_true", help="run under cProfile")
+    parser.add_argument(
+        "--frame-profile", action="store_true", help="time each game loop phase"
+    )
+    parser.add_argument("--screenshot", help="save the last frame as a PPM image")
+    parser.add_argument(
+        "--boot", action="store_true", help="boot from code.py and profile the imports"
+    )
+    parser.add_argument("--record", help="record the buttons to a file")
+    parser.add_argument(
+        "--replay", help="replay the buttons from a file, for its whole length"
+    )
+    args = parser.parse_args()
+
+    # The work folder changes the current folder, so keep the paths absolute
+    record = os.path.abspath(args.record) if args.record else None
+    replay = os.path.abspath(args.replay) if args.replay else None
+    screenshot = os.path.abspath(args.screenshot) if args.screenshot else None
+
+    install()
+
+    if args.boot:
+        result = run_boot(args.frames, seed=args.seed)
+        print("booted and ran {frames} frames in {seconds:.3f} s".format(**result))
+        return
+
+    frames = args.frames
+    if replay:
+        from Tomogotchi.classes.input_recorder import Input_Player
+
+        # The first frame of the scene has no logic step due yet
+        frames = Input_Player(replay).frames + 1
+
+    script = []
+    for press in args.press:
+        script += parse_press(press)
+
+    def run():
+        return run_game_scene(
+            frames,
+            script=script,
+            seed=args.seed,
+            draw=args.draw or bool(screenshot),
+            uncapped=not args.realtime,
+            profile_frames=args.frame_profile,
+            record=record,
+            replay=replay,
+        )
+
+    if args.profile:
+        import cProfile
+        import pstats
+
+        profiler = cProfile.Profile()
+        result = profiler.runcall(run)
+        pstats.Stats(profiler).sort_stats("cumulative").print_stats(25)
+    else:
+        result = run()
+
+    if screenshot:
+        import ugame
+
+        ugame.display.save_ppm(screenshot)
+
+    print(
+        "{frames} frames in {seconds:.3f} s ({fps:.0f} fps), "
+        "{blocks} blocks, {pixels_pushed} pixels pushed".format(**result)
+    )
+    if args.draw or screenshot:
+        print("screen checksum {:08x}".format(result["checksum"]))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,490 @@
+# !/usr/bin/env python3
+
+"""
+Created by: Mohamad Tanbari
+Created on: October 2026
+A headless stand-in for the PyBadge stage library so the game can run on Linux.
+"""
+
+import struct
+import supervisor
+import time
+
+# The colour stage treats as see-through (magenta in RGB565)
+TRANSPARENT = 0xF81F
+
+# Palette used by text when none is given (transparent background, white text)
+PALETTE = (
+    b"\xf8\x1f\x00\x00\xcey\xff\xff\xf8\x1f\x00\x19\xfc\xe0\xfd\xe0"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+)
+
+
+class FrameLimitReached(Exception):
+    """
+    Raised by Stage.tick() once the simulator has stepped the requested frames.
+    """
+
+
+# Simulator settings, changed with configure()
+_uncapped = False
+_frame_limit = None
+_draw = True
+
+
+def configure(uncapped: bool = None, frame_limit: int = -1, draw: bool = None):
+    """
+    Change how the simulator runs.
+
+    Args:
+        uncapped (bool): Skip the frame rate sleep in tick() and run as fast as
+            possible. Time from supervisor.ticks_ms() then moves one frame per tick.
+        frame_limit (int): Raise FrameLimitReached after this many ticks (None for no
+            limit).
+        draw (bool): Composite real pixels, or only count the pixels that would be sent.
+    """
+
+    global _uncapped, _frame_limit, _draw
+
+    if uncapped is not None:
+        _uncapped = uncapped
+        supervisor.use_virtual_time(uncapped)
+    if frame_limit != -1:
+        _frame_limit = frame_limit
+    if draw is not None:
+        _draw = draw
+
+
+def color565(r: int, g: int, b: int) -> int:
+    """
+    Convert an RGB colour to RGB565.
+
+    Returns:
+        int: The colour in RGB565.
+    """
+    return (r & 0xF8) << 8 | (g & 0xFC) << 3 | b >> 3
+
+
+class Bank:
+    """
+    A bank of sixteen 16x16 tiles with a 16 colour palette.
+    """
+
+    def __init__(self, buffer: bytearray = None, palette: bytes = None):
+        """
+        The constructor for the bank class.
+
+        Args:
+            buffer (bytearray): 2048 bytes of 4bpp pixels, two pixels per byte.
+            palette (bytes): 16 big-endian RGB565 colours.
+        """
+        self.buffer = buffer or bytearray(2048)
+        self.palette = palette or PALETTE
+
+    @classmethod
+    def from_bmp16(cls, filename: str):
+        """
+        Load a bank from a 16 colour BMP file that is 16 pixels wide.
+
+        Args:
+            filename (str): The path to the BMP file.
+
+        Returns:
+            Bank: The loaded bank.
+        """
+
+        with open(filename, "rb") as file:
+            data = file.read()
+
+        if data[:2] != b"BM":
+            raise ValueError("Not a BMP file")
+
+        (data_offset,) = struct.unpack_from("<L", data, 10)
+        (
+            header_size,
+            width,
+            height,
+            planes,
+            bits_per_pixel,
+            compression,
+        ) = struct.unpack_from("<LllHHL", data, 14)
+        (palette_size,) = struct.unpack_from("<L", data, 46)
+
+        if bits_per_pixel != 4 or compression != 0:
+            raise ValueError("Only uncompressed 16 colour BMP files are supported")
+        if palette_size == 0:
+            palette_size = 16
+
+        # Convert the BGRA palette to big-endian RGB565
+        palette = bytearray(32)
+        palette_start = 14 + header_size
+        for color in range(palette_size):
+            b, g, r, _ = struct.unpack_from("<BBBB", data, palette_start + color * 4)
+            struct.pack_into(">H", palette, color * 2, color565(r, g, b))
+
+        # BMP rows are stored bottom-up and padded to four bytes
+        line_size = width >> 1
+        stride = (line_size + 3) & ~3
+        rows = abs(height)
+        buffer = bytearray(2048)
+        for line in range(min(rows, 256)):
+            if height > 0:
+                source = data_offset + (rows - line - 1) * stride
+            else:
+                source = data_offset + line * stride
+            buffer[line * line_size : (line + 1) * line_size] = data[
+                source : source + line_size
+            ]
+
+        return cls(buffer, bytes(palette))
+
+    # Method to read one pixel of a tile
+    def pixel(self, tile: int, x: int, y: int) -> int:
+        """
+        Get the colour of one pixel of a tile.
+
+        Returns:
+            int: The RGB565 colour of the pixel.
+        """
+        value = self.buffer[(tile & 0x0F) * 128 + y * 8 + (x >> 1)]
+        index = value & 0x0F if x & 1 else value >> 4
+        return self.palette[index * 2] << 8 | self.palette[index * 2 + 1]
+
+
+class Sprite:
+    """
+    A single 16x16 tile that can be moved anywhere.
+    """
+
+    def __init__(
+        self, bank: Bank, frame: int, x: int, y: int, z: int = 0, rotation: int = 0
+    ):
+        """
+        The constructor for the sprite class.
+
+        Args:
+            bank (Bank): The bank to take the tile from.
+            frame (int): The tile to show.
+            x (int): The x position of the sprite.
+            y (int): The y position of the sprite.
+            rotation (int): 0 - 3 rotate by 90 degrees, add 4 to mirror.
+        """
+        self.bank = bank
+        self.palette = bank.palette
+        self.frame = frame
+        self.rotation = rotation
+        self.x = x
+        self.y = y
+        self.z = z
+        self.px = x
+        self.py = y
+
+    def move(self, x: int, y: int, z: int = None):
+        """
+        Move the sprite.
+        """
+        self.x = x
+        self.y = y
+        if z is not None:
+            self.z = z
+
+    def set_frame(self, frame: int = None, rotation: int = None):
+        """
+        Change the tile and rotation of the sprite.
+        """
+        if frame is not None:
+            self.frame = frame
+        if rotation is not None:
+            self.rotation = rotation
+
+    def update(self):
+        """
+        Kept for compatibility with stage, the simulator has nothing to update.
+        """
+
+    def _pixel(self, x: int, y: int) -> int:
+        x -= int(self.x)
+        y -= int(self.y)
+        if not (0 <= x < 16 and 0 <= y < 16):
+            return TRANSPARENT
+        rotation = self.rotation & 0x07
+        if rotation & 0x04:
+            x = 15 - x
+        for _ in range(rotation & 0x03):
+            x, y = y, 15 - x
+        return self.bank.pixel(self.frame, x, y)
+
+
+class Grid:
+    """
+    A grid of tiles, usually used for the background.
+    """
+
+    def __init__(
+        self,
+        bank: Bank,
+        width: int = 8,
+        height: int = 8,
+        palette: bytes = None,
+        buffer: bytearray = None,
+    ):
+        """
+        The constructor for the grid class.
+
+        Args:
+            bank (Bank): The bank to take the tiles from.
+            width (int): The width of the grid in tiles.
+            height (int): The height of the grid in tiles.
+            buffer (bytearray): Packed 4 bit tile indices, two per byte.
+        """
+        self.x = 0
+        self.y = 0
+        self.z = 0
+        self.stride = (width + 1) & 0xFE
+        self.width = width
+        self.height = height
+        self.bank = bank
+        self.palette = palette or bank.palette
+        self.buffer = buffer or bytearray((self.stride * height) >> 1)
+
+    def tile(self, x: int, y: int, tile: int = None):
+        """
+        Get or set the tile at a position in the grid.
+        """
+        if not 0 <= x < self.width or not 0 <= y < self.height:
+            return 0
+        index = (y * self.stride + x) >> 1
+        b = self.buffer[index]
+        if tile is None:
+            return b & 0x0F if x & 0x01 else b >> 4
+        if x & 0x01:
+            b = b & 0xF0 | tile
+        else:
+            b = b & 0x0F | (tile << 4)
+        self.buffer[index] = b
+
+    def move(self, x: int, y: int, z: int = None):
+        """
+        Move the grid.
+        """
+        self.x = x
+        self.y = y
+        if z is not None:
+            self.z = z
+
+    def _pixel(self, x: int, y: int) -> int:
+        x -= int(self.x)
+        y -= int(self.y)
+        if x < 0 or y < 0:
+            return TRANSPARENT
+        column = x >> 4
+        row = y >> 4
+        if column >= self.width or row >= self.height:
+            return TRANSPARENT
+        return self.bank.pixel(self.tile(column, row), x & 0x0F, y & 0x0F)
+
+
+class Text:
+    """
+    A layer of 8x8 characters.
+    """
+
+    def __init__(
+        self,
+        width: int,
+        height: int,
+        font: bytes = None,
+        palette: bytes = None,
+        buffer: bytearray = None,
+    ):
+        """
+        The constructor for the text class.
+
+        Args:
+            width (int): The width of the text in characters.
+            height (int): The height of the text in characters.
+        """
+        self.width = width
+        self.height = height
+        self.font = font
+        self.palette = palette or PALETTE
+        self.buffer = buffer or bytearray(width * height)
+        self.column = 0
+        self.row = 0
+        self.x = 0
+        self.y = 0
+        self.z = 0
+
+    def char(self, x: int, y: int, c: str = None, hightlight: bool = False):
+        """
+        Get or set the character at a position.
+        """
+        if not 0 <= x < self.width or not 0 <= y < self.height:
+            return None
+        if c is None:
+            return chr(self.buffer[y * self.width + x])
+        c = ord(c)
+        if hightlight:
+            c |= 0x80
+        self.buffer[y * self.width + x] = c
+
+    def move(self, x: int, y: int, z: int = None):
+        """
+        Move the text.
+        """
+        self.x = x
+        self.y = y
+        if z is not None:
+            self.z = z
+
+    def cursor(self, x: int = None, y: int = None):
+        """
+        Move the text cursor.
+        """
+        if y is not None:
+            self.row = y
+        if x is not None:
+            self.column = x
+
+    def text(self, text: str, hightlight: bool = False):
+        """
+        Write text at the cursor.
+        """
+        for c in text:
+            if c == "\n":
+                self.column = 0
+                self.row += 1
+                continue
+            if self.column >= self.width:
+                self.column = 0
+                self.row += 1
+            self.char(self.column, self.row, c, hightlight)
+            self.column += 1
+
+    def clear(self):
+        """
+        Clear all the characters.
+        """
+        for i in range(self.width * self.height):
+            self.buffer[i] = 0
+
+    def _pixel(self, x: int, y: int) -> int:
+        x -= int(self.x)
+        y -= int(self.y)
+        if x < 0 or y < 0:
+            return TRANSPARENT
+        column = x >> 3
+        row = y >> 3
+        if column >= self.width or row >= self.height:
+            return TRANSPARENT
+        c = self.buffer[row * self.width + column] & 0x7F
+        if c <= 0x20:
+            return TRANSPARENT
+
+        # The real font is not shipped, so draw a block glyph for every character
+        x &= 0x07
+        y &= 0x07
+        if x == 7 or y == 7 or not (c >> (x % 7)) & 1:
+            return TRANSPARENT
+        return self.palette[6] << 8 | self.palette[7]
+
+
+class Stage:
+    """
+    Draws layers to the display and keeps the frame rate.
+    """
+
+    def __init__(self, display, fps: int = 6, scale: int = None):
+        """
+        The constructor for the stage class.
+
+        Args:
+            display: The display to draw on.
+            fps (int): The frame rate tick() keeps.
+        """
+        if scale is None:
+            scale = 1
+        self.layers = []
+        self.display = display
+        self.scale = scale
+        self.width = display.width // scale
+        self.height = display.height // scale
+        self.last_tick = time.monotonic()
+        self.tick_delay = 1 / fps
+        self.vx = 0
+        self.vy = 0
+
+    def tick(self):
+        """
+        Wait until the next frame is due.
+        """
+
+        self.display.frame += 1
+        if _frame_limit is not None and self.display.frame >= _frame_limit:
+            raise FrameLimitReached(self.display.frame)
+
+        if _uncapped:
+            supervisor.advance(self.tick_delay)
+            return
+
+        self.last_tick += self.tick_delay
+        wait = max(0, self.last_tick - time.monotonic())
+        if wait:
+            time.sleep(wait)
+        else:
+            self.last_tick = time.monotonic()
+
+    def render_block(self, x0: int = 0, y0: int = 0, x1: int = None, y1: int = None):
+        """
+        Redraw a rectangle of the screen.
+        """
+
+        if x1 is None:
+            x1 = self.width
+        if y1 is None:
+            y1 = self.height
+        x0 = max(0, x0)
+        y0 = max(0, y0)
+        x1 = min(self.width, x1)
+        y1 = min(self.height, y1)
+        if x0 >= x1 or y0 >= y1:
+            return
+
+        self.display.block(x0, y0, x1, y1)
+        if _draw:
+            self._draw(x0, y0, x1, y1)
+
+    def render_sprites(self, sprites: list):
+        """
+        Redraw the old and new area of each sprite.
+        """
+
+        for sprite in sprites:
+            x = int(sprite.x) - self.vx
+            y = int(sprite.y) - self.vy
+            x0 = max(0, min(self.width - 1, min(sprite.px, x)))
+            y0 = max(0, min(self.height - 1, min(sprite.py, y)))
+            x1 = max(1, min(self.width, max(sprite.px, x) + 16))
+            y1 = max(1, min(self.height, max(sprite.py, y) + 16))
+            sprite.px = x
+            sprite.py = y
+            if x0 == x1 or y0 == y1:
+                continue
+
+            self.display.block(x0, y0, x1, y1)
+            if _draw:
+                self._draw(x0, y0, x1, y1)
+
+    def _draw(self, x0: int, y0: int, x1: int, y1: int):
+        layers = self.layers
+        pixels = self.display.pixels
+        width = self.display.width
+        for y in range(y0, y1):
+            for x in range(x0, x1):
+                color = 0
+                for layer in layers:
+                    value = layer._pixel(x + self.vx, y + self.vy)
+                    if value != TRANSPARENT:
+                        color = value
+                        break
+                pixels[y * width + x] = color
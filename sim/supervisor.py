@@ -0,0 +1,67 @@
+# !/usr/bin/env python3
+
+"""
+Created by: Mohamad Tanbari
+Created on: October 2026
+A headless stand-in for the CircuitPython supervisor module.
+"""
+
+import sys
+import time
+
+_start = time.monotonic()
+
+# ticks_ms() wraps around at 2**29, the same as on the PyBadge
+_TICKS_MASK = (1 << 29) - 1
+
+# Seconds of simulated time, used instead of the real clock when set
+_virtual = None
+
+
+def ticks_ms() -> int:
+    """
+    Get the milliseconds since the simulator started.
+
+    Returns:
+        int: The milliseconds since start.
+    """
+    if _virtual is not None:
+        return int(_virtual * 1000) & _TICKS_MASK
+    return int((time.monotonic() - _start) * 1000) & _TICKS_MASK
+
+
+def use_virtual_time(enabled: bool):
+    """
+    Switch ticks_ms() between the real clock and simulated time.
+
+    Args:
+        enabled (bool): Use simulated time, which only moves with advance().
+    """
+
+    global _virtual
+
+    if not enabled:
+        _virtual = None
+    elif _virtual is None:
+        _virtual = time.monotonic() - _start
+
+
+def advance(seconds: float):
+    """
+    Move simulated time forward.
+
+    Args:
+        seconds (float): The seconds to move forward.
+    """
+
+    global _virtual
+
+    if _virtual is not None:
+        _virtual += seconds
+
+
+def reload():
+    """
+    The simulator has nothing to reload, so it just exits.
+    """
+    sys.exit(0)
@@ -0,0 +1,157 @@
+# !/usr/bin/env python3
+
+"""
+Created by: Mohamad Tanbari
+Created on: October 2026
+A headless stand-in for the PyBadge ugame module with a fake display and scripted
+buttons.
+"""
+
+import array
+import zlib
+
+# Key bits, the same as the PyBadge
+K_X = 0x01
+K_O = 0x02
+K_START = 0x04
+K_SELECT = 0x08
+K_DOWN = 0x10
+K_LEFT = 0x20
+K_RIGHT = 0x40
+K_UP = 0x80
+
+# Names used by scripts and the command line
+KEYS = {
+    "X": K_X,
+    "O": K_O,
+    "START": K_START,
+    "SELECT": K_SELECT,
+    "DOWN": K_DOWN,
+    "LEFT": K_LEFT,
+    "RIGHT": K_RIGHT,
+    "UP": K_UP,
+}
+
+
+class Display:
+    """
+    A 160x128 frame buffer that counts everything sent to it.
+    """
+
+    def __init__(self, width: int = 160, height: int = 128):
+        """
+        The constructor for the display class.
+
+        Args:
+            width (int): The width of the display in pixels.
+            height (int): The height of the display in pixels.
+        """
+        self.width = width
+        self.height = height
+        self.pixels = array.array("H", bytes(width * height * 2))
+        self.frame = 0
+        self.blocks = 0
+        self.pixels_pushed = 0
+
+    # Method to count a block sent to the display
+    def block(self, x0: int, y0: int, x1: int, y1: int):
+        """
+        Record a rectangle being sent to the display.
+        """
+        self.blocks += 1
+        self.pixels_pushed += (x1 - x0) * (y1 - y0)
+
+    # Method to reset the counters
+    def reset(self):
+        """
+        Reset the frame and transfer counters.
+        """
+        self.frame = 0
+        self.blocks = 0
+        self.pixels_pushed = 0
+
+    # Method to fingerprint the screen
+    def checksum(self) -> int:
+        """
+        Get a CRC32 of the frame buffer, for comparing runs.
+
+        Returns:
+            int: The checksum.
+        """
+        return zlib.crc32(self.pixels)
+
+    # Method to save the screen
+    def save_ppm(self, path: str):
+        """
+        Save the frame buffer as a PPM image.
+
+        Args:
+            path (str): The path of the image.
+        """
+        with open(path, "wb") as file:
+            file.write(b"P6 %d %d 255\n" % (self.width, self.height))
+            row = bytearray()
+            for color in self.pixels:
+                row += bytes(
+                    ((color >> 8) & 0xF8, (color >> 3) & 0xFC, (color << 3) & 0xF8)
+                )
+            file.write(row)
+
+
+class Buttons:
+    """
+    Buttons that replay a script of key masks instead of reading hardware.
+    """
+
+    def __init__(self, display: Display):
+        """
+        The constructor for the buttons class.
+
+        Args:
+            display (Display): The display whose frame counter drives the script.
+        """
+        self._display = display
+        self._mask = 0
+        self._script = []
+        self._next = 0
+
+    # Method to hold keys down until changed
+    def set(self, mask: int):
+        """
+        Hold down exactly the keys in the mask.
+
+        Args:
+            mask (int): The keys to hold.
+        """
+        self._mask = mask
+
+    # Method to load an input script
+    def script(self, events: list):
+        """
+        Load a script of (frame, mask) pairs, each mask is held from its frame on.
+
+        Args:
+            events (list): The (frame, mask) pairs, sorted by frame.
+        """
+        self._script = sorted(events)
+        self._next = 0
+        self._mask = 0
+
+    def get_pressed(self) -> int:
+        """
+        Get the keys held down on the current frame.
+
+        Returns:
+            int: The key mask.
+        """
+        frame = self._display.frame
+        script = self._script
+        while self._next < len(script) and script[self._next][0] <= frame:
+            self._mask = script[self._next][1]
+            self._next += 1
+        return self._mask
+
+
+display = Display()
+buttons = Buttons(display)
+audio = None
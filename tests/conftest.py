@@ -0,0 +1,16 @@
+# !/usr/bin/env python3
+
+"""
+Created by: Mohamad Tanbari
+Created on: October 2026
+Make the Tomogotchi package importable on the desktop for the tests.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(__file__)), "sim"))
+
+import harness
+
+harness.install()
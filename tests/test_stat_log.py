@@ -0,0 +1,144 @@
+# !/usr/bin/env python3
+
+"""
+Created by: Mohamad Tanbari
+Created on: October 2026
+Tests for the two segment stat log.
+"""
+
+import struct
+
+from Tomogotchi.classes.stat_log import (
+    EVENT_CHANGE,
+    EVENT_DECAY,
+    HEADER_FORMAT,
+    MAGIC,
+    RECORD_SIZE,
+    VERSION,
+    Stat_Log,
+)
+
+# Compact after four records, so a few records already wrap the segments
+COMPACT_SIZE = 4 * RECORD_SIZE
+
+
+def make_log(tmp_path) -> Stat_Log:
+    """
+    Make a stat log with both segments in a temporary folder.
+
+    Returns:
+        Stat_Log: The log.
+    """
+    return Stat_Log(
+        (str(tmp_path / "log_a.bin"), str(tmp_path / "log_b.bin")), COMPACT_SIZE
+    )
+
+
+def write_records(log: Stat_Log, times, sequence: int = 0) -> int:
+    """
+    Write one record per time, starting a segment whenever the stat store would.
+
+    Returns:
+        int: The sequence number of the last save slot.
+    """
+    for when in times:
+        log.append(when, EVENT_CHANGE, when % 100, 50)
+        if log.needs_snapshot:
+            sequence += 1
+            log.start_segment(sequence)
+        log.write()
+    return sequence
+
+
+def write_header(path, sequence: int):
+    """
+    Write an empty segment that follows a save slot.
+    """
+    path.write_bytes(struct.pack(HEADER_FORMAT, MAGIC, VERSION, sequence))
+
+
+def test_history_across_segment_boundary(tmp_path):
+    log = make_log(tmp_path)
+    sequence = write_records(log, range(1, 11))
+
+    # Records 1 to 4 were in the segment that started over for 9 and 10
+    assert sequence == 3
+    assert [record[0] for record in log.history(0)] == list(range(5, 11))
+    assert [record[0] for record in log.history(7)] == [7, 8, 9, 10]
+
+    # A fresh log finds the same records from the files
+    reopened = make_log(tmp_path)
+    assert reopened.open(sequence) == (10, 50, None)
+    assert [record[0] for record in reopened.history(7)] == [7, 8, 9, 10]
+
+
+def test_history_includes_pending_records(tmp_path):
+    log = make_log(tmp_path)
+    write_records(log, range(1, 4))
+    log.append(4, EVENT_CHANGE, 4, 50)
+    assert log.history(3) == [(3, EVENT_CHANGE, 3, 50), (4, EVENT_CHANGE, 4, 50)]
+
+
+def test_torn_record_is_left_behind(tmp_path):
+    log = make_log(tmp_path)
+    sequence = write_records(log, range(1, 4))
+    path = tmp_path / "log_a.bin"
+    path.write_bytes(path.read_bytes() + b"\x63\x00\x00")
+
+    reopened = make_log(tmp_path)
+    assert reopened.open(sequence) == (3, 50, None)
+    assert reopened.needs_snapshot
+    assert [record[0] for record in reopened.history(0)] == [1, 2, 3]
+
+
+def test_bad_check_byte_ends_the_segment(tmp_path):
+    log = make_log(tmp_path)
+    sequence = write_records(log, range(1, 4))
+    path = tmp_path / "log_a.bin"
+    data = bytearray(path.read_bytes())
+    data[-RECORD_SIZE - 1] ^= 0xFF
+    path.write_bytes(data)
+
+    reopened = make_log(tmp_path)
+    assert reopened.open(sequence) == (1, 50, None)
+    assert reopened.needs_snapshot
+    assert [record[0] for record in reopened.history(0)] == [1]
+
+
+def test_open_keeps_last_decay_time(tmp_path):
+    log = make_log(tmp_path)
+    log.start_segment(1)
+    log.append(100, EVENT_DECAY, 40, 40)
+    log.append(150, EVENT_CHANGE, 45, 40)
+    log.write()
+
+    assert make_log(tmp_path).open(1) == (45, 40, 100)
+    assert make_log(tmp_path).open(2) is None
+
+
+def test_start_segment_replaces_older_segment(tmp_path):
+    write_header(tmp_path / "log_a.bin", 6)
+    write_header(tmp_path / "log_b.bin", 5)
+    log = make_log(tmp_path)
+    log.start_segment(7)
+    assert log.history(0) == []
+    assert log._read_header(str(tmp_path / "log_a.bin")) == 6
+    assert log._read_header(str(tmp_path / "log_b.bin")) == 7
+
+
+def test_start_segment_replaces_older_segment_across_wraparound(tmp_path):
+    write_header(tmp_path / "log_a.bin", 0)
+    write_header(tmp_path / "log_b.bin", 0xFFFFFFFF)
+    log = make_log(tmp_path)
+    log.start_segment(1)
+    assert log._read_header(str(tmp_path / "log_a.bin")) == 0
+    assert log._read_header(str(tmp_path / "log_b.bin")) == 1
+
+
+def test_start_segment_replaces_bad_segment(tmp_path):
+    write_header(tmp_path / "log_a.bin", 5)
+    (tmp_path / "log_b.bin").write_bytes(b"junk")
+    log = make_log(tmp_path)
+    log.start_segment(7)
+    assert log._read_header(str(tmp_path / "log_a.bin")) == 5
+    assert log._read_header(str(tmp_path / "log_b.bin")) == 7
@@ -0,0 +1,123 @@
+# !/usr/bin/env python3
+
+"""
+Created by: Mohamad Tanbari
+Created on: October 2026
+Tests for the save slots of the stat store.
+"""
+
+import json
+
+from Tomogotchi.classes.stat_store import RECORD_SIZE, Stat_Store
+
+
+def make_store(tmp_path, **kwargs) -> Stat_Store:
+    """
+    Make a stat store with every file in a temporary folder.
+
+    Returns:
+        Stat_Store: The store.
+    """
+    return Stat_Store(
+        slot_paths=(str(tmp_path / "save_a.bin"), str(tmp_path / "save_b.bin")),
+        log_paths=(str(tmp_path / "log_a.bin"), str(tmp_path / "log_b.bin")),
+        legacy_path=str(tmp_path / "data.json"),
+        **kwargs
+    )
+
+
+def save_twice(tmp_path):
+    """
+    Save 40/60 to one slot and then 45/65 to the other.
+    """
+    store = make_store(tmp_path, compact_size=0)
+    store.hunger = 40
+    store.joy = 60
+    store.flush()
+    store.hunger = 45
+    store.joy = 65
+    store.flush()
+
+
+def test_no_save_uses_defaults(tmp_path):
+    store = make_store(tmp_path)
+    assert store.hunger == Stat_Store.DEFAULT_HUNGER
+    assert store.joy == Stat_Store.DEFAULT_JOY
+    assert store.last_checked is None
+
+
+def test_newest_slot_wins(tmp_path):
+    save_twice(tmp_path)
+    store = make_store(tmp_path)
+    assert (store.hunger, store.joy) == (45, 65)
+
+
+def test_bad_crc_falls_back_to_other_slot(tmp_path):
+    save_twice(tmp_path)
+    path = tmp_path / "save_b.bin"
+    record = bytearray(path.read_bytes())
+    record[5] ^= 0xFF
+    path.write_bytes(record)
+
+    store = make_store(tmp_path)
+    assert (store.hunger, store.joy) == (40, 60)
+
+
+def test_torn_slot_falls_back_to_other_slot(tmp_path):
+    save_twice(tmp_path)
+    path = tmp_path / "save_b.bin"
+    path.write_bytes(path.read_bytes()[: RECORD_SIZE // 2])
+
+    store = make_store(tmp_path, compact_size=0)
+    assert (store.hunger, store.joy) == (40, 60)
+
+    # The next save goes over the torn slot, not the good one
+    store.hunger = 30
+    store.flush()
+    assert len(path.read_bytes()) == RECORD_SIZE
+    loaded = make_store(tmp_path)
+    assert (loaded.hunger, loaded.joy) == (30, 60)
+
+
+def test_sequence_wraps_around(tmp_path):
+    store = make_store(tmp_path, compact_size=0)
+    store._sequence = 0xFFFFFFFE
+    for hunger in (10, 11, 12):
+        store.hunger = hunger
+        store.flush()
+
+    loaded = make_store(tmp_path)
+    assert loaded._sequence == 1
+    assert loaded.hunger == 12
+
+
+def test_log_brings_slot_up_to_date(tmp_path):
+    store = make_store(tmp_path)
+    store.hunger = 20
+    store.flush()
+    store.joy = 90
+    store.flush()
+
+    loaded = make_store(tmp_path)
+    assert (loaded.hunger, loaded.joy) == (20, 90)
+
+
+def test_migrates_json_save(tmp_path):
+    (tmp_path / "data.json").write_text(
+        json.dumps({"hunger": 12, "joy": 34, "last_checked": 1000})
+    )
+    store = make_store(tmp_path)
+    assert (store.hunger, store.joy, store.last_checked) == (12, 34, 1000)
+
+    store.flush()
+    (tmp_path / "data.json").unlink()
+    loaded = make_store(tmp_path)
+    assert (loaded.hunger, loaded.joy, loaded.last_checked) == (12, 34, 1000)
+
+
+def test_read_only_never_writes(tmp_path):
+    store = make_store(tmp_path, read_only=True)
+    store.hunger = 1
+    store.flush()
+    assert not (tmp_path / "save_a.bin").exists()
+    assert not (tmp_path / "save_b.bin").exists()
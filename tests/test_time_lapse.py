@@ -0,0 +1,110 @@
+# !/usr/bin/env python3
+
+"""
+Created by: Mohamad Tanbari
+Created on: October 2026
+Tests that the time lapse agrees with stepping Cat.update frame by frame.
+"""
+
+import copy
+import random
+
+import pytest
+
+from Tomogotchi import constants
+from Tomogotchi.classes import cat as cat_module
+from Tomogotchi.classes.cat import Cat
+from Tomogotchi.classes.time_lapse import Pet_State, Time_Lapse
+
+# What the frame loop and the time lapse should agree on
+FIELDS = ("x", "direction", "facing", "walk_distance", "frame_counter", "tracked_frame")
+
+
+class Never_Random:
+    """
+    A random number generator whose 1 in N rolls take thousands of frames to succeed.
+    """
+
+    def random(self) -> float:
+        """
+        Get the largest random number below 1.
+
+        Returns:
+            float: The number.
+        """
+        return 1 - 2**-53
+
+
+@pytest.fixture(scope="module")
+def cat() -> Cat:
+    """
+    A cat to step frame by frame.
+
+    Returns:
+        Cat: The cat.
+    """
+    return Cat(56, 16 * 3, 0)
+
+
+def step(cat: Cat, state: Pet_State, frames: int) -> Pet_State:
+    """
+    Put the cat in a state and call Cat.update once per frame.
+
+    Returns:
+        Pet_State: The state of the cat afterwards.
+    """
+    cat.restore(copy.copy(state))
+    for _ in range(frames):
+        cat.update()
+    return cat.snapshot()
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_walk_matches_frame_loop(cat, monkeypatch, seed):
+    rng = random.Random(seed)
+    state = cat.snapshot()
+    state.x = rng.randint(Cat.LEFT_BOUNDARY + 1, Cat.RIGHT_BOUNDARY - Cat.WIDTH - 1)
+    state.direction = rng.choice((-1, 1))
+    state.walk_distance = rng.randint(
+        constants.WALK_DISTANCE_MIN, constants.WALK_DISTANCE_MAX
+    )
+    state.frame_counter = rng.randint(0, 5)
+    frames = rng.randint(1, 150)
+
+    # Only the walk already started, no new walks or reactions
+    monkeypatch.setattr(cat_module.random, "randint", lambda low, high: high)
+    stepped = step(cat, state, frames)
+
+    lapsed = copy.copy(state)
+    Time_Lapse(rng=Never_Random()).advance_frames(lapsed, frames, decay=False)
+
+    for name in FIELDS:
+        assert getattr(lapsed, name) == getattr(stepped, name), name
+
+
+def test_random_events_match_frame_loop(cat):
+    frames = 600
+    trials = 200
+    random.seed(1)
+    start = cat.snapshot()
+
+    stepped = [step(cat, start, frames) for _ in range(trials)]
+
+    time_lapse = Time_Lapse(rng=random.Random(1))
+    lapsed = []
+    for _ in range(trials):
+        state = copy.copy(start)
+        time_lapse.advance_frames(state, frames, decay=False)
+        lapsed.append(state)
+
+    def mean(states, value):
+        return sum(value(state) for state in states) / trials
+
+    def close(value, tolerance):
+        assert abs(mean(stepped, value) - mean(lapsed, value)) <= tolerance
+
+    close(lambda state: state.x, 4)
+    close(lambda state: state.walk_distance > 0, 0.1)
+    close(lambda state: state.facing == "right", 0.1)
+    close(lambda state: state.emote_duration > 0, 0.1)
+